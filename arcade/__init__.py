@@ -19,11 +19,17 @@
 from arcade.arcade_types import *
 from arcade.draw_commands import *
 from arcade.buffered_draw_commands import *
+from arcade.shape_instances import *
 from arcade.geometry import *
+from arcade.sensor import *
 from arcade.physics_engines import *
 from arcade.sound import *
 from arcade.sprite import *
 from arcade.sprite_list import *
+from arcade.texture_atlas import *
+from arcade.asset_loader import *
+from arcade.screen_capture import *
+from arcade.collision_grid import *
 from arcade.version import *
 from arcade.window_commands import *
 from arcade.joysticks import *
@@ -8,6 +8,7 @@
 from arcade.window_commands import set_viewport
 from arcade.window_commands import get_viewport
 from arcade.window_commands import set_window
+from arcade.draw_commands import flush_draw_batch
 
 import pyglet
 import pyglet.gl as gl
@@ -24,6 +25,7 @@ class Window(pyglet.window.Window):
     >>> import arcade
     >>> window = arcade.Window(200, 100, resizable=True)
     >>> window.set_update_rate(1/20)
+    >>> window.set_fixed_update_rate(1/30)
     >>> window.set_mouse_visible(True)
     >>> window.on_mouse_motion(0, 0, 0, 0)
     >>> window.on_mouse_press(0, 0, 0, 0)
@@ -49,6 +51,13 @@ def __init__(self, width: float = 800, height: float = 600,
         super().__init__(width=width, height=height, caption=title,
                          resizable=resizable, config=config)
 
+        # Fixed timestep state, see set_fixed_update_rate
+        self.fixed_update_rate = None
+        self.max_update_steps = 5
+        self.interpolation_alpha = 1.0
+        self.interpolated_sprite_lists = []
+        self._update_time = 0.0
+
         self.set_update_rate(1 / 60)
         super().set_fullscreen(fullscreen)
         self.invalid = False
@@ -78,12 +87,66 @@ def on_update(self, delta_time: float):
     def set_update_rate(self, rate: float):
         """
         Set how often the screen should be updated.
-        For example, self.set_update_rate(1 / 20) will set the update rate to 60 fps
+        For example, self.set_update_rate(1 / 20) will set the update rate to 20 fps
+
+        ``update`` and ``on_update`` are called from the same timer, once
+        per frame, unless ``set_fixed_update_rate`` has been used.
+        """
+        pyglet.clock.unschedule(self._dispatch_updates)
+        pyglet.clock.schedule_interval(self._dispatch_updates, rate)
+
+    def set_fixed_update_rate(self, rate: float = None, max_steps: int = 5):
+        """
+        Call ``update`` and ``on_update`` with a fixed time step of ``rate``
+        seconds, however often the screen is drawn. Pass None to go back to
+        one update per frame.
+
+        Each frame runs as many steps as the time since the last frame
+        calls for, but no more than ``max_steps``. If the game falls
+        further behind than that, the extra time is dropped, so it slows
+        down instead of spending every frame catching up.
+
+        After the steps, ``interpolation_alpha`` holds how far, from 0 to 1,
+        the frame is between the last step and the next one. Sprite lists
+        in ``interpolated_sprite_lists`` have their positions saved before
+        every step, so ``on_draw`` can draw them with
+        ``sprite_list.draw(interpolation=self.interpolation_alpha)``.
+
+        For example, self.set_fixed_update_rate(1 / 30) with
+        self.set_update_rate(1 / 144) steps the game 30 times a second
+        and draws it 144 times a second.
         """
-        pyglet.clock.unschedule(self.update)
-        pyglet.clock.schedule_interval(self.update, rate)
-        pyglet.clock.unschedule(self.on_update)
-        pyglet.clock.schedule_interval(self.on_update, rate)
+        self.fixed_update_rate = rate
+        self.max_update_steps = max_steps
+        self.interpolation_alpha = 1.0
+        self._update_time = 0.0
+
+    def _dispatch_updates(self, delta_time: float):
+        """
+        Scheduled once per frame, runs the updates due for it.
+        """
+        rate = self.fixed_update_rate
+        if rate is None:
+            self.update(delta_time)
+            self.on_update(delta_time)
+            return
+
+        self._update_time += delta_time
+        steps = 0
+        while self._update_time >= rate:
+            if steps == self.max_update_steps:
+                # Too far behind, drop the whole steps we can't catch up on
+                self._update_time %= rate
+                break
+
+            for sprite_list in self.interpolated_sprite_lists:
+                sprite_list.save_previous_positions()
+            self.update(rate)
+            self.on_update(rate)
+            self._update_time -= rate
+            steps += 1
+
+        self.interpolation_alpha = self._update_time / rate
 
     def on_mouse_motion(self, x: float, y: float, dx: float, dy: float):
         """ Override this function to add mouse functionality. """
@@ -123,6 +186,11 @@ def on_draw(self):
         """ Override this function to add your custom drawing code. """
         pass
 
+    def flip(self):
+        """ Draw any batched drawing commands, then show what was drawn. """
+        flush_draw_batch()
+        super().flip()
+
     def on_resize(self, width, height):
         """ Override this function to add custom code to be called any time the window
         is resized. """
@@ -0,0 +1,216 @@
+"""
+Loading textures, sounds and maps in the background.
+
+Files are read and decoded on a pool of worker threads, and each load
+returns a ``concurrent.futures.Future``. The part of loading a texture
+that makes GL calls waits until ``AssetLoader.process_uploads`` is called
+on the main thread, which does as much of it as fits in a time budget.
+Call it once a frame, from ``on_update`` for instance, while a loading
+screen is shown or the next level streams in.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import time
+from typing import Callable
+from typing import List
+
+from arcade.arcade_types import PointList
+from arcade.draw_commands import Texture
+from arcade.draw_commands import _create_flipped_texture
+from arcade.draw_commands import _create_region_textures
+from arcade.draw_commands import _create_texture
+from arcade.draw_commands import _decode_texture
+from arcade.draw_commands import _decode_textures
+from arcade.draw_commands import _get_image_scale
+from arcade.draw_commands import _get_texture_cache_name
+from arcade.draw_commands import _get_texture_size
+from arcade.draw_commands import load_texture
+from arcade.read_tiled_map import read_tiled_map
+from arcade.sound import load_sound
+
+
+class AssetLoader:
+    """
+    Loads assets on worker threads, and returns futures of them.
+
+    ``progress`` tells how much of what was asked for since the loader
+    was last idle is done, from 0 to 1.
+
+    >>> loader = AssetLoader()
+    >>> future = loader.read_tiled_map("arcade/examples/dungeon.tmx")
+    >>> future.result().width
+    10
+    >>> loader.progress
+    1.0
+    >>> loader.shutdown()
+    """
+
+    def __init__(self, max_workers: int=None):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # (future, create, decoded) of loads waiting for the main thread
+        self._uploads = queue.Queue()
+        self._futures = []
+
+    def _submit(self, decode: Callable, *args, create: Callable=None) -> Future:
+        """
+        Run ``decode`` on a worker thread. If there is a ``create``, it is
+        called with what ``decode`` returns from ``process_uploads``, and
+        the future is of what it returns.
+        """
+        if create is None:
+            future = self._executor.submit(decode, *args)
+        else:
+            future = Future()
+            decoded = self._executor.submit(decode, *args)
+            decoded.add_done_callback(lambda decoded: self._decoded(decoded, future, create))
+        self._futures.append(future)
+        return future
+
+    def _decoded(self, decoded: Future, future: Future, create: Callable):
+        """
+        Hand a decoded asset over to the main thread. Called on the
+        worker thread.
+        """
+        if future.cancelled():
+            return
+        if decoded.cancelled():
+            future.cancel()
+        elif decoded.exception() is not None:
+            future.set_exception(decoded.exception())
+        else:
+            self._uploads.put((future, create, decoded.result()))
+
+    def _done(self, result) -> Future:
+        """
+        A future that already has its result.
+        """
+        future = Future()
+        future.set_result(result)
+        self._futures.append(future)
+        return future
+
+    def load_texture(self, file_name: str, x: float=0, y: float=0,
+                     width: float=0, height: float=0,
+                     mirrored: bool=False,
+                     flipped: bool=False,
+                     scale: float=1) -> Future:
+        """
+        Load a texture like ``load_texture``. It goes in the same cache.
+        """
+        image_scale = _get_image_scale(scale)
+        cache_name = _get_texture_cache_name(file_name, x, y, width, height, mirrored, flipped, scale,
+                                             image_scale)
+        result = load_texture.texture_cache.get(cache_name)
+        if result is not None:
+            return self._done(result)
+
+        if mirrored or flipped:
+            # Mirrored and flipped textures share the pixels of the texture as it is
+            texture_future = self.load_texture(file_name, x, y, width, height, scale=scale)
+            future = Future()
+            self._futures.append(future)
+
+            def flip(texture_future: Future):
+                if texture_future.cancelled():
+                    future.cancel()
+                elif texture_future.exception() is not None:
+                    future.set_exception(texture_future.exception())
+                elif cache_name in load_texture.texture_cache:
+                    # The same texture may have been loaded in the meantime
+                    future.set_result(load_texture.texture_cache[cache_name])
+                else:
+                    future.set_result(_create_flipped_texture(texture_future.result(), cache_name,
+                                                              mirrored, flipped))
+
+            texture_future.add_done_callback(flip)
+            return future
+
+        def decode():
+            image = _decode_texture(file_name, x, y, width, height, image_scale=image_scale)
+            return image, _get_texture_size(file_name, width, height, image, image_scale)
+
+        def create(decoded) -> Texture:
+            # The same texture may have been loaded while this one was read
+            if cache_name in load_texture.texture_cache:
+                return load_texture.texture_cache[cache_name]
+            image, (texture_width, texture_height) = decoded
+            result = _create_texture(image, file_name, texture_width * scale, texture_height * scale)
+            load_texture.texture_cache[cache_name] = result
+            return result
+
+        return self._submit(decode, create=create)
+
+    def load_textures(self, file_name: str,
+                      image_location_list: PointList,
+                      mirrored: bool=False,
+                      flipped: bool=False) -> Future:
+        """
+        Load a set of textures off of a single image file, like
+        ``load_textures``.
+        """
+        def create(sheet_image) -> List[Texture]:
+            return _create_region_textures(sheet_image, file_name, image_location_list,
+                                           mirrored, flipped)
+
+        return self._submit(_decode_textures, file_name, image_location_list, create=create)
+
+    def load_sound(self, file_name: str) -> Future:
+        """
+        Load a sound like ``load_sound``.
+        """
+        return self._submit(load_sound, file_name)
+
+    def read_tiled_map(self, filename: str) -> Future:
+        """
+        Read a Tiled map like ``read_tiled_map``.
+        """
+        return self._submit(read_tiled_map, filename)
+
+    def process_uploads(self, time_budget: float=0.004) -> int:
+        """
+        Finish loading what the worker threads decoded, on the main thread,
+        until ``time_budget`` seconds have gone by. At least one asset is
+        finished if any is waiting. Returns how many were finished.
+        """
+        start_time = time.perf_counter()
+        count = 0
+        while True:
+            try:
+                future, create, decoded = self._uploads.get_nowait()
+            except queue.Empty:
+                break
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(create(decoded))
+                except Exception as e:
+                    future.set_exception(e)
+            count += 1
+
+            if time.perf_counter() - start_time >= time_budget:
+                break
+        return count
+
+    @property
+    def progress(self) -> float:
+        """
+        The fraction of the assets asked for that are loaded, from 0 to 1.
+        Counting starts over once everything is loaded.
+        """
+        if not self._futures:
+            return 1.0
+        done = sum(future.done() for future in self._futures)
+        if done == len(self._futures):
+            self._futures = []
+            return 1.0
+        return done / len(self._futures)
+
+    def shutdown(self, wait: bool=True):
+        """
+        Stop the worker threads. Loads that haven't started are cancelled.
+        """
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=wait)
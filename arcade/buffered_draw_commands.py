@@ -6,7 +6,6 @@
 the graphics card for much faster render times.
 """
 
-import math
 import itertools
 from collections import defaultdict
 import ctypes
@@ -20,11 +19,41 @@
 from arcade.arcade_types import Color
 from arcade.draw_commands import rotate_point
 from arcade.arcade_types import PointList
+from arcade.draw_commands import flush_draw_batch
 from arcade.draw_commands import get_four_byte_color
+from arcade.draw_commands import _get_color_array
+from arcade.draw_commands import _get_point_array
 from arcade.draw_commands import get_projection
+from arcade.draw_commands import _get_unit_circle
+from arcade.draw_commands import _transform_points
+from arcade.draw_commands import line_vertex_shader
+from arcade.draw_commands import line_fragment_shader
+from arcade.draw_commands import _line_vertex_type
 from arcade import shader
 
 
+shape_element_list_vertex_shader = '''
+    #version 330
+    uniform mat4 Projection;
+    uniform vec2 Position;
+    uniform float Angle;
+
+    in vec2 in_vert;
+    in vec4 in_color;
+
+    out vec4 v_color;
+    void main() {
+        float angle = radians(Angle);
+        mat2 rotate = mat2(
+            cos(angle), sin(angle),
+            -sin(angle), cos(angle)
+        );
+       gl_Position = Projection * vec4(Position + (rotate * in_vert), 0.0, 1.0);
+       v_color = in_color;
+    }
+'''
+
+
 class VertexBuffer:
     """
     This class represents a `vertex buffer object`_ for internal library use. Clients
@@ -60,9 +89,11 @@ def __init__(self):
         self.line_width = 1
 
     def draw(self):
-        # program['Projection'].write(get_projection().tobytes())
-
+        flush_draw_batch()
         with self.vao:
+            # The program is shared, so its uniforms may have been changed
+            # since this shape was last drawn
+            self.program['Projection'] = get_projection().flatten()
             gl.glLineWidth(self.line_width)
 
             gl.glEnable(gl.GL_BLEND)
@@ -95,25 +126,8 @@ def create_line(start_x: float, start_y: float, end_x: float, end_y: float,
     """
 
     program = shader.program(
-        vertex_shader='''
-            #version 330
-            uniform mat4 Projection;
-            in vec2 in_vert;
-            in vec4 in_color;
-            out vec4 v_color;
-            void main() {
-               gl_Position = Projection * vec4(in_vert, 0.0, 1.0);
-               v_color = in_color;
-            }
-        ''',
-        fragment_shader='''
-            #version 330
-            in vec4 v_color;
-            out vec4 f_color;
-            void main() {
-                f_color = v_color;
-            }
-        ''',
+        vertex_shader=line_vertex_shader,
+        fragment_shader=line_fragment_shader,
     )
 
     buffer_type = np.dtype([('vertex', '2f4'), ('color', '4B')])
@@ -132,8 +146,6 @@ def create_line(start_x: float, start_y: float, end_x: float, end_y: float,
     ]
 
     vao = shader.vertex_array(program, vao_content)
-    with vao:
-        program['Projection'] = get_projection().flatten()
 
     shape = Shape()
     shape.vao = vao
@@ -152,35 +164,25 @@ def create_line_generic_with_colors(point_list: PointList,
     """
     This function is used by ``create_line_strip`` and ``create_line_loop``,
     just changing the OpenGL type for the line drawing.
+
+    The points can be an (N, 2) float32 array and the colors an (N, 4)
+    uint8 array, which are copied into the vertex data without going
+    through Python lists.
     """
     program = shader.program(
-        vertex_shader='''
-            #version 330
-            uniform mat4 Projection;
-            in vec2 in_vert;
-            in vec4 in_color;
-            out vec4 v_color;
-            void main() {
-               gl_Position = Projection * vec4(in_vert, 0.0, 1.0);
-               v_color = in_color;
-            }
-        ''',
-        fragment_shader='''
-            #version 330
-            in vec4 v_color;
-            out vec4 f_color;
-            void main() {
-                f_color = v_color;
-            }
-        ''',
+        vertex_shader=line_vertex_shader,
+        fragment_shader=line_fragment_shader,
     )
 
-    buffer_type = np.dtype([('vertex', '2f4'), ('color', '4B')])
-    data = np.zeros(len(point_list), dtype=buffer_type)
-    data['vertex'] = point_list
-    data['color'] = [get_four_byte_color(color) for color in color_list]
+    points = _get_point_array(point_list)
+    data = np.zeros(len(points), dtype=_line_vertex_type)
+    data['vertex'] = points
+    if isinstance(color_list, np.ndarray):
+        data['color'] = _get_color_array(color_list, len(points))
+    else:
+        data['color'] = [get_four_byte_color(color) for color in color_list]
 
-    vbo = shader.buffer(data.tobytes())
+    vbo = shader.buffer(data)
     vao_content = [
         shader.BufferDescription(
             vbo,
@@ -191,8 +193,6 @@ def create_line_generic_with_colors(point_list: PointList,
     ]
 
     vao = shader.vertex_array(program, vao_content)
-    with vao:
-        program['Projection'] = get_projection().flatten()
 
     shape = Shape()
     shape.vao = vao
@@ -210,8 +210,11 @@ def create_line_generic(point_list: PointList,
     """
     This function is used by ``create_line_strip`` and ``create_line_loop``,
     just changing the OpenGL type for the line drawing.
+
+    ``color`` is one color, or an (N, 4) uint8 array with a color for
+    each point.
     """
-    colors = [get_four_byte_color(color)] * len(point_list)
+    colors = _get_color_array(color, len(point_list))
     shape = create_line_generic_with_colors(
         point_list,
         colors,
@@ -259,8 +262,12 @@ def create_line_loop(point_list: PointList,
     >>> arcade.finish_render()
     >>> arcade.quick_run(0.25)
     """
-    point_list = list(point_list) + [point_list[0]]
-    return create_line_generic(point_list, color, gl.GL_LINE_STRIP, line_width)
+    points = _get_point_array(point_list)
+    colors = _get_color_array(color, len(points))
+    if colors.ndim == 2:
+        colors = np.concatenate((colors, colors[:1]))
+    return create_line_generic(np.concatenate((points, points[:1])), colors,
+                               gl.GL_LINE_STRIP, line_width)
 
 
 def create_lines(point_list: PointList,
@@ -317,12 +324,16 @@ def create_polygon(point_list: PointList,
     # To fill the polygon, we start by one vertex, and we chain triangle strips
     # alternating with vertices to the left and vertices to the right of the
     # initial vertex.
-    half = len(point_list) // 2
-    interleaved = itertools.chain.from_iterable(
-        itertools.zip_longest(point_list[:half], reversed(point_list[half:]))
-    )
-    point_list = [p for p in interleaved if p is not None]
-    return create_line_generic(point_list, color, gl.GL_TRIANGLE_STRIP, border_width)
+    points = _get_point_array(point_list)
+    colors = _get_color_array(color, len(points))
+    half = len(points) // 2
+    order = np.empty(len(points), dtype=np.intp)
+    order[0:2 * half:2] = np.arange(half)
+    order[1::2] = np.arange(len(points) - 1, half - 1, -1)[:half]
+    order[2 * half:] = half
+    if colors.ndim == 2:
+        colors = colors[order]
+    return create_line_generic(points[order], colors, gl.GL_TRIANGLE_STRIP, border_width)
 
 
 def create_rectangle_filled(center_x: float, center_y: float, width: float,
@@ -556,28 +567,21 @@ def create_ellipse(center_x: float, center_y: float,
 
     """
     # Create an array with the vertex point_list
-    point_list = []
-
-    for segment in range(num_segments):
-        theta = 2.0 * 3.1415926 * segment / num_segments
-
-        x = width * math.cos(theta) + center_x
-        y = height * math.sin(theta) + center_y
-
-        if tilt_angle:
-            x, y = rotate_point(x, y, center_x, center_y, tilt_angle)
-
-        point_list.append((x, y))
+    point_list = _transform_points(_get_unit_circle(num_segments), width, height,
+                                   center_x, center_y, tilt_angle)
 
     if filled:
+        # Zigzag between the two halves of the ellipse
         half = len(point_list) // 2
-        interleaved = itertools.chain.from_iterable(
-            itertools.zip_longest(point_list[:half], reversed(point_list[half:]))
-        )
-        point_list = [p for p in interleaved if p is not None]
+        interleaved = np.empty_like(point_list)
+        interleaved[0:2 * half:2] = point_list[:half]
+        interleaved[1:2 * half:2] = point_list[::-1][:half]
+        if len(point_list) % 2:
+            interleaved[-1] = point_list[half]
+        point_list = interleaved
         shape_mode = gl.GL_TRIANGLE_STRIP
     else:
-        point_list.append(point_list[0])
+        point_list = np.concatenate((point_list, point_list[:1]))
         shape_mode = gl.GL_LINE_STRIP
 
     return create_line_generic(point_list, color, shape_mode, border_width)
@@ -600,22 +604,10 @@ def create_ellipse_filled_with_colors(center_x: float, center_y: float,
     >>> arcade.finish_render()
     >>> arcade.quick_run(0.25)
     """
-    # Create an array with the vertex data
     # Create an array with the vertex point_list
-    point_list = []
-
-    point_list.append((center_x, center_y))
-    for segment in range(num_segments):
-        theta = 2.0 * 3.1415926 * segment / num_segments
-
-        x = width * math.cos(theta) + center_x
-        y = height * math.sin(theta) + center_y
-
-        if tilt_angle:
-            x, y = rotate_point(x, y, center_x, center_y, tilt_angle)
-
-        point_list.append((x, y))
-    point_list.append(point_list[1])
+    unit_circle = _get_unit_circle(num_segments)
+    unit_points = np.concatenate((((0, 0),), unit_circle, unit_circle[:1]))
+    point_list = _transform_points(unit_points, width, height, center_x, center_y, tilt_angle)
 
     color_list = [inside_color] + [outside_color] * (num_segments + 1)
     return create_line_generic_with_colors(point_list, color_list, gl.GL_TRIANGLE_FAN)
@@ -629,6 +621,7 @@ def render(shape: VertexBuffer):
     if shape.color is None:
         raise ValueError("Error: Color parameter not set.")
 
+    flush_draw_batch()
     gl.glLoadIdentity()
     gl.glBindBuffer(gl.GL_ARRAY_BUFFER, shape.vbo_vertex_id)
     gl.glVertexPointer(2, gl.GL_FLOAT, 0, 0)
@@ -690,34 +683,8 @@ def __init__(self):
         self._center_y = 0
         self._angle = 0
         self.program = shader.program(
-            vertex_shader='''
-                #version 330
-                uniform mat4 Projection;
-                uniform vec2 Position;
-                uniform float Angle;
-
-                in vec2 in_vert;
-                in vec4 in_color;
-
-                out vec4 v_color;
-                void main() {
-                    float angle = radians(Angle);
-                    mat2 rotate = mat2(
-                        cos(angle), sin(angle),
-                        -sin(angle), cos(angle)
-                    );
-                   gl_Position = Projection * vec4(Position + (rotate * in_vert), 0.0, 1.0);
-                   v_color = in_color;
-                }
-            ''',
-            fragment_shader='''
-                #version 330
-                in vec4 v_color;
-                out vec4 f_color;
-                void main() {
-                    f_color = v_color;
-                }
-            ''',
+            vertex_shader=shape_element_list_vertex_shader,
+            fragment_shader=line_fragment_shader,
         )
         # Could do much better using just one vbo and glDrawElementsBaseVertex
         self.batches = defaultdict(_Batch)
@@ -780,10 +747,6 @@ def _refresh_shape(self, group):
             )
         ]
         vao = shader.vertex_array(self.program, vao_content, ibo)
-        with self.program:
-            self.program['Projection'] = get_projection().flatten()
-            self.program['Position'] = [self.center_x, self.center_y]
-            self.program['Angle'] = self.angle
 
         batch.shape.vao = vao
         batch.shape.vbo = vbo
@@ -820,6 +783,11 @@ def draw(self):
         for group in self.dirties:
             self._refresh_shape(group)
         self.dirties.clear()
+        # The program is shared with other shape lists, so set where this
+        # one is before drawing it
+        with self.program:
+            self.program['Position'] = [self._center_x, self._center_y]
+            self.program['Angle'] = self._angle
         for batch in self.batches.values():
             batch.shape.draw()
 
@@ -830,8 +798,6 @@ def _get_center_x(self) -> float:
     def _set_center_x(self, value: float):
         """Set the center x coordinate of the ShapeElementList."""
         self._center_x = value
-        with self.program:
-            self.program['Position'] = [self._center_x, self._center_y]
 
     center_x = property(_get_center_x, _set_center_x)
 
@@ -842,8 +808,6 @@ def _get_center_y(self) -> float:
     def _set_center_y(self, value: float):
         """Set the center y coordinate of the ShapeElementList."""
         self._center_y = value
-        with self.program:
-            self.program['Position'] = [self._center_x, self._center_y]
 
     center_y = property(_get_center_y, _set_center_y)
 
@@ -854,8 +818,6 @@ def _get_angle(self) -> float:
     def _set_angle(self, value: float):
         """Set the angle of the ShapeElementList in degrees."""
         self._angle = value
-        with self.program:
-            self.program['Angle'] = self._angle
 
     angle = property(_get_angle, _set_angle)
 
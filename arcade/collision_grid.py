@@ -0,0 +1,270 @@
+"""
+Grid-backed collision layer for tile maps.
+
+Walls that come from a tile map are unrotated and line up with the grid.
+Storing them as an array of cells lets collision queries look up the few
+cells under a sprite directly, instead of going through spatial hash
+buckets and polygon tests.
+"""
+
+import math
+from typing import List
+
+import numpy as np
+
+from arcade.sprite import Sprite
+
+# Flags stored for each cell of a CollisionGrid
+CELL_SOLID = 1
+CELL_RAMP = 2
+
+# How far off the grid lines a sprite's edges may be and still count as aligned
+ALIGNMENT_TOLERANCE = 1e-6
+
+
+def _is_axis_aligned_box(points) -> bool:
+    """
+    True if the points are the four corners of an unrotated rectangle.
+    """
+    return len(points) == 4 and len(set(points)) == 4 \
+        and len({point[0] for point in points}) == 2 \
+        and len({point[1] for point in points}) == 2
+
+
+class CollisionGrid:
+    """
+    A layer of walls stored as a grid of cells.
+
+    Every cell has a set of flags. ``CELL_SOLID`` cells are completely
+    filled. ``CELL_RAMP`` cells hold sprites with a custom hit box, such as
+    ramps, that are checked against their own points.
+
+    A grid can be used in place of a SpriteList of walls by the collision
+    functions in ``arcade.geometry`` and by the physics engines. Sprites
+    for the solid cells are only created when a query returns them.
+
+    >>> grid = CollisionGrid(4, 3, 32, 32)
+    >>> grid.flags[0, :] = CELL_SOLID
+    >>> grid.is_blocked(40, 10)
+    True
+    >>> grid.is_blocked(40, 40)
+    False
+    >>> [(cell.left, cell.right) for cell in grid.get_objects_for_rect(20, 50, 0, 40)]
+    [(0.0, 32.0), (32.0, 64.0)]
+    """
+
+    def __init__(self, columns: int, rows: int, cell_width: float, cell_height: float,
+                 origin_x: float = 0, origin_y: float = 0):
+        """
+        Create an empty grid. Row 0 is at the bottom, and the bottom left
+        corner of cell (0, 0) is at (origin_x, origin_y).
+        """
+        self.columns = columns
+        self.rows = rows
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        # Indexed [row, column]
+        self.flags = np.zeros((rows, columns), dtype=np.uint8)
+        self._ramps = {}
+        self._cell_sprites = {}
+
+    @classmethod
+    def from_sprite_list(cls, sprite_list, cell_width: float, cell_height: float = None,
+                         origin_x: float = None, origin_y: float = None) -> 'CollisionGrid':
+        """
+        Build a grid from walls that line up with the cells.
+
+        Sprites whose hit box is their bounding box fill the cells they
+        cover. Any other sprite, a ramp for instance, is kept as a
+        ``CELL_RAMP`` in the cells its bounding box covers. By default the
+        grid starts at the bottom left corner of the walls.
+
+        Raises ValueError if a sprite's bounding box doesn't line up with
+        the grid.
+        """
+        if cell_height is None:
+            cell_height = cell_width
+
+        boxes = [(sprite.left, sprite.right, sprite.bottom, sprite.top) for sprite in sprite_list]
+        if origin_x is None:
+            origin_x = min((box[0] for box in boxes), default=0)
+        if origin_y is None:
+            origin_y = min((box[2] for box in boxes), default=0)
+
+        def to_cell(value, origin, size):
+            cell = (value - origin) / size
+            if abs(cell - round(cell)) > ALIGNMENT_TOLERANCE:
+                raise ValueError(f"Sprite edge at {value} is not aligned with the {size} pixel grid "
+                                 f"starting at {origin}.")
+            return int(round(cell))
+
+        cells = [(to_cell(left, origin_x, cell_width), to_cell(right, origin_x, cell_width),
+                  to_cell(bottom, origin_y, cell_height), to_cell(top, origin_y, cell_height))
+                 for left, right, bottom, top in boxes]
+        if min((cell[0] for cell in cells), default=0) < 0 or min((cell[2] for cell in cells), default=0) < 0:
+            raise ValueError("Sprites lie below or left of the grid origin.")
+
+        columns = max((cell[1] for cell in cells), default=0)
+        rows = max((cell[3] for cell in cells), default=0)
+        grid = cls(columns, rows, cell_width, cell_height, origin_x, origin_y)
+
+        for sprite, (min_column, max_column, min_row, max_row) in zip(sprite_list, cells):
+            if _is_axis_aligned_box(sprite.points):
+                grid.flags[min_row:max_row, min_column:max_column] |= CELL_SOLID
+            else:
+                grid.flags[min_row:max_row, min_column:max_column] |= CELL_RAMP
+                for row in range(min_row, max_row):
+                    for column in range(min_column, max_column):
+                        grid._ramps.setdefault((row, column), []).append(sprite)
+
+        return grid
+
+    @classmethod
+    def from_tiled_map(cls, tiled_map, layer_name: str) -> 'CollisionGrid':
+        """
+        Build a grid from a layer of a map loaded with ``read_tiled_map``.
+        Every non-empty tile is solid.
+        """
+        if tiled_map.orientation != "orthogonal":
+            raise ValueError(f"Can't build a collision grid for a {tiled_map.orientation} map.")
+
+        tiles = np.array(tiled_map.layers_int_data[layer_name], dtype=np.uint32).reshape(-1, tiled_map.width)
+        if tiled_map.renderorder == "right-down":
+            # The first row of the map is the top one
+            tiles = tiles[::-1]
+
+        grid = cls(tiles.shape[1], tiles.shape[0], tiled_map.tilewidth, tiled_map.tileheight)
+        grid.flags[tiles != 0] = CELL_SOLID
+        return grid
+
+    def _get_cell_range(self, min_x: float, max_x: float, min_y: float, max_y: float):
+        """
+        Rows and columns of the cells overlapping a rectangle, not counting
+        cells that only touch its edges. The range is empty for rectangles
+        outside the grid.
+        """
+        def clamp(value, limit):
+            return min(max(value, 0), limit)
+
+        min_column = clamp(math.floor((min_x - self.origin_x) / self.cell_width), self.columns)
+        max_column = clamp(math.ceil((max_x - self.origin_x) / self.cell_width), self.columns)
+        min_row = clamp(math.floor((min_y - self.origin_y) / self.cell_height), self.rows)
+        max_row = clamp(math.ceil((max_y - self.origin_y) / self.cell_height), self.rows)
+        return min_row, max_row, min_column, max_column
+
+    def _get_cell_sprite(self, row: int, column: int) -> Sprite:
+        """
+        The sprite standing in for a solid cell, created the first time
+        it is needed.
+        """
+        sprite = self._cell_sprites.get((row, column))
+        if sprite is None:
+            sprite = Sprite(center_x=self.origin_x + (column + 0.5) * self.cell_width,
+                            center_y=self.origin_y + (row + 0.5) * self.cell_height)
+            sprite.width = self.cell_width
+            sprite.height = self.cell_height
+            self._cell_sprites[(row, column)] = sprite
+        return sprite
+
+    def get_cell(self, x: float, y: float) -> (int, int):
+        """
+        The (row, column) of the cell holding a point.
+        """
+        return (math.floor((y - self.origin_y) / self.cell_height),
+                math.floor((x - self.origin_x) / self.cell_width))
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        """
+        True if a point is inside a solid cell, or inside the hit box of a
+        ramp.
+        """
+        row, column = self.get_cell(x, y)
+        if not (0 <= row < self.rows and 0 <= column < self.columns):
+            return False
+
+        flags = self.flags[row, column]
+        if flags & CELL_SOLID:
+            return True
+        if flags & CELL_RAMP:
+            from arcade.geometry import is_point_in_polygon
+            return any(is_point_in_polygon(x, y, ramp.points) for ramp in self._ramps[(row, column)])
+        return False
+
+    def is_rect_occupied(self, min_x: float, max_x: float, min_y: float, max_y: float) -> bool:
+        """
+        True if any cell overlapping the rectangle holds a wall. Ramps are
+        counted by their cells, not their hit boxes.
+        """
+        min_row, max_row, min_column, max_column = self._get_cell_range(min_x, max_x, min_y, max_y)
+        return bool(self.flags[min_row:max_row, min_column:max_column].any())
+
+    def get_objects_for_rect(self, min_x: float, max_x: float,
+                             min_y: float, max_y: float) -> List[Sprite]:
+        """
+        The sprites for the walls in the cells overlapping a rectangle,
+        without duplicates.
+        """
+        min_row, max_row, min_column, max_column = self._get_cell_range(min_x, max_x, min_y, max_y)
+        block = self.flags[min_row:max_row, min_column:max_column]
+
+        close_by_sprites = []
+        seen = set()
+        for row, column in np.argwhere(block).tolist():
+            row += min_row
+            column += min_column
+            if self.flags[row, column] & CELL_SOLID:
+                close_by_sprites.append(self._get_cell_sprite(row, column))
+            else:
+                for ramp in self._ramps[(row, column)]:
+                    if id(ramp) not in seen:
+                        seen.add(id(ramp))
+                        close_by_sprites.append(ramp)
+        return close_by_sprites
+
+    def get_objects_for_rects(self, rects) -> List[List[Sprite]]:
+        """
+        Batched version of ``get_objects_for_rect``, taking an (N, 4) array
+        of (min_x, max_x, min_y, max_y) rows.
+        """
+        return [self.get_objects_for_rect(*rect) for rect in np.asarray(rects, dtype=np.float64).tolist()]
+
+    def probe(self, sprite: Sprite, offset_x: float = 0, offset_y: float = 0) -> List[Sprite]:
+        """
+        The walls ``sprite`` would collide with if it were moved by
+        (offset_x, offset_y). The sprite isn't moved.
+
+        For a sprite with a rectangular hit box, every solid cell under it
+        is a hit, so only ramps need a polygon test.
+        """
+        points = sprite.points
+        if not _is_axis_aligned_box(points):
+            from arcade.geometry import _probe_for_collision
+            candidates = self.get_objects_for_rect(sprite.left + offset_x, sprite.right + offset_x,
+                                                   sprite.bottom + offset_y, sprite.top + offset_y)
+            return _probe_for_collision(sprite, candidates, offset_x, offset_y)
+
+        from arcade.geometry import are_polygons_intersecting
+        min_row, max_row, min_column, max_column = self._get_cell_range(
+            sprite.left + offset_x, sprite.right + offset_x, sprite.bottom + offset_y, sprite.top + offset_y)
+        block = self.flags[min_row:max_row, min_column:max_column]
+
+        collision_list = []
+        moved_points = None
+        seen = set()
+        for row, column in np.argwhere(block).tolist():
+            row += min_row
+            column += min_column
+            if self.flags[row, column] & CELL_SOLID:
+                collision_list.append(self._get_cell_sprite(row, column))
+                continue
+
+            if moved_points is None:
+                moved_points = [(point[0] + offset_x, point[1] + offset_y) for point in points]
+            for ramp in self._ramps[(row, column)]:
+                if ramp is not sprite and id(ramp) not in seen:
+                    seen.add(id(ramp))
+                    if are_polygons_intersecting(moved_points, ramp.points):
+                        collision_list.append(ramp)
+        return collision_list
@@ -8,8 +8,14 @@
 """
 # pylint: disable=too-many-arguments, too-many-locals, too-few-public-methods
 
+from collections import OrderedDict
+from collections import namedtuple
 import ctypes
+import hashlib
 import math
+import os
+import threading
+import weakref
 import PIL.Image
 import PIL.ImageOps
 import numpy as np
@@ -18,9 +24,12 @@
 import pyglet.gl as gl
 
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from arcade.window_commands import get_projection
 from arcade.window_commands import get_window
+from arcade.window_commands import _get_pixel_scale
 from arcade.arcade_types import Color
 from arcade.arcade_types import PointList
 from arcade import shader
@@ -47,6 +56,9 @@
     }
 '''
 
+# Vertices drawn with the line shaders
+_line_vertex_type = np.dtype([('vertex', '2f4'), ('color', '4B')])
+
 
 def get_four_byte_color(color: Color) -> Color:
     """
@@ -64,6 +76,31 @@ def get_four_byte_color(color: Color) -> Color:
         raise ValueError("This isn't a 3 or 4 byte color")
 
 
+def _get_point_array(point_list: PointList) -> np.ndarray:
+    """
+    The points as an (N, 2) float32 array. A float32 array is used as it
+    is, without a copy.
+    """
+    return np.asarray(point_list, dtype=np.float32).reshape(-1, 2)
+
+
+def _get_color_array(color, count: int) -> np.ndarray:
+    """
+    A color, or an array of ``count`` colors, as uint8 RGBA. A single
+    color gives an array of shape (4,), and an (N, 4) uint8 array is used
+    as it is, without a copy.
+    """
+    colors = np.asarray(color, dtype=np.uint8)
+    if colors.ndim not in (1, 2) or colors.shape[-1] not in (3, 4):
+        raise ValueError("This isn't a 3 or 4 byte color")
+    if colors.ndim == 2 and len(colors) != count:
+        raise ValueError(f"Got {len(colors)} colors for {count} points")
+    if colors.shape[-1] == 3:
+        alpha = np.full(colors.shape[:-1] + (1,), 255, dtype=np.uint8)
+        colors = np.concatenate((colors, alpha), axis=-1)
+    return colors
+
+
 def get_four_float_color(color: Color) -> (float, float, float, float):
     """
     Given a 3 or 4 RGB/RGBA color where each color goes 0-255, this
@@ -162,32 +199,290 @@ def __init__(self, texture_id: int, width: float, height: float, file_name: str)
         self.width = width
         self.height = height
         self.texture_name = file_name
-        self._sprite = None
-        self._sprite_list = None
+        # The pixels, as loaded. Drawing packs them into the texture atlas.
+        self.image = None
+        # Sprites that use the texture, or a texture sharing its pixels.
+        # The texture cache keeps these.
+        self.sprites = weakref.WeakSet()
+        # Textures loaded by load_textures show an (x, y, width, height)
+        # region of the texture of a whole sheet. Textures with the same
+        # pixels as one loaded before show all of it. The sprite shader
+        # mirrors and flips them, instead of keeping turned copies.
+        self.sheet = None
+        self.region = None
+        self.mirrored = False
+        self.flipped = False
+
+    def add_sprite(self, sprite):
+        """
+        Note that ``sprite`` uses this texture. A texture sharing the pixels
+        of another one notes it there too, so the texture cache doesn't
+        evict or release the one it shares while the sprite is drawn.
+        """
+        self.sprites.add(sprite)
+        if self.sheet is not None:
+            self.sheet.sprites.add(sprite)
+
+    def release(self):
+        """
+        Delete the GL texture. The image is kept, so the texture can still
+        be drawn from the texture atlas. Regions leave the texture of their
+        sheet alone.
+        """
+        if self.sheet is not None:
+            return
+        if isinstance(self.texture_id, gl.GLuint) and self.texture_id.value != 0:
+            if gl.current_context is not None:
+                gl.glDeleteTextures(1, ctypes.byref(self.texture_id))
+            self.texture_id.value = 0
 
     def draw(self, center_x: float, center_y: float, width: float,
              height: float, angle: float=0,
              alpha: float=1, transparent: bool=True,
              repeat_count_x=1, repeat_count_y=1):
+        """
+        Draw the texture, stretched over a rectangle. ``alpha`` goes from
+        0 to 1. Textures that aren't ``transparent`` are drawn without
+        blending. The rectangle is tiled with ``repeat_count_x`` by
+        ``repeat_count_y`` copies of the texture.
+        """
+        alpha = int(round(min(max(alpha, 0), 1) * 255))
+        _draw_textured_quad(center_x, center_y, width, height, self, angle,
+                            (255, 255, 255, alpha), transparent=transparent,
+                            repeat_count_x=repeat_count_x, repeat_count_y=repeat_count_y)
+
+
+_texture_disk_cache_dir = None
 
-        from arcade.sprite import Sprite
-        from arcade.sprite_list import SpriteList
 
-        if self._sprite == None:
-            self._sprite = Sprite()
-            self._sprite.texture = self
-            self._sprite.textures = [self]
+def set_texture_disk_cache(directory: Optional[str]):
+    """
+    Keep the decoded pixels of loaded textures in ``directory``, so later
+    runs can map them from there instead of decoding their image files
+    again. Entries are found by the path and modification time of the
+    file, and how it was loaded, so files that change are decoded again.
+    None turns the cache off.
+    """
+    global _texture_disk_cache_dir
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    _texture_disk_cache_dir = directory
 
-            self._sprite_list = SpriteList()
-            self._sprite_list.append(self._sprite)
 
-        self._sprite.center_x = center_x
-        self._sprite.center_y = center_y
-        self._sprite.width = width
-        self._sprite.height = height
-        self._sprite.angle = angle
+_texture_downscale_threshold = None
+
+
+def set_texture_downscaling(threshold: Optional[float]=0.5):
+    """
+    Keep the images of textures loaded to be drawn at less than
+    ``threshold`` of their size only as large as they are drawn, so they
+    take less room in the texture atlas and upload faster. This is for
+    ``load_texture`` with a ``scale``, and ``Sprite`` with a filename and a
+    ``scale``. The textures keep the size they would have had. None turns
+    this off.
+    """
+    global _texture_downscale_threshold
+    _texture_downscale_threshold = threshold
+
+
+def _get_image_scale(scale: float) -> float:
+    """
+    How much the image of a texture drawn at ``scale`` is reduced when it
+    is loaded. 1 if it isn't.
+    """
+    if _texture_downscale_threshold is not None and 0 < scale < _texture_downscale_threshold:
+        return scale
+    return 1
+
+
+def _get_texture_disk_cache_path(file_name: str, *parameters) -> str:
+    """
+    Where the pixels of an image file, loaded with ``parameters``, are
+    kept in the disk cache.
+    """
+    stat = os.stat(file_name)
+    key = repr((os.path.abspath(file_name), stat.st_mtime_ns, stat.st_size) + parameters)
+    return os.path.join(_texture_disk_cache_dir,
+                        hashlib.sha256(key.encode('utf-8')).hexdigest() + '.npy')
+
+
+def _read_texture_disk_cache(path: str) -> Optional[PIL.Image.Image]:
+    """
+    An image of the pixels in the disk cache, mapped from the file rather
+    than read. None if they aren't there.
+    """
+    try:
+        pixels = np.load(path, mmap_mode='r')
+        height, width, components = pixels.shape
+        if components != 4 or pixels.dtype != np.uint8:
+            return None
+        return PIL.Image.frombuffer('RGBA', (width, height), pixels, 'raw', 'RGBA', 0, 1)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_texture_disk_cache(path: str, image: PIL.Image.Image):
+    """
+    Save the pixels of an image to the disk cache, as an RGBA array.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            np.save(file, np.asarray(image.convert('RGBA')))
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def _create_shared_texture(original: Texture, texture_name, width: float, height: float) -> Texture:
+    """
+    Make a texture showing all of another one, sharing its pixels.
+    """
+    result = Texture(original.texture_id, width, height, texture_name)
+    if original.sheet is not None:
+        result.sheet = original.sheet
+        result.region = original.region
+        result.mirrored = original.mirrored
+        result.flipped = original.flipped
+    else:
+        result.sheet = original
+        result.region = (0, 0) + original.image.size
+    return result
+
+
+def _create_flipped_texture(texture: Texture, cache_name: str, mirrored: bool, flipped: bool) -> Texture:
+    """
+    Make a texture showing ``texture`` mirrored or flipped, and put it in
+    ``load_texture.texture_cache`` under ``cache_name``.
+    """
+    result = _create_shared_texture(texture, texture.texture_name, texture.width, texture.height)
+    result.mirrored = texture.mirrored != mirrored
+    result.flipped = texture.flipped != flipped
+    load_texture.texture_cache[cache_name] = result
+    return result
+
+
+# The textures made by _create_texture, by the content of their images
+_textures_by_content = weakref.WeakValueDictionary()
+
+
+def _get_image_content_key(image: PIL.Image.Image):
+    """
+    A key that is the same for images with the same pixels. They are
+    compared as RGBA, the way the texture atlas stores them, so the same
+    pixels in another mode give the same key.
+    """
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+    return image.size, digest
+
+
+def _create_texture(image: PIL.Image.Image, texture_name, width: float, height: float) -> Texture:
+    """
+    Make the texture for an image read by ``_decode_texture``. This is the
+    part of loading a texture that has to run on the main thread.
+
+    If a texture with the same pixels was made before, the new texture is
+    a region covering all of it, and shares its image, its GL texture and
+    its place in the texture atlas.
+    """
+    content_key = _get_image_content_key(image)
+    original = _textures_by_content.get(content_key)
+    if original is not None:
+        return _create_shared_texture(original, texture_name, width, height)
+
+    texture = gl.GLuint(0)
+    gl.glGenTextures(1, ctypes.byref(texture))
+
+    gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+    gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+
+    gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S,
+                       gl.GL_REPEAT)
+    gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T,
+                       gl.GL_REPEAT)
+
+    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER,
+                       gl.GL_LINEAR)
+    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER,
+                       gl.GL_LINEAR_MIPMAP_LINEAR)
+
+    result = Texture(texture, width, height, texture_name)
+    result.image = image
+    _textures_by_content[content_key] = result
+    return result
+
+
+def _decode_textures(file_name: str, image_location_list: PointList) -> PIL.Image.Image:
+    """
+    Read the image of ``load_textures`` from its file, and check that the
+    textures are inside it. This makes no GL calls, so it can run on
+    another thread.
+    """
+    image = None
+    cache_path = None
+    if _texture_disk_cache_dir is not None:
+        cache_path = _get_texture_disk_cache_path(file_name)
+        image = _read_texture_disk_cache(cache_path)
+    if image is None:
+        image = PIL.Image.open(file_name)
+        image.load()
+        if cache_path is not None:
+            _write_texture_disk_cache(cache_path, image)
+
+    source_image_width, source_image_height = image.size
+    for image_location in image_location_list:
+        x, y, width, height = image_location
+
+        if width <= 0:
+            raise ValueError("Texture has a width of {}, must be > 0."
+                             .format(width))
+        if x > source_image_width:
+            raise ValueError("Can't load texture starting at an x of {} "
+                             "when the image is only {} across."
+                             .format(x, source_image_width))
+        if y > source_image_height:
+            raise ValueError("Can't load texture starting at an y of {} "
+                             "when the image is only {} high."
+                             .format(y, source_image_height))
+        if x + width > source_image_width:
+            raise ValueError("Can't load texture ending at an x of {} "
+                             "when the image is only {} wide."
+                             .format(x + width, source_image_width))
+        if y + height > source_image_height:
+            raise ValueError("Can't load texture ending at an y of {} "
+                             "when the image is only {} high."
+                             .format(y + height, source_image_height))
+
+    return image
+
+
+def _create_region_textures(sheet_image: PIL.Image.Image, file_name: str,
+                            image_location_list: PointList,
+                            mirrored: bool=False,
+                            flipped: bool=False) -> List[Texture]:
+    """
+    Make a texture of a whole image read by ``_decode_textures``, and
+    textures of regions of it, which share its pixels.
+    """
+    sheet = _create_texture(sheet_image, file_name, sheet_image.width, sheet_image.height)
+    offset_x = offset_y = 0
+    if sheet.sheet is not None:
+        # The same pixels were loaded before, so use the texture that has them
+        offset_x, offset_y = sheet.region[:2]
+        sheet = sheet.sheet
+    textures = []
+    for image_location in image_location_list:
+        x, y, width, height = image_location
+        texture = Texture(sheet.texture_id, width, height, image_location)
+        texture.sheet = sheet
+        texture.region = x + offset_x, y + offset_y, width, height
+        texture.mirrored = mirrored
+        texture.flipped = flipped
+        textures.append(texture)
+    return textures
 
-        self._sprite_list.draw()
 
 def load_textures(file_name: str,
                   image_location_list: PointList,
@@ -197,6 +492,9 @@ def load_textures(file_name: str,
     """
     Load a set of textures off of a single image file.
 
+    The image is only decoded once. The textures are regions of it, and
+    share its pixels and its place in the texture atlas.
+
     Note, if the code is to load only part of the image, the given x, y
     coordinates will start with the origin (0, 0) in the upper left of the
     image. When drawing, Arcade uses (0, 0)
@@ -217,16 +515,56 @@ def load_textures(file_name: str,
     Raises:
         :SystemError:
     """
+    sheet_image = _decode_textures(file_name, image_location_list)
+    return _create_region_textures(sheet_image, file_name, image_location_list, mirrored, flipped)
+
+
+def _get_texture_cache_name(file_name: str, x: float, y: float, width: float, height: float,
+                            mirrored: bool, flipped: bool, scale: float,
+                            image_scale: float=1) -> str:
+    """
+    The key of a texture in ``load_texture.texture_cache``.
+    """
+    cache_name = "{}{}{}{}{}{}{}{}".format(file_name, x, y, width, height, scale, flipped, mirrored)
+    if image_scale != 1:
+        cache_name += "reduced{}".format(image_scale)
+    return cache_name
+
+
+def _decode_texture(file_name: str, x: float=0, y: float=0,
+                    width: float=0, height: float=0,
+                    mirrored: bool=False,
+                    flipped: bool=False,
+                    image_scale: float=1) -> PIL.Image.Image:
+    """
+    Read the image of ``load_texture`` from its file. This makes no GL
+    calls, so it can run on another thread.
+
+    If ``image_scale`` is below 1, the image is reduced to that fraction of
+    its size. JPEG files are decoded at a smaller size to begin with.
+    """
+    cache_path = None
+    if _texture_disk_cache_dir is not None:
+        parameters = (x, y, width, height, mirrored, flipped)
+        if image_scale != 1:
+            parameters += (image_scale, )
+        cache_path = _get_texture_disk_cache_path(file_name, *parameters)
+        image = _read_texture_disk_cache(cache_path)
+        if image is not None:
+            return image
+
     source_image = PIL.Image.open(file_name)
 
     source_image_width, source_image_height = source_image.size
-    texture_info_list = []
-    for image_location in image_location_list:
-        x, y, width, height = image_location
+    cropped = x != 0 or y != 0 or width != 0 or height != 0
+    if not cropped:
+        width, height = source_image.size
+    reduced_size = (max(1, round(width * image_scale)), max(1, round(height * image_scale)))
 
-        if width <= 0:
-            raise ValueError("Texture has a width of {}, must be > 0."
-                             .format(width))
+    if image_scale < 1 and not cropped and source_image.format == 'JPEG':
+        source_image.draft(source_image.mode, reduced_size)
+
+    if cropped:
         if x > source_image_width:
             raise ValueError("Can't load texture starting at an x of {} "
                              "when the image is only {} across."
@@ -245,35 +583,62 @@ def load_textures(file_name: str,
                              .format(y + height, source_image_height))
 
         image = source_image.crop((x, y, x + width, y + height))
-        # image = _trim_image(image)
-
-        if mirrored:
-            image = PIL.ImageOps.mirror(image)
-
-        if flipped:
-            image = PIL.ImageOps.flip(image)
+    else:
+        image = source_image
 
-        image_width, image_height = image.size
+    # image = _trim_image(image)
+    if mirrored:
+        image = PIL.ImageOps.mirror(image)
 
-        texture = gl.GLuint(0)
-        gl.glGenTextures(1, ctypes.byref(texture))
+    if flipped:
+        image = PIL.ImageOps.flip(image)
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
-        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+    if image_scale < 1 and image.size != reduced_size:
+        image = image.resize(reduced_size, PIL.Image.LANCZOS, reducing_gap=2.0)
 
-        gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_REPEAT)
-        gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_REPEAT)
+    image.load()
+    if cache_path is not None:
+        _write_texture_disk_cache(cache_path, image)
+    return image
 
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR)
-        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER,
-                           gl.GL_LINEAR_MIPMAP_LINEAR)
 
-        image_width *= scale
-        image_height *= scale
+def _get_texture_size(file_name: str, width: float, height: float,
+                      image: PIL.Image.Image, image_scale: float):
+    """
+    The size of a texture loaded by ``_decode_texture``, before it was
+    reduced.
+    """
+    if image_scale == 1:
+        return image.size
+    if width != 0 or height != 0:
+        return width, height
+    with PIL.Image.open(file_name) as source_image:
+        return source_image.size
 
-        texture_info_list.append(Texture(texture, width, height, image_location))
 
-    return texture_info_list
+def _load_texture(file_name: str, x: float, y: float, width: float, height: float,
+                  mirrored: bool, flipped: bool, scale: float, image_scale: float) -> Texture:
+    """
+    Load a texture like ``load_texture``, with its image reduced by
+    ``image_scale``.
+    """
+    # See if we already loaded this file, and we can just use a cached version.
+    cache_name = _get_texture_cache_name(file_name, x, y, width, height, mirrored, flipped, scale,
+                                         image_scale)
+    result = load_texture.texture_cache.get(cache_name)
+    if result is not None:
+        return result
+
+    # Mirrored and flipped textures share the pixels of the texture as it is
+    if mirrored or flipped:
+        texture = _load_texture(file_name, x, y, width, height, False, False, scale, image_scale)
+        return _create_flipped_texture(texture, cache_name, mirrored, flipped)
+
+    image = _decode_texture(file_name, x, y, width, height, False, False, image_scale)
+    texture_width, texture_height = _get_texture_size(file_name, width, height, image, image_scale)
+    result = _create_texture(image, file_name, texture_width * scale, texture_height * scale)
+    load_texture.texture_cache[cache_name] = result
+    return result
 
 
 def load_texture(file_name: str, x: float=0, y: float=0,
@@ -299,7 +664,9 @@ def load_texture(file_name: str, x: float=0, y: float=0,
         :y (float): Y position of the crop area of the texture.
         :width (float): Width of the crop area of the texture.
         :height (float): Height of the crop area of the texture.
-        :scale (float): Scale factor to apply on the new texture.
+        :scale (float): Scale factor to apply on the new texture. See
+            ``set_texture_downscaling`` to load the image reduced when
+            it is small.
     Returns:
         The new texture.
     Raises:
@@ -333,76 +700,132 @@ def load_texture(file_name: str, x: float=0, y: float=0,
 
     >>> arcade.close_window()
     """
+    return _load_texture(file_name, x, y, width, height, mirrored, flipped, scale,
+                         _get_image_scale(scale))
 
-    # See if we already loaded this file, and we can just use a cached version.
-    cache_name = "{}{}{}{}{}{}{}{}".format(file_name, x, y, width, height, scale, flipped, mirrored)
-    if cache_name in load_texture.texture_cache:
-        return load_texture.texture_cache[cache_name]
 
-    source_image = PIL.Image.open(file_name)
+TextureCacheStats = namedtuple('TextureCacheStats', 'hits, misses, evictions, bytes, max_bytes')
 
-    source_image_width, source_image_height = source_image.size
 
-    if x != 0 or y != 0 or width != 0 or height != 0:
-        if x > source_image_width:
-            raise ValueError("Can't load texture starting at an x of {} "
-                             "when the image is only {} across."
-                             .format(x, source_image_width))
-        if y > source_image_height:
-            raise ValueError("Can't load texture starting at an y of {} "
-                             "when the image is only {} high."
-                             .format(y, source_image_height))
-        if x + width > source_image_width:
-            raise ValueError("Can't load texture ending at an x of {} "
-                             "when the image is only {} wide."
-                             .format(x + width, source_image_width))
-        if y + height > source_image_height:
-            raise ValueError("Can't load texture ending at an y of {} "
-                             "when the image is only {} high."
-                             .format(y + height, source_image_height))
-
-        image = source_image.crop((x, y, x + width, y + height))
+def _get_texture_bytes(texture: Texture) -> int:
+    """
+    How many bytes the pixels of a texture take, as RGBA. Textures sharing
+    the pixels of another one take none of their own.
+    """
+    if texture.sheet is not None:
+        return 0
+    if texture.image is not None:
+        width, height = texture.image.size
     else:
-        image = source_image
-
-    # image = _trim_image(image)
-    if mirrored:
-        image = PIL.ImageOps.mirror(image)
-
-    if flipped:
-        image = PIL.ImageOps.flip(image)
-
-    image_width, image_height = image.size
-    # image_bytes = image.convert("RGBA").tobytes("raw", "RGBA", 0, -1)
-
-    texture = gl.GLuint(0)
-    gl.glGenTextures(1, ctypes.byref(texture))
+        width, height = texture.width, texture.height
+    return int(width * height * 4)
+
+
+class TextureCache:
+    """
+    The textures made by ``load_texture``, by what they were loaded with.
+
+    It is used like a dict. If ``max_bytes`` is set, adding textures
+    evicts the least recently used ones until their pixels fit in that
+    many bytes again. Textures that a live sprite uses, directly or through
+    a texture sharing their pixels, are never evicted.
+    Evicted textures have their GL texture released.
+
+    >>> cache = TextureCache(max_bytes=500)
+    >>> cache['a'] = Texture(0, 10, 10, 'a')
+    >>> cache['b'] = Texture(0, 10, 10, 'b')
+    >>> 'a' in cache, 'b' in cache
+    (False, True)
+    >>> cache.get_stats()
+    TextureCacheStats(hits=0, misses=0, evictions=1, bytes=400, max_bytes=500)
+    """
+
+    def __init__(self, max_bytes: int=None):
+        self.max_bytes = max_bytes
+        self._textures = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key) -> bool:
+        return key in self._textures
+
+    def __len__(self) -> int:
+        return len(self._textures)
+
+    def __iter__(self):
+        return iter(self._textures)
+
+    def __getitem__(self, key) -> Texture:
+        texture = self._textures[key]
+        self._textures.move_to_end(key)
+        self._hits += 1
+        return texture
+
+    def get(self, key, default=None):
+        if key in self._textures:
+            return self[key]
+        self._misses += 1
+        return default
+
+    def __setitem__(self, key, texture: Texture):
+        if key in self._textures:
+            del self[key]
+        self._textures[key] = texture
+        self._bytes += _get_texture_bytes(texture)
+        self.trim()
+
+    def __delitem__(self, key):
+        texture = self._textures.pop(key)
+        self._bytes -= _get_texture_bytes(texture)
+
+    def clear(self):
+        """
+        Forget all the textures. They are not released.
+        """
+        self._textures.clear()
+        self._bytes = 0
 
-    gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
-    gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+    def trim(self):
+        """
+        Evict the least recently used textures that no sprite uses, until
+        the rest fit in ``max_bytes``.
+        """
+        if self.max_bytes is None:
+            return
+        for key, texture in list(self._textures.items()):
+            if self._bytes <= self.max_bytes:
+                break
+            if len(texture.sprites) == 0:
+                del self[key]
+                texture.release()
+                self._evictions += 1
+
+    def get_stats(self) -> TextureCacheStats:
+        """
+        How often textures were found, and how many bytes are cached.
+        """
+        return TextureCacheStats(self._hits, self._misses, self._evictions, self._bytes, self.max_bytes)
 
-    gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S,
-                       gl.GL_REPEAT)
-    gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T,
-                       gl.GL_REPEAT)
 
-    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER,
-                       gl.GL_LINEAR)
-    gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER,
-                       gl.GL_LINEAR_MIPMAP_LINEAR)
-    # glu.gluBuild2DMipmaps(gl.GL_TEXTURE_2D, gl.GL_RGBA,
-    #                       image_width, image_height,
-    #                       gl.GL_RGBA, gl.GL_UNSIGNED_BYTE, image_bytes)
+load_texture.texture_cache = TextureCache()
 
-    image_width *= scale
-    image_height *= scale
 
-    result = Texture(texture, image_width, image_height, file_name)
-    load_texture.texture_cache[cache_name] = result
-    return result
+def set_texture_cache_size(max_bytes: int=None):
+    """
+    Limit how many bytes of pixels ``load_texture`` keeps in its cache.
+    None keeps every texture.
+    """
+    load_texture.texture_cache.max_bytes = max_bytes
+    load_texture.texture_cache.trim()
 
 
-load_texture.texture_cache = dict()
+def get_texture_cache_stats() -> TextureCacheStats:
+    """
+    Statistics of the ``load_texture`` cache.
+    """
+    return load_texture.texture_cache.get_stats()
 
 
 # --- END TEXTURE FUNCTIONS # # #
@@ -422,6 +845,73 @@ def trim_image(image: PIL.Image) -> PIL.Image:
     return image.crop(bbox)
 
 
+# --- BEGIN TESSELLATION FUNCTIONS # # #
+
+# How far, in pixels, the edge of an ellipse drawn without a segment count
+# may stray from the true curve
+ELLIPSE_TOLERANCE = 0.25
+MIN_ELLIPSE_SEGMENTS = 8
+MAX_ELLIPSE_SEGMENTS = 128
+
+# Unit circle points, by number of segments
+_unit_circles = {}
+
+
+def _get_unit_circle(num_segments: int) -> np.ndarray:
+    """
+    The (num_segments, 2) points of a unit circle split into
+    ``num_segments`` segments, starting at angle 0.
+    """
+    points = _unit_circles.get(num_segments)
+    if points is None:
+        theta = np.arange(num_segments) * (2 * math.pi / num_segments)
+        points = np.stack((np.cos(theta), np.sin(theta)), axis=1)
+        points.setflags(write=False)
+        _unit_circles[num_segments] = points
+    return points
+
+
+def _transform_points(points: np.ndarray, width: float, height: float,
+                      center_x: float, center_y: float, tilt_angle: float=0) -> np.ndarray:
+    """
+    Scale points by (width, height), tilt them by ``tilt_angle`` degrees
+    around the origin, then move the origin to (center_x, center_y).
+    """
+    angle = math.radians(tilt_angle)
+    cos = math.cos(angle)
+    sin = math.sin(angle)
+    matrix = np.array(((width * cos, width * sin),
+                       (-height * sin, height * cos)))
+    return points @ matrix + (center_x, center_y)
+
+
+def get_ellipse_segment_count(width: float, height: float) -> int:
+    """
+    The number of segments an ellipse with these radii needs to look round
+    at the current viewport scale. Small ellipses get as few as
+    ``MIN_ELLIPSE_SEGMENTS``, large ones up to ``MAX_ELLIPSE_SEGMENTS``.
+
+    >>> get_ellipse_segment_count(3, 3)
+    8
+    >>> get_ellipse_segment_count(100, 100)
+    48
+    >>> get_ellipse_segment_count(1000, 10)
+    128
+    """
+    radius = max(abs(width), abs(height)) * _get_pixel_scale()
+    if radius <= ELLIPSE_TOLERANCE:
+        return MIN_ELLIPSE_SEGMENTS
+
+    # Segments whose middle is ELLIPSE_TOLERANCE inside the circle
+    num_segments = math.ceil(math.pi / math.acos(1 - ELLIPSE_TOLERANCE / radius))
+    # Multiples of 4 keep the shape symmetric and the number of tables small
+    num_segments = -(-num_segments // 4) * 4
+    return min(MAX_ELLIPSE_SEGMENTS, max(MIN_ELLIPSE_SEGMENTS, num_segments))
+
+
+# --- END TESSELLATION FUNCTIONS # # #
+
+
 # --- BEGIN ARC FUNCTIONS # # #
 
 
@@ -430,7 +920,7 @@ def draw_arc_filled(center_x: float, center_y: float,
                     color: Color,
                     start_angle: float, end_angle: float,
                     tilt_angle: float=0,
-                    num_segments: int=128):
+                    num_segments: int=None):
     """
     Draw a filled in arc. Useful for drawing pie-wedges, or Pac-Man.
 
@@ -444,34 +934,25 @@ def draw_arc_filled(center_x: float, center_y: float,
         :start_angle: start angle of the arc in degrees.
         :end_angle: end angle of the arc in degrees.
         :tilt_angle: angle the arc is tilted.
+        :num_segments: number of segments a full circle would be split
+         into. By default it depends on how big the arc is on screen.
     Returns:
         None
     Raises:
         None
     """
-    unrotated_point_list = [[0, 0]]
+    if num_segments is None:
+        num_segments = get_ellipse_segment_count(width, height)
 
     start_segment = int(start_angle / 360 * num_segments)
     end_segment = int(end_angle / 360 * num_segments)
 
-    for segment in range(start_segment, end_segment + 1):
-        theta = 2.0 * 3.1415926 * segment / num_segments
-
-        x = width * math.cos(theta)
-        y = height * math.sin(theta)
-
-        unrotated_point_list.append((x, y))
-
-    if tilt_angle == 0:
-        uncentered_point_list = unrotated_point_list
-    else:
-        uncentered_point_list = []
-        for point in unrotated_point_list:
-            uncentered_point_list.append(rotate_point(point[0], point[1], 0, 0, tilt_angle))
-
-    point_list = []
-    for point in uncentered_point_list:
-        point_list.append((point[0] + center_x, point[1] + center_y))
+    unit_circle = _get_unit_circle(num_segments)
+    unit_points = np.concatenate((
+        ((0, 0),),
+        unit_circle[np.arange(start_segment, end_segment + 1) % num_segments]
+    ))
+    point_list = _transform_points(unit_points, width, height, center_x, center_y, tilt_angle)
 
     _generic_draw_line_strip(point_list, color, 1, gl.GL_TRIANGLE_FAN)
 
@@ -480,7 +961,7 @@ def draw_arc_outline(center_x: float, center_y: float, width: float,
                      height: float, color: Color,
                      start_angle: float, end_angle: float,
                      border_width: float=1, tilt_angle: float=0,
-                     num_segments: int=128):
+                     num_segments: int=None):
     """
     Draw the outside edge of an arc. Useful for drawing curved lines.
 
@@ -495,12 +976,15 @@ def draw_arc_outline(center_x: float, center_y: float, width: float,
         :end_angle: end angle of the arc in degrees.
         :border_width: width of line in pixels.
         :angle: angle the arc is tilted.
+        :num_segments: number of segments a full circle would be split
+         into. By default it depends on how big the arc is on screen.
     Returns:
         None
     Raises:
         None
     """
-    unrotated_point_list = []
+    if num_segments is None:
+        num_segments = get_ellipse_segment_count(width + border_width / 2, height + border_width / 2)
 
     start_segment = int(start_angle / 360 * num_segments)
     end_segment = int(end_angle / 360 * num_segments)
@@ -510,28 +994,13 @@ def draw_arc_outline(center_x: float, center_y: float, width: float,
     inside_height = height - border_width / 2
     outside_height = height + border_width / 2
 
-    for segment in range(start_segment, end_segment + 1):
-        theta = 2.0 * math.pi * segment / num_segments
-
-        x1 = inside_width * math.cos(theta)
-        y1 = inside_height * math.sin(theta)
-
-        x2 = outside_width * math.cos(theta)
-        y2 = outside_height * math.sin(theta)
-
-        unrotated_point_list.append((x1, y1))
-        unrotated_point_list.append((x2, y2))
-
-    if tilt_angle == 0:
-        uncentered_point_list = unrotated_point_list
-    else:
-        uncentered_point_list = []
-        for point in unrotated_point_list:
-            uncentered_point_list.append(rotate_point(point[0], point[1], 0, 0, tilt_angle))
-
-    point_list = []
-    for point in uncentered_point_list:
-        point_list.append((point[0] + center_x, point[1] + center_y))
+    unit_circle = _get_unit_circle(num_segments)
+    unit_points = unit_circle[np.arange(start_segment, end_segment + 1) % num_segments]
+    inside_points = _transform_points(unit_points, inside_width, inside_height,
+                                      center_x, center_y, tilt_angle)
+    outside_points = _transform_points(unit_points, outside_width, outside_height,
+                                       center_x, center_y, tilt_angle)
+    point_list = np.stack((inside_points, outside_points), axis=1).reshape(-1, 2)
 
     _generic_draw_line_strip(point_list, color, 1, gl.GL_TRIANGLE_STRIP)
 
@@ -702,7 +1171,7 @@ def draw_circle_outline(center_x: float, center_y: float, radius: float,
 
 def draw_ellipse_filled(center_x: float, center_y: float,
                         width: float, height: float, color: Color,
-                        tilt_angle: float=0, num_segments=128):
+                        tilt_angle: float=0, num_segments: int=None):
     """
     Draw a filled in ellipse.
 
@@ -715,7 +1184,8 @@ def draw_ellipse_filled(center_x: float, center_y: float,
          RGBA format.
         :angle: Angle in degrees to tilt the ellipse.
         :num_segments: float of triangle segments that make up this
-         circle. Higher is better quality, but slower render time.
+         circle. Higher is better quality, but slower render time. By
+         default it depends on how big the ellipse is on screen.
     Returns:
         None
     Raises:
@@ -733,27 +1203,16 @@ def draw_ellipse_filled(center_x: float, center_y: float,
     >>> arcade.finish_render()
     >>> arcade.quick_run(0.25)
     """
+    if _draw_batch is not None and _draw_batch.shapes is not None:
+        _draw_batch.add_shape(_draw_batch.shapes.append_ellipse(
+            center_x, center_y, width, height, color, tilt_angle=tilt_angle))
+        return
 
-    unrotated_point_list = []
-
-    for segment in range(num_segments):
-        theta = 2.0 * 3.1415926 * segment / num_segments
-
-        x = width * math.cos(theta)
-        y = height * math.sin(theta)
-
-        unrotated_point_list.append((x, y))
-
-    if tilt_angle == 0:
-        uncentered_point_list = unrotated_point_list
-    else:
-        uncentered_point_list = []
-        for point in unrotated_point_list:
-            uncentered_point_list.append(rotate_point(point[0], point[1], 0, 0, tilt_angle))
+    if num_segments is None:
+        num_segments = get_ellipse_segment_count(width, height)
 
-    point_list = []
-    for point in uncentered_point_list:
-        point_list.append((point[0] + center_x, point[1] + center_y))
+    point_list = _transform_points(_get_unit_circle(num_segments), width, height,
+                                   center_x, center_y, tilt_angle)
 
     _generic_draw_line_strip(point_list, color, 1, gl.GL_TRIANGLE_FAN)
 
@@ -761,7 +1220,7 @@ def draw_ellipse_filled(center_x: float, center_y: float,
 def draw_ellipse_outline(center_x: float, center_y: float, width: float,
                          height: float, color: Color,
                          border_width: float=1, tilt_angle: float=0,
-                         num_segments=128):
+                         num_segments: int=None):
     """
     Draw the outline of an ellipse.
 
@@ -774,36 +1233,323 @@ def draw_ellipse_outline(center_x: float, center_y: float, width: float,
          RGBA format.
         :border_width: Width of the circle outline in pixels.
         :tilt_angle: Angle in degrees to tilt the ellipse.
+        :num_segments: number of line segments that make up the ellipse.
+         By default it depends on how big the ellipse is on screen.
     Returns:
         None
     Raises:
         None
     """
+    if _draw_batch is not None and _draw_batch.shapes is not None:
+        _draw_batch.add_shape(_draw_batch.shapes.append_ellipse(
+            center_x, center_y, width, height, color, border_width, tilt_angle))
+        return
 
-    unrotated_point_list = []
+    if num_segments is None:
+        num_segments = get_ellipse_segment_count(width, height)
 
-    for segment in range(num_segments):
-        theta = 2.0 * 3.1415926 * segment / num_segments
+    point_list = _transform_points(_get_unit_circle(num_segments), width, height,
+                                   center_x, center_y, tilt_angle)
 
-        x = width * math.cos(theta)
-        y = height * math.sin(theta)
+    _generic_draw_line_strip(point_list, color, border_width, gl.GL_LINE_LOOP)
 
-        unrotated_point_list.append((x, y))
+# --- END ELLIPSE FUNCTIONS # # #
 
-    if tilt_angle == 0:
-        uncentered_point_list = unrotated_point_list
-    else:
-        uncentered_point_list = []
-        for point in unrotated_point_list:
-            uncentered_point_list.append(rotate_point(point[0], point[1], 0, 0, tilt_angle))
 
-    point_list = []
-    for point in uncentered_point_list:
-        point_list.append((point[0] + center_x, point[1] + center_y))
+# --- BEGIN BATCHING FUNCTIONS # # #
+
+# Independent primitives that each drawing mode is broken up into, so that
+# draws with different modes can share a draw call.
+_BATCH_PRIMITIVES = {
+    gl.GL_POINTS: gl.GL_POINTS,
+    gl.GL_LINES: gl.GL_LINES,
+    gl.GL_LINE_STRIP: gl.GL_LINES,
+    gl.GL_LINE_LOOP: gl.GL_LINES,
+    gl.GL_TRIANGLES: gl.GL_TRIANGLES,
+    gl.GL_TRIANGLE_STRIP: gl.GL_TRIANGLES,
+    gl.GL_TRIANGLE_FAN: gl.GL_TRIANGLES,
+    gl.GL_POLYGON: gl.GL_TRIANGLES,
+}
+
+# Mode of the draw batch runs of textured rectangles
+_TEXTURED_QUADS = 'textured quads'
+
+# Vertices per primitive
+_BATCH_PRIMITIVE_SIZES = {
+    gl.GL_POINTS: 1,
+    gl.GL_LINES: 2,
+    gl.GL_TRIANGLES: 3,
+}
+
+
+def _get_primitive_indices(mode: int, count: int):
+    """
+    The indices that turn ``count`` vertices drawn with ``mode`` into the
+    vertices of independent points, lines or triangles. None if they
+    already are.
+    """
+    if mode == gl.GL_LINE_STRIP:
+        i = np.arange(count - 1)
+        return np.stack((i, i + 1), axis=1).ravel()
+    if mode == gl.GL_LINE_LOOP:
+        i = np.arange(count if count > 2 else count - 1)
+        return np.stack((i, (i + 1) % count), axis=1).ravel()
+    if mode == gl.GL_TRIANGLE_STRIP:
+        i = np.arange(count - 2)
+        return np.stack((i, i + 1, i + 2), axis=1).ravel()
+    if mode in (gl.GL_TRIANGLE_FAN, gl.GL_POLYGON):
+        i = np.arange(1, count - 1)
+        return np.stack((np.zeros_like(i), i, i + 1), axis=1).ravel()
+    return None
+
+
+class DrawBatch:
+    """
+    Collects the vertices of immediate mode drawing commands, so they can
+    be drawn together.
+
+    Strips, fans, loops and polygons are broken up into independent
+    lines and triangles. Consecutive commands drawing the same kind of
+    primitive with the same line width are then drawn with one call.
+    Commands are always drawn in the order they were given.
+
+    With ``instanced_shapes``, circles, ellipses, rectangles and lines go
+    to the ``shapes`` ShapeInstanceList instead, and are drawn as one quad
+    each. Textured rectangles always go to ``textured_quads``, so they are
+    drawn together from the texture atlas.
+
+    Use ``set_draw_batching`` rather than making one of these.
+    """
+
+    def __init__(self, instanced_shapes: bool=False):
+        self.vertices = np.zeros(1024, dtype=_line_vertex_type)
+        self.vertex_count = 0
+        # [mode, line_width, first vertex, vertex count] of each draw call.
+        # The mode of a run of shapes is None, and of textured rectangles
+        # _TEXTURED_QUADS. These count shapes and rectangles. Textured
+        # rectangles keep whether they are transparent in place of the
+        # line width.
+        self.runs = []
+        self.vbo = None
+        self.vao = None
+        self.program = None
+        self.context = None
+
+        self.shapes = None
+        if instanced_shapes:
+            from arcade.shape_instances import ShapeInstanceList
+            self.shapes = ShapeInstanceList()
+        self.textured_quads = None
+
+    def add(self, point_list: PointList, color: Color, line_width: float, mode: int):
+        """
+        Add the vertices of a drawing command.
+        """
+        primitive = _BATCH_PRIMITIVES[mode]
+        points = _get_point_array(point_list)
+        colors = _get_color_array(color, len(points))
+        indices = _get_primitive_indices(mode, len(points))
+        if indices is not None:
+            points = points[indices]
+            if colors.ndim == 2:
+                colors = colors[indices]
+
+        size = _BATCH_PRIMITIVE_SIZES[primitive]
+        count = len(points) - len(points) % size
+        if count <= 0:
+            return
+        if primitive == gl.GL_TRIANGLES:
+            # The width doesn't change triangles, so don't let it split them up
+            line_width = 1
+
+        first = self.vertex_count
+        if first + count > len(self.vertices):
+            vertices = np.zeros(max(2 * len(self.vertices), first + count), dtype=_line_vertex_type)
+            vertices[:first] = self.vertices[:first]
+            self.vertices = vertices
+        self.vertices['vertex'][first:first + count] = points[:count]
+        self.vertices['color'][first:first + count] = colors[:count] if colors.ndim == 2 else colors
+        self.vertex_count += count
+
+        if self.runs and self.runs[-1][0] == primitive and self.runs[-1][1] == line_width:
+            self.runs[-1][3] += count
+        else:
+            self.runs.append([primitive, line_width, first, count])
+
+    def add_shape(self, index: int):
+        """
+        Add the shape that was just appended to ``shapes`` at ``index``.
+        """
+        if self.runs and self.runs[-1][0] is None:
+            self.runs[-1][3] += 1
+        else:
+            self.runs.append([None, None, index, 1])
+
+    def add_textured_quad(self, center_x: float, center_y: float, width: float, height: float,
+                          texture: Texture, angle: float, color: Color,
+                          mirrored: bool=False, flipped: bool=False, transparent: bool=True):
+        """
+        Add a rectangle showing a texture.
+        """
+        if self.textured_quads is None:
+            from arcade.texture_atlas import TexturedQuadList
+            self.textured_quads = TexturedQuadList()
+
+        index = self.textured_quads.append(center_x, center_y, width, height, texture, angle, color,
+                                           mirrored, flipped)
+        if self.runs and self.runs[-1][0] == _TEXTURED_QUADS and self.runs[-1][1] == transparent:
+            self.runs[-1][3] += 1
+        else:
+            self.runs.append([_TEXTURED_QUADS, transparent, index, 1])
+
+    def flush(self):
+        """
+        Draw the collected vertices and shapes, and start over.
+        """
+        if not self.runs:
+            return
+
+        if self.vertex_count:
+            self._upload_vertices()
 
-    _generic_draw_line_strip(point_list, color, border_width, gl.GL_LINE_LOOP)
+        # Drawing the shapes flushes the batch again, which has to find it empty
+        runs = self.runs
+        self.runs = []
+        for mode, line_width, first, count in runs:
+            if mode is None:
+                self.shapes.draw(first, count)
+                continue
+            if mode == _TEXTURED_QUADS:
+                self.textured_quads.draw(first, count, blend=line_width)
+                continue
 
-# --- END ELLIPSE FUNCTIONS # # #
+            with self.vao:
+                self.program['Projection'] = get_projection().flatten()
+
+                gl.glEnable(gl.GL_BLEND)
+                gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+                gl.glEnable(gl.GL_LINE_SMOOTH)
+                gl.glHint(gl.GL_LINE_SMOOTH_HINT, gl.GL_NICEST)
+                gl.glHint(gl.GL_POLYGON_SMOOTH_HINT, gl.GL_NICEST)
+                gl.glLineWidth(line_width)
+                gl.glPointSize(line_width)
+
+                self.vao.render(mode, first=first, vertices=count)
+
+        self.vertex_count = 0
+        if self.shapes is not None:
+            self.shapes.clear()
+        if self.textured_quads is not None:
+            self.textured_quads.clear()
+
+    def _upload_vertices(self):
+        context = gl.current_context
+        vertex_bytes = self.vertex_count * _line_vertex_type.itemsize
+        if self.vbo is None or self.vbo.size < vertex_bytes or self.context is not context:
+            self.context = context
+            self.program = shader.program(
+                vertex_shader=line_vertex_shader,
+                fragment_shader=line_fragment_shader,
+            )
+            self.vbo = shader.Buffer.create_with_size(self.vertices.nbytes, usage='stream')
+            vbo_desc = shader.BufferDescription(
+                self.vbo,
+                '2f 4B',
+                ('in_vert', 'in_color'),
+                normalized=['in_color']
+            )
+            self.vao = shader.vertex_array(self.program, [vbo_desc])
+
+        self.vbo.orphan()
+        self.vbo.write(self.vertices[:self.vertex_count].tobytes())
+
+
+_draw_batch = None
+
+
+def set_draw_batching(enabled: bool=True, instanced_shapes: bool=False):
+    """
+    Turn batching of the immediate mode drawing commands on or off.
+
+    While it is on, commands such as ``draw_line`` or
+    ``draw_circle_filled`` don't draw right away. What they draw is
+    collected, and drawn with as few draw calls as possible when
+    ``finish_render`` is called, and before sprites, shapes or text are
+    drawn. ``flush_draw_batch`` draws it at any other time.
+
+    With ``instanced_shapes``, circles, ellipses, rectangles and lines
+    are drawn as single quads shaded from their signed distance, instead
+    of being split into triangles and lines.
+    """
+    global _draw_batch
+    if _draw_batch is not None:
+        _draw_batch.flush()
+        _draw_batch = None
+    if enabled:
+        _draw_batch = DrawBatch(instanced_shapes)
+
+
+def flush_draw_batch():
+    """
+    Draw whatever the batched drawing commands have collected so far.
+    Does nothing if batching is off.
+    """
+    if _draw_batch is not None:
+        _draw_batch.flush()
+
+
+_textured_quads = None
+
+
+def _get_tiles(center_x: float, center_y: float, width: float, height: float, angle: float,
+               repeat_count_x: int, repeat_count_y: int) -> List[Tuple[float, float, float, float]]:
+    """
+    The (center_x, center_y, width, height) of each tile of a rectangle
+    tiled ``repeat_count_x`` by ``repeat_count_y`` times, turned with it.
+    """
+    if repeat_count_x == 1 and repeat_count_y == 1:
+        return [(center_x, center_y, width, height)]
+
+    tile_width = width / repeat_count_x
+    tile_height = height / repeat_count_y
+    tiles = []
+    for row in range(repeat_count_y):
+        for column in range(repeat_count_x):
+            x = center_x - width / 2 + (column + 0.5) * tile_width
+            y = center_y - height / 2 + (row + 0.5) * tile_height
+            if angle:
+                x, y = rotate_point(x, y, center_x, center_y, angle)
+            tiles.append((x, y, tile_width, tile_height))
+    return tiles
+
+
+def _draw_textured_quad(center_x: float, center_y: float, width: float, height: float,
+                        texture: Texture, angle: float, color: Color,
+                        mirrored: bool=False, flipped: bool=False, transparent: bool=True,
+                        repeat_count_x: int=1, repeat_count_y: int=1):
+    """
+    Draw a rectangle showing a texture from the texture atlas, or add it
+    to the draw batch. Textures in the atlas can't wrap, so repeats are
+    drawn as a rectangle for each tile.
+    """
+    global _textured_quads
+    tiles = _get_tiles(center_x, center_y, width, height, angle, repeat_count_x, repeat_count_y)
+    if _draw_batch is not None:
+        for x, y, tile_width, tile_height in tiles:
+            _draw_batch.add_textured_quad(x, y, tile_width, tile_height, texture, angle, color,
+                                          mirrored, flipped, transparent)
+        return
+
+    if _textured_quads is None:
+        from arcade.texture_atlas import TexturedQuadList
+        _textured_quads = TexturedQuadList()
+    _textured_quads.clear()
+    for x, y, tile_width, tile_height in tiles:
+        _textured_quads.append(x, y, tile_width, tile_height, texture, angle, color, mirrored, flipped)
+    _textured_quads.draw(blend=transparent)
+
+
+# --- END BATCHING FUNCTIONS # # #
 
 
 # --- BEGIN LINE FUNCTIONS # # #
@@ -827,27 +1573,31 @@ def _generic_draw_line_strip(point_list: PointList,
     Raises:
         None
     """
+    if _draw_batch is not None:
+        _draw_batch.add(point_list, color, line_width, mode)
+        return
+
     program = shader.program(
         vertex_shader=line_vertex_shader,
         fragment_shader=line_fragment_shader,
     )
-    buffer_type = np.dtype([('vertex', '2f4'), ('color', '4B')])
-    data = np.zeros(len(point_list), dtype=buffer_type)
-
-    data['vertex'] = point_list
-
-    color = get_four_byte_color(color)
-    data['color'] = color
-
-    vbo = shader.buffer(data.tobytes())
-    vbo_desc = shader.BufferDescription(
-        vbo,
-        '2f 4B',
-        ('in_vert', 'in_color'),
-        normalized=['in_color']
-    )
-
-    vao_content = [vbo_desc]
+    points = _get_point_array(point_list)
+    colors = _get_color_array(color, len(points))
+
+    # The points and colors are uploaded as they are. A single color is
+    # one instance, which every vertex reads.
+    vbo = shader.buffer(points)
+    color_vbo = shader.buffer(colors)
+    vao_content = [
+        shader.BufferDescription(vbo, '2f', ('in_vert',)),
+        shader.BufferDescription(
+            color_vbo,
+            '4B',
+            ('in_color',),
+            normalized=['in_color'],
+            instanced=colors.ndim == 1
+        ),
+    ]
 
     vao = shader.vertex_array(program, vao_content)
     with vao:
@@ -871,8 +1621,10 @@ def draw_line_strip(point_list: PointList,
     Draw a multi-point line.
 
     Args:
-        point_list:
-        color:
+        point_list: List of points, or an (N, 2) float32 array which is
+         uploaded without a copy.
+        color: One color, or an (N, 4) uint8 array with a color for
+         each point.
         line_width:
     """
     _generic_draw_line_strip(point_list, color, line_width, gl.GL_LINE_STRIP)
@@ -897,6 +1649,10 @@ def draw_line(start_x: float, start_y: float, end_x: float, end_y: float,
         None
 
     """
+    if _draw_batch is not None and _draw_batch.shapes is not None:
+        _draw_batch.add_shape(_draw_batch.shapes.append_line(
+            start_x, start_y, end_x, end_y, color, line_width))
+        return
 
     points = (start_x, start_y), (end_x, end_y)
     draw_line_strip(points, color, line_width)
@@ -912,9 +1668,11 @@ def draw_lines(point_list: PointList,
 
     Args:
         :point_list: List of points making up the lines. Each point is
-         in a list. So it is a list of lists.
+         in a list. So it is a list of lists, or an
+         (N, 2) float32 array which is uploaded without a copy.
         :color: color, specified in a list of 3 or 4 bytes in RGB or
-         RGBA format.
+         RGBA format, or an (N, 4) uint8 array with a color for each
+         point.
         :border_width: Width of the line in pixels.
     Returns:
         None
@@ -954,9 +1712,11 @@ def draw_points(point_list: PointList,
 
     Args:
         :point_list: List of points Each point is
-         in a list. So it is a list of lists.
+         in a list. So it is a list of lists, or an
+         (N, 2) float32 array which is uploaded without a copy.
         :color: color, specified in a list of 3 or 4 bytes in RGB or
-         RGBA format.
+         RGBA format, or an (N, 4) uint8 array with a color for each
+         point.
         :size: Size of the point in pixels.
     Returns:
         None
@@ -978,9 +1738,11 @@ def draw_polygon_filled(point_list: PointList,
 
     Args:
         :point_list: List of points making up the lines. Each point is
-         in a list. So it is a list of lists.
+         in a list. So it is a list of lists, or an
+         (N, 2) float32 array which is uploaded without a copy.
         :color: color, specified in a list of 3 or 4 bytes in RGB or
-         RGBA format.
+         RGBA format, or an (N, 4) uint8 array with a color for each
+         point.
     Returns:
         None
     Raises:
@@ -1190,6 +1952,10 @@ def draw_rectangle_outline(center_x: float, center_y: float, width: float,
     Raises:
         None
     """
+    if _draw_batch is not None and _draw_batch.shapes is not None:
+        _draw_batch.add_shape(_draw_batch.shapes.append_rectangle(
+            center_x, center_y, width, height, color, border_width, tilt_angle))
+        return
 
     p1 = -width // 2 + center_x, -height // 2 + center_y
     p2 = width // 2 + center_x, -height // 2 + center_y
@@ -1307,6 +2073,11 @@ def draw_rectangle_filled(center_x: float, center_y: float, width: float,
     >>> arcade.finish_render()
     >>> arcade.quick_run(0.25)
     """
+    if _draw_batch is not None and _draw_batch.shapes is not None:
+        _draw_batch.add_shape(_draw_batch.shapes.append_rectangle(
+            center_x, center_y, width, height, color, tilt_angle=tilt_angle))
+        return
+
     p1 = -width // 2 + center_x, -height // 2 + center_y
     p2 = width // 2 + center_x, -height // 2 + center_y
     p3 = width // 2 + center_x, height // 2 + center_y
@@ -1336,6 +2107,9 @@ def draw_texture_rectangle(center_x: float, center_y: float, width: float,
         :texture: identifier of texture returned from load_texture() call
         :angle: rotation of the rectangle. Defaults to zero.
         :alpha: Transparency of image.
+        :transparent: Set to False to draw the texture without blending.
+        :repeat_count_x: How many times the texture is repeated across.
+        :repeat_count_y: How many times the texture is repeated up.
     Returns:
         None
     Raises:
@@ -1361,8 +2135,7 @@ def draw_texture_rectangle(center_x: float, center_y: float, width: float,
     >>> arcade.quick_run(0.25)
     """
 
-    texture.draw(center_x, center_y, width,
-                 height, angle, alpha,
+    texture.draw(center_x, center_y, width, height, angle, alpha, transparent,
                  repeat_count_x, repeat_count_y)
 
 
@@ -1382,6 +2155,9 @@ def draw_xywh_rectangle_textured(bottom_left_x: float, bottom_left_y: float,
         :texture: identifier of texture returned from load_texture() call
         :angle: rotation of the rectangle. Defaults to zero.
         :alpha: Transparency of image.
+        :transparent: Set to False to draw the texture without blending.
+        :repeat_count_x: How many times the texture is repeated across.
+        :repeat_count_y: How many times the texture is repeated up.
     Returns:
         None
     Raises:
@@ -1407,6 +2183,7 @@ def get_pixel(x: int, y: int):
     """
     Given an x, y, will return RGB color value of that point.
     """
+    flush_draw_batch()
     a = (gl.GLubyte * 3)(0)
     gl.glReadPixels(x, y, 1, 1, gl.GL_RGB, gl.GL_UNSIGNED_BYTE, a)
     red = a[0]
@@ -1415,6 +2192,70 @@ def get_pixel(x: int, y: int):
     return (red, green, blue)
 
 
+def _read_pixels(x: int, y: int, width: int, height: int, components: int=4) -> np.ndarray:
+    """
+    Read a region of the screen into a (height, width, components) array,
+    bottom row first, the way the GL gives it.
+    """
+    if components not in (3, 4):
+        raise ValueError(f"components should be 3 or 4. Not {components}")
+    pixels = np.empty((height, width, components), dtype=np.uint8)
+    pixel_format = gl.GL_RGB if components == 3 else gl.GL_RGBA
+    gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 1)
+    gl.glReadPixels(x, y, width, height, pixel_format, gl.GL_UNSIGNED_BYTE,
+                    pixels.ctypes.data_as(ctypes.c_void_p))
+    gl.glPixelStorei(gl.GL_PACK_ALIGNMENT, 4)
+    return pixels
+
+
+def read_pixels(x: int=0, y: int=0, width: int=None, height: int=None,
+                components: int=4) -> np.ndarray:
+    """
+    Read a region of the screen with one ``glReadPixels``, as a
+    (height, width, components) uint8 array with the top row first, like
+    ``get_image``. The rows are turned over with a view, not a copy.
+
+    Args:
+        :x: Left of the region.
+        :y: Bottom of the region.
+        :width: Width of the region, to the right of the window if None.
+        :height: Height of the region, to the top of the window if None.
+        :components: 3 for RGB, or 4 for RGBA.
+    """
+    flush_draw_batch()
+
+    if width is None or height is None:
+        window = get_window()
+        if width is None:
+            width = window.width - x
+        if height is None:
+            height = window.height - y
+
+    return _read_pixels(x, y, width, height, components)[::-1]
+
+
+def get_pixels(point_list: PointList, components: int=3) -> np.ndarray:
+    """
+    The colors of many points of the screen, as an (N, components) uint8
+    array. The smallest region holding all the points is read once,
+    instead of once for each point like ``get_pixel``.
+
+    Args:
+        :point_list: (x, y) pixel coordinates, as a list or an (N, 2) array.
+        :components: 3 for RGB, or 4 for RGBA.
+    """
+    flush_draw_batch()
+
+    points = np.asarray(point_list).reshape(-1, 2).astype(np.intp)
+    if len(points) == 0:
+        return np.empty((0, components), dtype=np.uint8)
+    min_x, min_y = points.min(axis=0)
+    max_x, max_y = points.max(axis=0)
+    pixels = _read_pixels(int(min_x), int(min_y), int(max_x - min_x + 1), int(max_y - min_y + 1),
+                          components)
+    return pixels[points[:, 1] - min_y, points[:, 0] - min_x]
+
+
 def get_image(x=0, y=0, width=None, height=None):
     """
     Get an image from the screen.
@@ -1424,6 +2265,8 @@ def get_image(x=0, y=0, width=None, height=None):
     image.save('screenshot.png', 'PNG')
     """
 
+    flush_draw_batch()
+
     # Get the dimensions
     window = get_window()
     if width is None:
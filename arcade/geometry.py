@@ -2,13 +2,22 @@
 Functions for calculating geometry.
 """
 
+import math
+from collections import namedtuple
+
+from arcade.collision_grid import CollisionGrid
+from arcade.sprite import COLLISION_MASK_ALL
 from arcade.sprite import Sprite
 from arcade.sprite_list import SpriteList
 from typing import List
+from typing import Optional
+from typing import Tuple
 from arcade.arcade_types import PointList
 
 PRECISION = 2
 
+SweptCollision = namedtuple('SweptCollision', 'time, normal, sprite')
+
 
 def are_polygons_intersecting(poly_a: PointList,
                               poly_b: PointList) -> bool:
@@ -71,9 +80,163 @@ def are_polygons_intersecting(poly_a: PointList,
     return True
 
 
+def is_point_in_polygon(x: float, y: float, polygon_point_list: PointList) -> bool:
+    """
+    Return True if a point is inside a polygon.
+
+    >>> triangle = ((0, 0), (10, 0), (10, 10))
+    >>> is_point_in_polygon(8, 2, triangle), is_point_in_polygon(2, 8, triangle)
+    (True, False)
+    """
+    inside = False
+    point_count = len(polygon_point_list)
+    for i in range(point_count):
+        x1, y1 = polygon_point_list[i]
+        x2, y2 = polygon_point_list[(i + 1) % point_count]
+        # Count the edges a ray going right from the point crosses
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def get_segment_polygon_intersection(start: Tuple[float, float], end: Tuple[float, float],
+                                     polygon_point_list: PointList) -> Optional[float]:
+    """
+    How far along the segment from ``start`` to ``end``, as a fraction
+    from 0 to 1, it first touches the polygon. 0 if it starts inside the
+    polygon, None if it misses it.
+
+    >>> square = ((10, -5), (20, -5), (20, 5), (10, 5))
+    >>> get_segment_polygon_intersection((0, 0), (40, 0), square)
+    0.25
+    >>> get_segment_polygon_intersection((0, 0), (0, 40), square) is None
+    True
+    """
+    if is_point_in_polygon(start[0], start[1], polygon_point_list):
+        return 0.0
+
+    start_x, start_y = start
+    direction_x = end[0] - start_x
+    direction_y = end[1] - start_y
+
+    result = None
+    point_count = len(polygon_point_list)
+    for i in range(point_count):
+        x1, y1 = polygon_point_list[i]
+        x2, y2 = polygon_point_list[(i + 1) % point_count]
+        edge_x = x2 - x1
+        edge_y = y2 - y1
+
+        denominator = direction_x * edge_y - direction_y * edge_x
+        if denominator == 0:
+            # Parallel, it can only touch this edge where it meets another one
+            continue
+
+        offset_x = x1 - start_x
+        offset_y = y1 - start_y
+        t = (offset_x * edge_y - offset_y * edge_x) / denominator
+        u = (offset_x * direction_y - offset_y * direction_x) / denominator
+        if 0 <= t <= 1 and 0 <= u <= 1 and (result is None or t < result):
+            result = t
+
+    return result
+
+
+def _get_polygon_axes(poly_a: PointList, poly_b: PointList):
+    """
+    Yield each separating axis candidate of two polygons along with the
+    projections of both polygons on it, as (normal, min_a, max_a, min_b, max_b).
+    """
+    for polygon in (poly_a, poly_b):
+        for i1 in range(len(polygon)):
+            i2 = (i1 + 1) % len(polygon)
+            projection_1 = polygon[i1]
+            projection_2 = polygon[i2]
+
+            normal = (projection_2[1] - projection_1[1],
+                      projection_1[0] - projection_2[0])
+            if normal[0] == 0 and normal[1] == 0:
+                continue
+
+            projected_a = [normal[0] * point[0] + normal[1] * point[1] for point in poly_a]
+            projected_b = [normal[0] * point[0] + normal[1] * point[1] for point in poly_b]
+
+            yield normal, min(projected_a), max(projected_a), min(projected_b), max(projected_b)
+
+
+def get_minimum_translation_vector(poly_a: PointList,
+                                   poly_b: PointList) -> Optional[Tuple[float, float]]:
+    """
+    Return the shortest (x, y) move that takes ``poly_a`` out of ``poly_b``,
+    or None if the polygons don't intersect.
+
+    >>> poly1 = ((0, 0), (10, 0), (10, 10), (0, 10))
+    >>> poly2 = ((8, -5), (20, -5), (20, 20), (8, 20))
+    >>> get_minimum_translation_vector(poly1, poly2)
+    (-2.0, 0.0)
+    >>> print(get_minimum_translation_vector(poly1, ((11, 0), (12, 0), (12, 1))))
+    None
+    """
+    best_distance = None
+    best_vector = None
+
+    for normal, min_a, max_a, min_b, max_b in _get_polygon_axes(poly_a, poly_b):
+        if max_a <= min_b or max_b <= min_a:
+            return None
+
+        length = math.hypot(normal[0], normal[1])
+        if max_a - min_b < max_b - min_a:
+            distance = (max_a - min_b) / length
+            direction = -1
+        else:
+            distance = (max_b - min_a) / length
+            direction = 1
+
+        if best_distance is None or distance < best_distance:
+            best_distance = distance
+            # Adding 0.0 turns a negative zero into a plain zero.
+            best_vector = (direction * distance * normal[0] / length + 0.0,
+                           direction * distance * normal[1] / length + 0.0)
+
+    return best_vector
+
+
+def get_separation_distance(poly_a: PointList, poly_b: PointList,
+                            direction_x: float, direction_y: float) -> float:
+    """
+    Return how far ``poly_a`` has to move along the unit vector
+    (direction_x, direction_y) to stop intersecting ``poly_b``. This is the
+    minimum translation, restricted to one direction. Returns 0 if the
+    polygons don't intersect, and infinity if moving that way never
+    separates them.
+
+    >>> floor = ((0, 0), (100, 0), (100, 10), (0, 10))
+    >>> player = ((10, 7), (20, 7), (20, 17), (10, 17))
+    >>> get_separation_distance(player, floor, 0, 1)
+    3.0
+    >>> ramp = ((0, 0), (100, 0), (100, 100))
+    >>> get_separation_distance(((40, 30), (50, 30), (50, 40), (40, 40)), ramp, 0, 1)
+    20.0
+    """
+    result = float('inf')
+
+    for normal, min_a, max_a, min_b, max_b in _get_polygon_axes(poly_a, poly_b):
+        if max_a <= min_b or max_b <= min_a:
+            return 0.0
+
+        speed = normal[0] * direction_x + normal[1] * direction_y
+        if speed > 0:
+            result = min(result, (max_b - min_a) / speed)
+        elif speed < 0:
+            result = min(result, (min_b - max_a) / speed)
+
+    return result
+
+
 def check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     """
-    Check for a collision between two sprites.
+    Check for a collision between two sprites. Sprites whose collision
+    categories and masks don't allow them to collide never do.
 
     >>> import arcade
     >>> scale = 1
@@ -102,6 +265,10 @@ def check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     elif not isinstance(sprite2, Sprite):
         raise TypeError("Parameter 2 is not an instance of the Sprite class.")
 
+    if sprite1.collision_category & sprite2.collision_mask == 0 or \
+            sprite2.collision_category & sprite1.collision_mask == 0:
+        return False
+
     return _check_for_collision(sprite1, sprite2)
 
 
@@ -130,10 +297,24 @@ def _check_for_collision(sprite1: Sprite, sprite2: Sprite) -> bool:
     return are_polygons_intersecting(sprite1.points, sprite2.points)
 
 
+def _filter_by_collision_masks(sprite1: Sprite, sprite_list: SpriteList, sprite_list_to_check):
+    """
+    Drop the candidates that ``sprite1`` isn't allowed to collide with,
+    before any geometry is checked. Does nothing for lists that don't use
+    collision masks.
+    """
+    if not sprite_list.use_collision_masks and sprite1.collision_mask == COLLISION_MASK_ALL:
+        return sprite_list_to_check
+    if sprite_list_to_check is sprite_list or sprite_list_to_check is sprite_list.sprite_list:
+        return sprite_list.filter_collision_candidates(sprite1)
+    return sprite_list.filter_collision_candidates(sprite1, sprite_list_to_check)
+
+
 def check_for_collision_with_list(sprite1: Sprite,
                                   sprite_list: SpriteList) -> List[Sprite]:
     """
     Check for a collision between a sprite, and a list of sprites.
+    ``sprite_list`` may also be a ``CollisionGrid``.
 
     >>> import arcade
     >>> scale = 1
@@ -156,6 +337,8 @@ def check_for_collision_with_list(sprite1: Sprite,
     """
     if not isinstance(sprite1, Sprite):
         raise TypeError("Parameter 1 is not an instance of the Sprite class.")
+    if isinstance(sprite_list, CollisionGrid):
+        return sprite_list.probe(sprite1)
     if not isinstance(sprite_list, SpriteList):
         raise TypeError(f"Parameter 2 is a {type(sprite_list)} instead of expected SpriteList.")
 
@@ -164,6 +347,7 @@ def check_for_collision_with_list(sprite1: Sprite,
         # checks_saved = len(sprite_list) - len(sprite_list_to_check)
     else:
         sprite_list_to_check = sprite_list
+    sprite_list_to_check = _filter_by_collision_masks(sprite1, sprite_list, sprite_list_to_check)
 
     collision_list = []
     for sprite2 in sprite_list_to_check:
@@ -171,3 +355,195 @@ def check_for_collision_with_list(sprite1: Sprite,
             if _check_for_collision(sprite1, sprite2):
                 collision_list.append(sprite2)
     return collision_list
+
+
+def probe_for_collision_with_list(sprite1: Sprite,
+                                  sprite_list: SpriteList,
+                                  offset_x: float = 0,
+                                  offset_y: float = 0) -> List[Sprite]:
+    """
+    Return the sprites in a list that ``sprite1`` would collide with if it
+    were moved by (offset_x, offset_y).
+
+    Unlike moving the sprite, checking, and moving it back, this leaves the
+    sprite, its sprite lists and their spatial hashes untouched.
+    ``sprite_list`` may also be a ``CollisionGrid``.
+
+    >>> import arcade
+    >>> sprite_list = arcade.SpriteList(use_spatial_hash=False)
+    >>> wall = arcade.Sprite(center_x=20)
+    >>> wall.width = wall.height = 10
+    >>> sprite_list.append(wall)
+    >>> player = arcade.Sprite()
+    >>> player.width = player.height = 10
+    >>> len(probe_for_collision_with_list(player, sprite_list))
+    0
+    >>> len(probe_for_collision_with_list(player, sprite_list, 12, 0))
+    1
+    >>> player.center_x
+    0
+    """
+    if not isinstance(sprite1, Sprite):
+        raise TypeError("Parameter 1 is not an instance of the Sprite class.")
+    if isinstance(sprite_list, CollisionGrid):
+        return sprite_list.probe(sprite1, offset_x, offset_y)
+    if not isinstance(sprite_list, SpriteList):
+        raise TypeError(f"Parameter 2 is a {type(sprite_list)} instead of expected SpriteList.")
+
+    if sprite_list.use_spatial_hash:
+        sprite_list_to_check = sprite_list.spatial_hash.get_objects_for_rect(
+            sprite1.left + offset_x, sprite1.right + offset_x,
+            sprite1.bottom + offset_y, sprite1.top + offset_y)
+    else:
+        sprite_list_to_check = sprite_list
+    sprite_list_to_check = _filter_by_collision_masks(sprite1, sprite_list, sprite_list_to_check)
+
+    return _probe_for_collision(sprite1, sprite_list_to_check, offset_x, offset_y)
+
+
+def _probe_for_collision(sprite1: Sprite, sprite_list_to_check, offset_x: float, offset_y: float) -> List[Sprite]:
+    """
+    Narrow phase of ``probe_for_collision_with_list``, for callers that have
+    already gathered the sprites worth checking.
+    """
+    points = [(point[0] + offset_x, point[1] + offset_y) for point in sprite1.points]
+    position_x = sprite1.position[0] + offset_x
+    position_y = sprite1.position[1] + offset_y
+
+    collision_list = []
+    for sprite2 in sprite_list_to_check:
+        if sprite2 is sprite1 or sprite2 in collision_list:
+            continue
+
+        collision_radius_sum = sprite1.collision_radius + sprite2.collision_radius
+        diff_x = position_x - sprite2.position[0]
+        diff_y = position_y - sprite2.position[1]
+        if diff_x * diff_x + diff_y * diff_y > collision_radius_sum * collision_radius_sum:
+            continue
+
+        if are_polygons_intersecting(points, sprite2.points):
+            collision_list.append(sprite2)
+
+    return collision_list
+
+
+def get_swept_box_collision(box: Tuple[float, float, float, float],
+                            change_x: float, change_y: float,
+                            other_box: Tuple[float, float, float, float]):
+    """
+    Sweep an axis-aligned box along (change_x, change_y) against a static box.
+
+    Boxes are given as (left, right, bottom, top). Returns a tuple with the
+    time of impact, as a fraction of the move between 0 and 1, and the contact
+    normal. Returns None if the boxes don't touch during the move, or if they
+    already overlap when the move starts.
+
+    >>> box = (0, 10, 0, 10)
+    >>> wall = (50, 52, -100, 100)
+    >>> get_swept_box_collision(box, 100, 0, wall)
+    (0.4, (-1, 0))
+    >>> print(get_swept_box_collision(box, 30, 0, wall))
+    None
+    >>> print(get_swept_box_collision(box, 0, 100, wall))
+    None
+    """
+    left, right, bottom, top = box
+    other_left, other_right, other_bottom, other_top = other_box
+
+    if change_x > 0:
+        entry_x = (other_left - right) / change_x
+        exit_x = (other_right - left) / change_x
+    elif change_x < 0:
+        entry_x = (other_right - left) / change_x
+        exit_x = (other_left - right) / change_x
+    elif right <= other_left or left >= other_right:
+        return None
+    else:
+        entry_x = float('-inf')
+        exit_x = float('inf')
+
+    if change_y > 0:
+        entry_y = (other_bottom - top) / change_y
+        exit_y = (other_top - bottom) / change_y
+    elif change_y < 0:
+        entry_y = (other_top - bottom) / change_y
+        exit_y = (other_bottom - top) / change_y
+    elif top <= other_bottom or bottom >= other_top:
+        return None
+    else:
+        entry_y = float('-inf')
+        exit_y = float('inf')
+
+    entry_time = max(entry_x, entry_y)
+    exit_time = min(exit_x, exit_y)
+
+    # Overlapping at the start is left to the regular overlap checks,
+    # grazing a corner (entry == exit) is not a hit.
+    if entry_time < 0 or entry_time >= 1 or entry_time >= exit_time:
+        return None
+
+    if entry_x > entry_y:
+        normal = (-1 if change_x > 0 else 1, 0)
+    else:
+        normal = (0, -1 if change_y > 0 else 1)
+
+    return entry_time, normal
+
+
+def get_swept_collision_with_list(sprite1: Sprite,
+                                  sprite_list: SpriteList,
+                                  change_x: float,
+                                  change_y: float) -> Optional[SweptCollision]:
+    """
+    Find the first sprite in a list that ``sprite1`` would run into if it
+    moved by (change_x, change_y).
+
+    Collisions are computed on the axis-aligned bounding boxes of the
+    sprites, so a fast sprite can't skip over a thin wall the way it can
+    when moving first and testing for overlap afterwards. Sprites that
+    already overlap ``sprite1`` are ignored.
+
+    Returns a ``SweptCollision`` with the time of impact (0 to 1, as a
+    fraction of the move), the contact normal and the sprite hit, or None.
+    ``sprite_list`` may also be a ``CollisionGrid``.
+    """
+    if not isinstance(sprite1, Sprite):
+        raise TypeError("Parameter 1 is not an instance of the Sprite class.")
+    if not isinstance(sprite_list, (SpriteList, CollisionGrid)):
+        raise TypeError(f"Parameter 2 is a {type(sprite_list)} instead of expected SpriteList.")
+
+    if isinstance(sprite_list, CollisionGrid) or sprite_list.use_spatial_hash:
+        left, right, bottom, top = sprite1.left, sprite1.right, sprite1.bottom, sprite1.top
+        query = sprite_list if isinstance(sprite_list, CollisionGrid) else sprite_list.spatial_hash
+        sprite_list_to_check = query.get_objects_for_rect(
+            min(left, left + change_x), max(right, right + change_x),
+            min(bottom, bottom + change_y), max(top, top + change_y))
+    else:
+        sprite_list_to_check = sprite_list
+    if isinstance(sprite_list, SpriteList):
+        sprite_list_to_check = _filter_by_collision_masks(sprite1, sprite_list, sprite_list_to_check)
+
+    return _get_swept_collision(sprite1, sprite_list_to_check, change_x, change_y)
+
+
+def _get_swept_collision(sprite1: Sprite, sprite_list_to_check,
+                         change_x: float, change_y: float) -> Optional[SweptCollision]:
+    """
+    Narrow phase of ``get_swept_collision_with_list``, for callers that have
+    already gathered the sprites worth checking.
+    """
+    box = (sprite1.left, sprite1.right, sprite1.bottom, sprite1.top)
+
+    result = None
+    checked = set()
+    for sprite2 in sprite_list_to_check:
+        if sprite2 is sprite1 or id(sprite2) in checked:
+            continue
+        checked.add(id(sprite2))
+
+        other_box = (sprite2.left, sprite2.right, sprite2.bottom, sprite2.top)
+        hit = get_swept_box_collision(box, change_x, change_y, other_box)
+        if hit is not None and (result is None or hit[0] < result.time):
+            result = SweptCollision(hit[0], hit[1], sprite2)
+
+    return result
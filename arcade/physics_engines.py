@@ -3,11 +3,234 @@
 """
 # pylint: disable=too-many-arguments, too-many-locals, too-few-public-methods
 
+import math
+import warnings
+from typing import Iterable
+from typing import List
+
+import numpy as np
+
+from arcade.collision_grid import CollisionGrid
 from arcade.geometry import check_for_collision_with_list
 from arcade.geometry import check_for_collision
+from arcade.geometry import get_minimum_translation_vector
+from arcade.geometry import get_separation_distance
+from arcade.geometry import get_swept_collision_with_list
+from arcade.geometry import probe_for_collision_with_list
+from arcade.geometry import _filter_by_collision_masks
+from arcade.geometry import _get_swept_collision
+from arcade.geometry import _probe_for_collision
 from arcade.sprite import Sprite
 from arcade.sprite_list import SpriteList
 
+# How far, in pixels, a continuous move is allowed to carry on past the
+# time of impact. Overlapping by this much lets the regular collision
+# resolution handle the contact, ramps and moving platforms included.
+CONTINUOUS_SKIN = 1.0
+
+# Extra distance added when lifting a sprite up a ramp, so floating point
+# error doesn't leave it a hair inside the slope.
+RESOLUTION_MARGIN = 0.01
+
+# How far past its own move a body's collision checks can reach: the
+# margins above, plus the probe ``can_jump`` makes under the feet.
+BROADPHASE_MARGIN = 2 + CONTINUOUS_SKIN
+
+
+def _probe(sprite: Sprite, walls, offset_x: float = 0, offset_y: float = 0) -> List[Sprite]:
+    """
+    What ``sprite`` would hit if moved by the offset. ``walls`` is either a
+    SpriteList or CollisionGrid, or a plain list of sprites already picked
+    by a broadphase.
+    """
+    if isinstance(walls, (SpriteList, CollisionGrid)):
+        return probe_for_collision_with_list(sprite, walls, offset_x, offset_y)
+    return _probe_for_collision(sprite, walls, offset_x, offset_y)
+
+
+def _get_continuous_move(sprite: Sprite, walls, change_x: float, change_y: float) -> (float, float):
+    """
+    Shorten a move so that it stops just inside the first wall the sprite
+    would hit, instead of skipping over thin walls.
+    """
+    if change_x == 0 and change_y == 0:
+        return change_x, change_y
+
+    if isinstance(walls, (SpriteList, CollisionGrid)):
+        hit = get_swept_collision_with_list(sprite, walls, change_x, change_y)
+    else:
+        hit = _get_swept_collision(sprite, walls, change_x, change_y)
+    if hit is None:
+        return change_x, change_y
+
+    length = math.hypot(change_x, change_y)
+    distance = min(length, hit.time * length + CONTINUOUS_SKIN)
+    return change_x * distance / length, change_y * distance / length
+
+
+def _move_platformer_body(sprite: Sprite, platforms, continuous: bool):
+    """
+    Move one sprite by its velocity, gravity already applied, and resolve
+    its collisions with the platforms. ``platforms`` is either a SpriteList
+    or a list of the sprites near enough to matter.
+    """
+    # --- Move in the y direction
+    change_y = sprite.change_y
+    if continuous:
+        _, change_y = _get_continuous_move(sprite, platforms, 0, change_y)
+    sprite.center_y += change_y
+
+    # Check for wall hit
+    hit_list = _probe(sprite, platforms)
+
+    # If we hit a wall, move so the edges are at the same point
+    if len(hit_list) > 0:
+        if sprite.change_y > 0:
+            for item in hit_list:
+                sprite.top = min(item.bottom, sprite.top)
+        elif sprite.change_y < 0:
+            # Lift the sprite straight up, just far enough to clear
+            # everything it landed in. For a ramp this puts it on the slope.
+            points = sprite.points
+            lift = max(get_separation_distance(points, item.points, 0, 1) for item in hit_list)
+            # Round up, so the rounding below can't sink the sprite back in
+            sprite.center_y = math.ceil((sprite.center_y + lift) * 100) / 100
+
+            for item in hit_list:
+                if item.change_x != 0:
+                    sprite.center_x += item.change_x
+        else:
+            # Collision while the sprite wasn't moving, most likely a
+            # moving platform. Take the shortest way out of each one.
+            for item in hit_list:
+                vector = get_minimum_translation_vector(sprite.points, item.points)
+                if vector is not None:
+                    sprite.center_x += vector[0]
+                    sprite.center_y += vector[1]
+        sprite.change_y = min(0.0, hit_list[0].change_y)
+
+    sprite.center_y = round(sprite.center_y, 2)
+
+    # --- Move in the x direction
+    change_x = sprite.change_x
+    if continuous:
+        change_x, _ = _get_continuous_move(sprite, platforms, change_x, 0)
+    sprite.center_x += change_x
+
+    # Check for wall hit
+    hit_list = _probe(sprite, platforms)
+
+    if len(hit_list) > 0:
+        change_x = sprite.change_x
+        if change_x != 0:
+            points = sprite.points
+
+            # See if we can "run up" a ramp: work out how far up the sprite
+            # has to go to clear what it ran into, and whether that spot is free.
+            lift = max(get_separation_distance(points, item.points, 0, 1) for item in hit_list)
+            lift += RESOLUTION_MARGIN
+            if lift <= abs(change_x) + 2 * RESOLUTION_MARGIN and len(_probe(sprite, platforms, 0, lift)) == 0:
+                sprite.center_y += lift
+            else:
+                # Can't run up, so back out of everything we ran into
+                direction = -1 if change_x > 0 else 1
+                push = max(get_separation_distance(points, item.points, direction, 0) for item in hit_list)
+                sprite.center_x += direction * push
+        else:
+            _warn_collision_while_still()
+
+
+def _warn_collision_while_still():
+    """
+    Report a sprite found inside a wall along an axis it isn't moving on.
+    """
+    warnings.warn("Collision while player wasn't moving. "
+                  "Make sure you aren't calling multiple updates, like "
+                  "a physics engine update and an all sprites list update.",
+                  RuntimeWarning, stacklevel=3)
+
+
+def _push_back(sprite: Sprite, hit_list: List[Sprite], change_x: float, change_y: float):
+    """
+    Move a sprite that moved by the change along one axis into the walls
+    in ``hit_list`` back, so its edge meets theirs.
+    """
+    if change_x > 0:
+        for item in hit_list:
+            sprite.right = min(item.left, sprite.right)
+    elif change_x < 0:
+        for item in hit_list:
+            sprite.left = max(item.right, sprite.left)
+    elif change_y > 0:
+        for item in hit_list:
+            sprite.top = min(item.bottom, sprite.top)
+    elif change_y < 0:
+        for item in hit_list:
+            sprite.bottom = max(item.top, sprite.bottom)
+    else:
+        _warn_collision_while_still()
+
+
+def _find_moving_platforms(platforms: Iterable[Sprite]) -> List[Sprite]:
+    """
+    The platforms that currently have a velocity.
+    """
+    if isinstance(platforms, CollisionGrid):
+        return []
+    return [platform for platform in platforms
+            if platform.change_x != 0 or platform.change_y != 0]
+
+
+def _move_platforms(moving_platforms: List[Sprite], riders):
+    """
+    Move the moving platforms all at once, bouncing them off their
+    boundaries and pushing aside any rider they run into. ``riders`` is a
+    SpriteList or a plain list of sprites.
+
+    Riders standing on a platform are carried along when they land on it,
+    in ``_move_platformer_body``.
+    """
+    if not moving_platforms:
+        return
+
+    nan = float('nan')
+    data = np.array([(platform.center_x, platform.center_y,
+                      platform.change_x, platform.change_y,
+                      platform.center_x - platform.left, platform.right - platform.center_x,
+                      platform.center_y - platform.bottom, platform.top - platform.center_y,
+                      nan if platform.boundary_left is None else platform.boundary_left,
+                      nan if platform.boundary_right is None else platform.boundary_right,
+                      nan if platform.boundary_bottom is None else platform.boundary_bottom,
+                      nan if platform.boundary_top is None else platform.boundary_top)
+                     for platform in moving_platforms], dtype=np.float64)
+    position, change, extent_low, extent_high, boundary_low, boundary_high = \
+        data[:, 0:2], data[:, 2:4], data[:, 4:8:2], data[:, 5:8:2], data[:, 8:12:2], data[:, 9:12:2]
+
+    position += change
+
+    # Clamp to the boundaries and turn around. Missing boundaries are NaN,
+    # which never compare true.
+    past_low = position - extent_low <= boundary_low
+    position[past_low] = (boundary_low + extent_low)[past_low]
+    change[past_low & (change < 0)] *= -1
+
+    past_high = position + extent_high >= boundary_high
+    position[past_high] = (boundary_high - extent_high)[past_high]
+    change[past_high & (change > 0)] *= -1
+
+    for platform, (center_x, center_y), (change_x, change_y) in \
+            zip(moving_platforms, position.tolist(), change.tolist()):
+        platform.set_position(center_x, center_y)
+        platform.change_x = change_x
+        platform.change_y = change_y
+
+        if change_x != 0:
+            for rider in _probe(platform, riders):
+                if change_x < 0:
+                    rider.right = platform.left
+                else:
+                    rider.left = platform.right
+
 
 class PhysicsEngineSimple:
     """
@@ -22,62 +245,39 @@ class PhysicsEngineSimple:
     >>> walls.append(wall)
     >>> engine = PhysicsEngineSimple(player, walls)
     >>> engine.update()
+
+    Set ``continuous`` to sweep the player along its movement before moving
+    it. This keeps fast sprites from passing through thin walls, without
+    having to split each update into many small steps.
+
+    ``walls`` can also be a ``CollisionGrid``, for walls laid out on a grid.
     """
 
-    def __init__(self, player_sprite: Sprite, walls: SpriteList):
+    def __init__(self, player_sprite: Sprite, walls: SpriteList, continuous: bool = False):
         """
         Constructor.
         """
         assert(isinstance(player_sprite, Sprite))
-        assert(isinstance(walls, SpriteList))
+        assert(isinstance(walls, (SpriteList, CollisionGrid)))
         self.player_sprite = player_sprite
         self.walls = walls
+        self.continuous = continuous
 
     def update(self):
         """
         Move everything and resolve collisions.
         """
-        # --- Move in the x direction
-        self.player_sprite.center_x += self.player_sprite.change_x
-
-        # Check for wall hit
-        hit_list = \
-            check_for_collision_with_list(self.player_sprite,
-                                          self.walls)
-
-        # If we hit a wall, move so the edges are at the same point
-        if len(hit_list) > 0:
-            if self.player_sprite.change_x > 0:
-                for item in hit_list:
-                    self.player_sprite.right = min(item.left,
-                                                   self.player_sprite.right)
-            elif self.player_sprite.change_x < 0:
-                for item in hit_list:
-                    self.player_sprite.left = max(item.right,
-                                                  self.player_sprite.left)
-            else:
-                print("Error, collision while player wasn't moving.")
-
-        # --- Move in the y direction
-        self.player_sprite.center_y += self.player_sprite.change_y
+        # --- Move in the x direction, then in the y direction
+        for change_x, change_y in ((self.player_sprite.change_x, 0), (0, self.player_sprite.change_y)):
+            if self.continuous:
+                change_x, change_y = _get_continuous_move(self.player_sprite, self.walls, change_x, change_y)
+            self.player_sprite.center_x += change_x
+            self.player_sprite.center_y += change_y
 
-        # Check for wall hit
-        hit_list = \
-            check_for_collision_with_list(self.player_sprite,
-                                          self.walls)
-
-        # If we hit a wall, move so the edges are at the same point
-        if len(hit_list) > 0:
-            if self.player_sprite.change_y > 0:
-                for item in hit_list:
-                    self.player_sprite.top = min(item.bottom,
-                                                 self.player_sprite.top)
-            elif self.player_sprite.change_y < 0:
-                for item in hit_list:
-                    self.player_sprite.bottom = max(item.top,
-                                                    self.player_sprite.bottom)
-            else:
-                print("Error, collision while player wasn't moving.")
+            # If we hit a wall, move so the edges are at the same point
+            hit_list = check_for_collision_with_list(self.player_sprite, self.walls)
+            if len(hit_list) > 0:
+                _push_back(self.player_sprite, hit_list, change_x, change_y)
 
 
 class PhysicsEnginePlatformer:
@@ -97,16 +297,49 @@ class PhysicsEnginePlatformer:
     >>> engine.can_jump()
     False
     >>> engine.update()
+
+    Set ``continuous`` to sweep the player along its movement before moving
+    it, so landing from a long fall can't carry it through a thin platform.
+
+    Only the platforms in ``moving_platforms`` are moved. If it isn't given,
+    it is filled with the platforms that have a velocity when the engine is
+    created. Platforms set moving or added to ``platforms`` later on are
+    not found by themselves: register them with ``add_moving_platform``,
+    and stop moving them with ``remove_moving_platform``.
+
+    ``platforms`` can also be a ``CollisionGrid``, for walls laid out on a
+    grid. A grid only holds walls that stay put.
     """
 
     def __init__(self, player_sprite: Sprite, platforms: SpriteList,
-                 gravity_constant: float = 0.5):
+                 gravity_constant: float = 0.5, continuous: bool = False,
+                 moving_platforms: Iterable[Sprite] = None):
         """
         Constructor.
         """
         self.player_sprite = player_sprite
         self.platforms = platforms
         self.gravity_constant = gravity_constant
+        self.continuous = continuous
+        if moving_platforms is None:
+            self.moving_platforms = _find_moving_platforms(platforms)
+        else:
+            self.moving_platforms = list(moving_platforms)
+
+    def add_moving_platform(self, platform: Sprite):
+        """
+        Start moving a platform by its velocity on each update. It should
+        also be in ``platforms``, for sprites to collide with it.
+        """
+        if platform not in self.moving_platforms:
+            self.moving_platforms.append(platform)
+
+    def remove_moving_platform(self, platform: Sprite):
+        """
+        Stop moving a platform. It stays in ``platforms``.
+        """
+        if platform in self.moving_platforms:
+            self.moving_platforms.remove(platform)
 
     def can_jump(self) -> bool:
         """
@@ -114,15 +347,8 @@ def can_jump(self) -> bool:
         the player_sprite. If there is a floor, the player can jump
         and we return a True.
         """
-        # --- Move in the y direction
-        self.player_sprite.center_y -= 2
-
-        # Check for wall hit
-        hit_list = \
-            check_for_collision_with_list(self.player_sprite,
-                                          self.platforms)
-
-        self.player_sprite.center_y += 2
+        # Check for a floor just below the player, without moving it
+        hit_list = probe_for_collision_with_list(self.player_sprite, self.platforms, 0, -2)
 
         if len(hit_list) > 0:
             return True
@@ -133,133 +359,134 @@ def update(self):
         """
         Move everything and resolve collisions.
         """
-        # print(f"Spot A ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-
         # --- Add gravity
         self.player_sprite.change_y -= self.gravity_constant
 
-        # --- Move in the y direction
-        self.player_sprite.center_y += self.player_sprite.change_y
+        _move_platformer_body(self.player_sprite, self.platforms, self.continuous)
+        _move_platforms(self.moving_platforms, [self.player_sprite])
 
-        # Check for wall hit
-        hit_list = check_for_collision_with_list(self.player_sprite, self.platforms)
 
-        # If we hit a wall, move so the edges are at the same point
-        if len(hit_list) > 0:
-            if self.player_sprite.change_y > 0:
-                for item in hit_list:
-                    self.player_sprite.top = min(item.bottom,
-                                                 self.player_sprite.top)
-                # print(f"Spot X ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-            elif self.player_sprite.change_y < 0:
-                for item in hit_list:
-                    while check_for_collision(self.player_sprite, item):
-                        # self.player_sprite.bottom = item.top <- Doesn't work for ramps
-                        self.player_sprite.bottom += 0.25
-
-                    if item.change_x != 0:
-                        self.player_sprite.center_x += item.change_x
-                # print(f"Spot Y ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-            else:
-                pass
-                # TODO: The code below can't execute, as "item" doesn't
-                # exist. In theory, this condition should never be arrived at.
-                # Collision while player wasn't moving, most likely
-                # moving platform.
-                # if self.player_sprite.center_y >= item.center_y:
-                #     self.player_sprite.bottom = item.top
-                # else:
-                #     self.player_sprite.top = item.bottom
-            self.player_sprite.change_y = min(0.0, hit_list[0].change_y)
-
-        # print(f"Spot B ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-        self.player_sprite.center_y = round(self.player_sprite.center_y, 2)
-        # print(f"Spot Q ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-
-        # --- Move in the x direction
-        self.player_sprite.center_x += self.player_sprite.change_x
-
-        check_again = True
-        while check_again:
-            check_again = False
-            # Check for wall hit
-            hit_list = check_for_collision_with_list(self.player_sprite, self.platforms)
+class PhysicsEngineMultiPlatformer:
+    """
+    Platformer physics for many sprites at once, such as a crowd of NPCs,
+    all moving against the same platforms.
 
-            # If we hit a wall, move so the edges are at the same point
-            if len(hit_list) > 0:
-                change_x = self.player_sprite.change_x
-                if change_x > 0:
-                    for item in hit_list:
-                        # print(f"Spot 1 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-                        # See if we can "run up" a ramp
-                        self.player_sprite.center_y += change_x
-                        if len(check_for_collision_with_list(self.player_sprite, self.platforms)) > 0:
-                            self.player_sprite.center_y -= change_x
-                            self.player_sprite.right = min(item.left, self.player_sprite.right)
-                            # print(f"Spot R ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-                            check_again = True
-                            break
-                        # else:
-                            # print("Run up ok 1")
-                        # print(f"Spot 2 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-
-                elif change_x < 0:
-                    for item in hit_list:
-                        # See if we can "run up" a ramp
-                        self.player_sprite.center_y -= change_x
-                        if len(check_for_collision_with_list(self.player_sprite, self.platforms)) > 0:
-                            # Can't run up the ramp, reverse
-                            self.player_sprite.center_y += change_x
-                            self.player_sprite.left = max(item.right, self.player_sprite.left)
-                            # print(f"Reverse 1 {item.right}, {self.player_sprite.left}")
-                            # Ok, if we were shoved back to the right, we need to check this whole thing again.
-                            check_again = True
-                            break
-                        # print(f"Spot 4 ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
+    Each body behaves as if it had its own ``PhysicsEnginePlatformer``, but
+    gravity is applied to every body in one go, the platforms are searched
+    once for all the bodies instead of once per collision check, and moving
+    platforms are moved once per update rather than once per body.
 
+    As with ``PhysicsEnginePlatformer``, only the platforms in
+    ``moving_platforms`` are moved, platforms set moving later on are
+    registered with ``add_moving_platform``, and ``platforms`` can be a
+    ``CollisionGrid``.
+
+    >>> import arcade
+    >>> bodies = SpriteList()
+    >>> bodies.append(arcade.Sprite(center_x=0))
+    >>> bodies.append(arcade.Sprite(center_x=100))
+    >>> walls = SpriteList()
+    >>> walls.append(arcade.Sprite())
+    >>> engine = PhysicsEngineMultiPlatformer(bodies, walls)
+    >>> engine.can_jump(bodies[0])
+    False
+    >>> engine.update()
+    >>> bodies[1].change_y
+    -0.5
+    """
+
+    def __init__(self, bodies: SpriteList, platforms: SpriteList,
+                 gravity_constant: float = 0.5, continuous: bool = False,
+                 moving_platforms: Iterable[Sprite] = None):
+        """
+        Constructor.
+        """
+        self.bodies = bodies
+        self.platforms = platforms
+        self.gravity_constant = gravity_constant
+        self.continuous = continuous
+        if moving_platforms is None:
+            self.moving_platforms = _find_moving_platforms(platforms)
+        else:
+            self.moving_platforms = list(moving_platforms)
+
+    def add_moving_platform(self, platform: Sprite):
+        """
+        Start moving a platform by its velocity on each update. It should
+        also be in ``platforms``, for sprites to collide with it.
+        """
+        if platform not in self.moving_platforms:
+            self.moving_platforms.append(platform)
+
+    def remove_moving_platform(self, platform: Sprite):
+        """
+        Stop moving a platform. It stays in ``platforms``.
+        """
+        if platform in self.moving_platforms:
+            self.moving_platforms.remove(platform)
+
+    def can_jump(self, body: Sprite) -> bool:
+        """
+        Method that looks to see if there is a floor under
+        the body. If there is a floor, the body can jump
+        and we return a True.
+        """
+        return len(probe_for_collision_with_list(body, self.platforms, 0, -2)) > 0
+
+    def _get_nearby_platforms(self, bodies: List[Sprite], change: np.ndarray) -> List[List[Sprite]]:
+        """
+        Broadphase for every body at once: the platforms each body could
+        touch during this update.
+        """
+        if not isinstance(self.platforms, CollisionGrid) and not self.platforms.use_spatial_hash:
+            return [_filter_by_collision_masks(body, self.platforms, self.platforms.sprite_list)
+                    for body in bodies]
+
+        boxes = np.array([(body.left, body.right, body.bottom, body.top) for body in bodies],
+                         dtype=np.float64)
+        # A body only moves along its velocity, and ramps lift it by at
+        # most its horizontal speed, so grow each box by the speed in both
+        # directions, plus a margin.
+        reach = np.abs(change).sum(axis=1) + BROADPHASE_MARGIN
+        boxes[:, 0::2] -= reach[:, np.newaxis]
+        boxes[:, 1::2] += reach[:, np.newaxis]
+
+        if isinstance(self.platforms, CollisionGrid):
+            # Cell lookups are cheap enough to do per query, so hand the
+            # grid itself to the bodies that have walls around them.
+            return [self.platforms if self.platforms.is_rect_occupied(*box) else []
+                    for box in boxes.tolist()]
+        nearby = self.platforms.spatial_hash.get_objects_for_rects(boxes)
+        return [_filter_by_collision_masks(body, self.platforms, platforms)
+                for body, platforms in zip(bodies, nearby)]
+
+    def update(self):
+        """
+        Move everything and resolve collisions.
+        """
+        bodies = list(self.bodies)
+        if bodies:
+            change = np.array([(body.change_x, body.change_y) for body in bodies], dtype=np.float64)
+            # --- Add gravity
+            change[:, 1] -= self.gravity_constant
+
+            nearby = self._get_nearby_platforms(bodies, change)
+
+            # Bodies with nothing around them just move, in one step
+            position = np.array([body.position for body in bodies], dtype=np.float64)
+            position += change
+            position[:, 1] = np.round(position[:, 1], 2)
+
+            for body, (change_x, change_y), (center_x, center_y), platforms in \
+                    zip(bodies, change.tolist(), position.tolist(), nearby):
+                body.change_y = change_y
+                if platforms:
+                    _move_platformer_body(body, platforms, self.continuous)
                 else:
-                    print("Error, collision while player wasn't moving.\n"
-                          "Make sure you aren't calling multiple updates, like "
-                          "a physics engine update and an all sprites list update.")
-
-            # print(f"Spot E ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-
-        for platform in self.platforms:
-            if platform.change_x != 0 or platform.change_y != 0:
-                platform.center_x += platform.change_x
-
-                if platform.boundary_left is not None \
-                        and platform.left <= platform.boundary_left:
-                    platform.left = platform.boundary_left
-                    if platform.change_x < 0:
-                        platform.change_x *= -1
-
-                if platform.boundary_right is not None \
-                        and platform.right >= platform.boundary_right:
-                    platform.right = platform.boundary_right
-                    if platform.change_x > 0:
-                        platform.change_x *= -1
-
-                if check_for_collision(self.player_sprite, platform):
-                    if platform.change_x < 0:
-                        self.player_sprite.right = platform.left
-                    if platform.change_x > 0:
-                        self.player_sprite.left = platform.right
-
-                platform.center_y += platform.change_y
-
-                if platform.boundary_top is not None \
-                        and platform.top >= platform.boundary_top:
-                    platform.top = platform.boundary_top
-                    if platform.change_y > 0:
-                        platform.change_y *= -1
-
-                if platform.boundary_bottom is not None \
-                        and platform.bottom <= platform.boundary_bottom:
-                    platform.bottom = platform.boundary_bottom
-                    if platform.change_y < 0:
-                        platform.change_y *= -1
-
-        # self.player_sprite.center_x = round(self.player_sprite.center_x, 2)
-        # print(f"Spot C ({self.player_sprite.center_x}, {self.player_sprite.center_y})")
-        # print()
+                    body.set_position(center_x, center_y)
+
+        if isinstance(self.bodies, SpriteList):
+            # Let the bodies' spatial hash find who is in a platform's way
+            _move_platforms(self.moving_platforms, self.bodies)
+        else:
+            _move_platforms(self.moving_platforms, bodies)
@@ -0,0 +1,159 @@
+"""
+Capturing frames from the screen without stalling the GPU.
+
+``get_image`` waits for everything drawn so far to finish before it can
+read the screen. ``ScreenCapture`` instead starts reading each frame into
+one of a ring of pixel buffers, and takes the pixels out a frame or two
+later, once the GPU is done with them. Frames can be handed to a
+``FrameWriter``, which saves them on a background thread.
+"""
+
+import os
+import queue
+import threading
+from typing import List
+from typing import Optional
+
+import numpy as np
+import PIL.Image
+
+from arcade.draw_commands import flush_draw_batch
+from arcade.window_commands import get_window
+from arcade import shader
+
+
+class FrameWriter:
+    """
+    Saves frames on a background thread, as numbered PNG files in a
+    directory, or one after the other in a single raw RGBA file.
+
+    If frames come faster than they can be saved, ``write`` waits once
+    ``max_pending`` of them are queued.
+    """
+
+    def __init__(self, path: str, file_format: str='png', max_pending: int=8):
+        if file_format not in ('png', 'raw'):
+            raise ValueError(f"file_format should be 'png' or 'raw'. Not '{file_format}'")
+        if file_format == 'png':
+            os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.file_format = file_format
+        self.frame_count = 0
+        self._frames = queue.Queue(max_pending)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, frame: np.ndarray):
+        """
+        Queue a (height, width, 4) frame to be saved. It must not be
+        changed afterwards.
+        """
+        self._frames.put(frame)
+
+    def _run(self):
+        raw_file = None
+        if self.file_format == 'raw':
+            raw_file = open(self.path, 'wb')
+        try:
+            while True:
+                frame = self._frames.get()
+                if frame is None:
+                    break
+                if raw_file is not None:
+                    raw_file.write(np.ascontiguousarray(frame).data)
+                else:
+                    file_name = os.path.join(self.path, f"frame{self.frame_count:06d}.png")
+                    PIL.Image.fromarray(frame, 'RGBA').save(file_name)
+                self.frame_count += 1
+        finally:
+            if raw_file is not None:
+                raw_file.close()
+
+    def close(self):
+        """
+        Save the frames still queued, and stop the thread.
+        """
+        self._frames.put(None)
+        self._thread.join()
+
+
+class ScreenCapture:
+    """
+    Reads part of the screen each frame into a ring of pixel buffers.
+
+    Call ``capture`` once a frame, after drawing. It returns the frame
+    captured ``buffer_count - 1`` calls earlier, as a (height, width, 4)
+    uint8 array with the top row first, or None for the first calls.
+    ``finish`` returns the frames still in the ring.
+
+    Each frame is copied once, from the mapped buffer into its array. The
+    rows are turned top side up with a view, not another copy.
+    """
+
+    def __init__(self, x: int=0, y: int=0, width: int=None, height: int=None,
+                 buffer_count: int=3, writer: FrameWriter=None):
+        if buffer_count < 1:
+            raise ValueError(f"buffer_count should be at least 1. Not {buffer_count}")
+        if width is None or height is None:
+            window = get_window()
+            if width is None:
+                width = window.width - x
+            if height is None:
+                height = window.height - y
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.writer = writer
+        self._buffers = [None] * buffer_count
+        # Slots of the ring holding frames that haven't been taken out
+        self._pending = []
+        self._next = 0
+
+    def _take(self, slot: int) -> np.ndarray:
+        """
+        Copy a frame out of its pixel buffer, and pass it to the writer.
+        """
+        frame = np.empty((self.height, self.width, 4), dtype=np.uint8)
+        self._buffers[slot].read_into(frame)
+        frame = frame[::-1]
+        if self.writer is not None:
+            self.writer.write(frame)
+        return frame
+
+    def capture(self) -> Optional[np.ndarray]:
+        """
+        Start reading the screen, and return the oldest frame in the ring
+        once it is full.
+        """
+        flush_draw_batch()
+
+        slot = self._next
+        self._next = (slot + 1) % len(self._buffers)
+        if self._buffers[slot] is None:
+            self._buffers[slot] = shader.Buffer.create_with_size(4 * self.width * self.height,
+                                                                 usage='stream_read')
+        self._buffers[slot].read_pixels(self.x, self.y, self.width, self.height)
+        self._pending.append(slot)
+
+        if len(self._pending) < len(self._buffers):
+            return None
+        return self._take(self._pending.pop(0))
+
+    def finish(self) -> List[np.ndarray]:
+        """
+        Return the frames still in the ring, oldest first.
+        """
+        frames = [self._take(slot) for slot in self._pending]
+        self._pending = []
+        return frames
+
+    def release(self):
+        """
+        Delete the pixel buffers. Frames still in the ring are lost.
+        """
+        for buffer in self._buffers:
+            if buffer is not None:
+                buffer.release()
+        self._buffers = [None] * len(self._buffers)
+        self._pending = []
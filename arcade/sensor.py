@@ -0,0 +1,72 @@
+"""
+Sensor regions, also called trigger zones.
+
+A sensor is added to a SpriteList, which then keeps track of the sprites
+overlapping it as they move, and calls ``on_enter`` and ``on_exit`` when
+that changes. Only the sprites that moved since the last check, and the
+sensors that moved, are looked at again.
+"""
+
+from typing import Callable
+from typing import Tuple
+from typing import Union
+
+from arcade.geometry import are_polygons_intersecting
+from arcade.geometry import check_for_collision
+from arcade.sprite import Sprite
+
+
+class Sensor:
+    """
+    A region that reports sprites entering and leaving it.
+
+    The region is either a Sprite, which the sensor follows as it moves
+    and turns, or a (left, right, bottom, top) rectangle. It can be
+    changed by assigning to ``region``.
+
+    ``on_enter`` and ``on_exit`` are called with the sprite, from
+    ``SpriteList.update_sensors``. ``sprites`` is the set of sprites
+    inside the region as of the last update.
+
+    >>> sensor = Sensor((0, 10, 0, 10))
+    >>> sensor.left, sensor.right
+    (0, 10)
+    >>> sprite = Sprite(center_x=5, center_y=5)
+    >>> sprite.width = sprite.height = 4
+    >>> sensor.overlaps(sprite)
+    True
+    """
+
+    def __init__(self, region: Union[Sprite, Tuple[float, float, float, float]],
+                 on_enter: Callable[[Sprite], None] = None,
+                 on_exit: Callable[[Sprite], None] = None):
+        self.region = region
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+        self.sprites = set()
+        # Where the sensor is filed in the sensor spatial hash. The hash
+        # reads these edges, so they only change when the sensor is refiled.
+        self.left, self.right, self.bottom, self.top = self.get_bounds()
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        The current (left, right, bottom, top) bounding box of the region.
+        """
+        if isinstance(self.region, Sprite):
+            return self.region.left, self.region.right, self.region.bottom, self.region.top
+        return tuple(self.region)
+
+    def overlaps(self, sprite: Sprite) -> bool:
+        """
+        True if the sprite overlaps the region.
+        """
+        if sprite is self.region:
+            return False
+        if isinstance(self.region, Sprite):
+            return check_for_collision(self.region, sprite)
+
+        left, right, bottom, top = self.region
+        if sprite.right <= left or sprite.left >= right or sprite.top <= bottom or sprite.bottom >= top:
+            return False
+        return are_polygons_intersecting(((left, bottom), (right, bottom), (right, top), (left, top)),
+                                         sprite.points)
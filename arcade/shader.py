@@ -3,8 +3,11 @@
 
 from ctypes import *
 from collections import namedtuple
+import hashlib
+import os
+import struct
 import weakref
-from typing import Type, Tuple, Iterable
+from typing import Type, Tuple, Iterable, Optional, Union
 
 from pyglet.gl import *
 from pyglet import gl
@@ -95,6 +98,16 @@ def setter_func(values):
 ShaderType = GLuint
 Shader = type(Tuple[ShaderCode, ShaderType])
 
+ProgramStats = namedtuple('ProgramStats', 'compiles, links, cache_hits, binary_loads')
+
+# Programs made by `program`, per GL object space (shared by contexts that
+# share objects), keyed by their shader source.
+_program_cache = weakref.WeakKeyDictionary()
+_program_stats = {'compiles': 0, 'links': 0, 'cache_hits': 0, 'binary_loads': 0}
+
+# Directory holding linked program binaries, see `set_program_binary_cache`
+_program_binary_dir = None
+
 
 class Program:
     """Compiled and linked shader program.
@@ -107,19 +120,42 @@ class Program:
         matrix = np.array([[...]])
         program['MyMatrix'] = matrix.flatten()
     """
-    def __init__(self, *shaders: Shader):
+    def __init__(self, *shaders: Shader, binary: Tuple[int, bytes]=None, retrievable: bool=False):
+        """Compile and link the shaders, or load a binary from `get_binary`
+        instead if one is given.
+
+        `retrievable` asks the driver to keep the linked binary around for
+        `get_binary`.
+        """
         self.prog_id = prog_id = glCreateProgram()
         shaders_id = []
-        for shader_code, shader_type in shaders:
-            shader = compile_shader(shader_code, shader_type)
-            glAttachShader(self.prog_id, shader)
-            shaders_id.append(shader)
-
-        glLinkProgram(self.prog_id)
-
-        for shader in shaders_id:
-            # Flag shaders for deletion. Will only be deleted once detached from program.
-            glDeleteShader(shader)
+        if binary is not None:
+            binary_format, data = binary
+            glProgramBinary(self.prog_id, binary_format, data, len(data))
+        else:
+            for shader_code, shader_type in shaders:
+                shader = compile_shader(shader_code, shader_type)
+                glAttachShader(self.prog_id, shader)
+                shaders_id.append(shader)
+
+            if retrievable:
+                glProgramParameteri(self.prog_id, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+            glLinkProgram(self.prog_id)
+            _program_stats['links'] += 1
+
+            for shader in shaders_id:
+                # Flag shaders for deletion. Will only be deleted once detached from program.
+                glDeleteShader(shader)
+
+        result = c_int()
+        glGetProgramiv(self.prog_id, GL_LINK_STATUS, byref(result))
+        if result.value == GL_FALSE:
+            msg = create_string_buffer(512)
+            length = c_int()
+            glGetProgramInfoLog(self.prog_id, 512, byref(length), msg)
+            glDeleteProgram(self.prog_id)
+            raise ShaderException(
+                f"Program link failure ({result.value}): {msg.value.decode('utf-8')}")
 
         self._uniforms = {}
         self._introspect_uniforms()
@@ -142,6 +178,21 @@ def release(self):
             glDeleteProgram(self.prog_id)
             self.prog_id = 0
 
+    def get_binary(self) -> Optional[Tuple[int, bytes]]:
+        """Get the linked program as a (format, data) binary, which can be
+        given back to `Program` by the same driver. Returns None if the
+        driver doesn't provide one.
+        """
+        length = GLint(0)
+        glGetProgramiv(self.prog_id, GL_PROGRAM_BINARY_LENGTH, byref(length))
+        if length.value == 0:
+            return None
+
+        data = create_string_buffer(length.value)
+        binary_format = GLenum()
+        glGetProgramBinary(self.prog_id, length.value, None, byref(binary_format), data)
+        return binary_format.value, data.raw
+
     def __getitem__(self, item):
         try:
             uniform = self._uniforms[item]
@@ -219,12 +270,115 @@ def query_uniform(self, index: int) -> Tuple[str, int, int]:
 
 
 def program(vertex_shader: str, fragment_shader: str) -> Program:
-    """Create a new program given the vertex_shader and fragment shader code.
+    """Get a program for the vertex_shader and fragment shader code.
+
+    Programs are compiled once per GL context and shared by everything
+    asking for the same source code, so uniforms must be set before each
+    draw rather than once at creation, and the program must not be
+    released by its users.
     """
-    return Program(
-        (vertex_shader, GL_VERTEX_SHADER),
-        (fragment_shader, GL_FRAGMENT_SHADER)
-    )
+    context = gl.current_context
+    if context is None:
+        return Program(
+            (vertex_shader, GL_VERTEX_SHADER),
+            (fragment_shader, GL_FRAGMENT_SHADER)
+        )
+
+    programs = _program_cache.setdefault(context.object_space, {})
+    key = (vertex_shader, fragment_shader)
+    prog = programs.get(key)
+    if prog is None or prog.prog_id == 0:
+        prog = _create_program(vertex_shader, fragment_shader)
+        programs[key] = prog
+    else:
+        _program_stats['cache_hits'] += 1
+    return prog
+
+
+def _create_program(vertex_shader: str, fragment_shader: str) -> Program:
+    """Load the program from the binary cache if it is on and holds it,
+    otherwise compile it and add it to the cache.
+    """
+    shaders = (vertex_shader, GL_VERTEX_SHADER), (fragment_shader, GL_FRAGMENT_SHADER)
+    if _program_binary_dir is None:
+        return Program(*shaders)
+
+    path = os.path.join(_program_binary_dir,
+                        _get_program_binary_key(vertex_shader, fragment_shader) + '.bin')
+    try:
+        with open(path, 'rb') as file:
+            binary_format, = struct.unpack('<I', file.read(4))
+            data = file.read()
+        prog = Program(*shaders, binary=(binary_format, data))
+    except (OSError, struct.error, ShaderException, GLException):
+        # Not cached yet, or the driver won't take it anymore, or has no
+        # program binaries at all
+        pass
+    else:
+        _program_stats['binary_loads'] += 1
+        return prog
+
+    try:
+        prog = Program(*shaders, retrievable=True)
+        binary = prog.get_binary()
+    except GLException:
+        # The driver can't hand out binaries, so there is nothing to cache
+        return Program(*shaders)
+    if binary is not None:
+        binary_format, data = binary
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(struct.pack('<I', binary_format))
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+    return prog
+
+
+def _get_driver_string() -> str:
+    """The vendor, renderer and version of the current GL driver.
+    """
+    return "\n".join(cast(glGetString(name), c_char_p).value.decode('utf-8', 'replace')
+                     for name in (GL_VENDOR, GL_RENDERER, GL_VERSION))
+
+
+def _get_program_binary_key(vertex_shader: str, fragment_shader: str) -> str:
+    """The name of a program in the binary cache. Binaries only work with
+    the driver that made them, so it is part of the key.
+    """
+    key = hashlib.sha256()
+    for part in (_get_driver_string(), vertex_shader, fragment_shader):
+        key.update(part.encode('utf-8'))
+        key.update(b'\0')
+    return key.hexdigest()
+
+
+def set_program_binary_cache(directory: Optional[str]):
+    """Keep linked programs in `directory`, so later runs can load them
+    instead of compiling their shaders. Binaries that the driver no longer
+    accepts, after an update for instance, are compiled and saved again.
+    Pass None to stop using the cache.
+    """
+    global _program_binary_dir
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    _program_binary_dir = directory
+
+
+def get_program_stats() -> ProgramStats:
+    """Number of shaders compiled, programs linked, programs reused from
+    the cache and programs loaded from the binary cache since the library
+    was loaded.
+    """
+    return ProgramStats(**_program_stats)
+
+
+def clear_program_cache():
+    """Forget the cached programs. They are deleted once nothing uses them.
+    """
+    _program_cache.clear()
 
 
 def compile_shader(source: str, shader_type: GLenum) -> GLuint:
@@ -235,6 +389,7 @@ def compile_shader(source: str, shader_type: GLenum) -> GLuint:
     Returns the shader id as a GLuint
     """
     shader = glCreateShader(shader_type)
+    _program_stats['compiles'] += 1
     source = source.encode('utf-8')
     # Turn the source code string into an array of c_char_p arrays.
     strings = byref(
@@ -258,23 +413,37 @@ def compile_shader(source: str, shader_type: GLenum) -> GLuint:
     return shader
 
 
+def _get_buffer_data(data) -> Tuple[object, int]:
+    """The data to pass to OpenGL and its size in bytes.
+
+    NumPy arrays are passed as a pointer to their memory, so they are not
+    copied unless they aren't contiguous.
+    """
+    if isinstance(data, np.ndarray):
+        data = np.ascontiguousarray(data)
+        return data.ctypes.data_as(c_void_p), data.nbytes
+    return data, len(data)
+
+
 class Buffer:
     """OpenGL Buffer object of type GL_ARRAY_BUFFER.
 
     Apparently it's possible to initialize a GL_ELEMENT_ARRAY_BUFFER with
     GL_ARRAY_BUFFER, provided we later on bind to it with the right type.
 
-    The buffer knows its id `buffer_id` and its `size` in bytes.
+    The buffer knows its id `buffer_id` and its `size` in bytes. The data
+    is either bytes or a NumPy array.
     """
     usages = {
         'static': GL_STATIC_DRAW,
         'dynamic': GL_DYNAMIC_DRAW,
-        'stream': GL_STREAM_DRAW
+        'stream': GL_STREAM_DRAW,
+        'stream_read': GL_STREAM_READ,
     }
 
-    def __init__(self, data: bytes, usage: str='static'):
+    def __init__(self, data: Union[bytes, np.ndarray], usage: str='static'):
         self.buffer_id = buffer_id = GLuint()
-        self.size = len(data)
+        data, self.size = _get_buffer_data(data)
 
         glGenBuffers(1, byref(self.buffer_id))
         if self.buffer_id.value == 0:
@@ -299,9 +468,10 @@ def release(self):
             glDeleteBuffers(1, byref(self.buffer_id))
             self.buffer_id.value = 0
 
-    def write(self, data: bytes, offset: int=0):
+    def write(self, data: Union[bytes, np.ndarray], offset: int=0):
+        data, size = _get_buffer_data(data)
         glBindBuffer(GL_ARRAY_BUFFER, self.buffer_id)
-        glBufferSubData(GL_ARRAY_BUFFER, GLintptr(offset), len(data), data)
+        glBufferSubData(GL_ARRAY_BUFFER, GLintptr(offset), size, data)
         # print(f"Writing data:\n{data[:60]}")
         # ptr = glMapBufferRange(GL_ARRAY_BUFFER, GLintptr(0), 20, GL_MAP_READ_BIT)
         # print(f"Reading back from buffer:\n{string_at(ptr, size=60)}")
@@ -311,6 +481,23 @@ def orphan(self):
         glBindBuffer(GL_ARRAY_BUFFER, self.buffer_id)
         glBufferData(GL_ARRAY_BUFFER, self.size, None, self.usage)
 
+    def read_pixels(self, x: int, y: int, width: int, height: int):
+        """Start reading RGBA pixels of the framebuffer into the buffer.
+
+        This returns without waiting for the GPU. The pixels can be taken
+        out with `read_into`, which only waits if they aren't there yet.
+        """
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self.buffer_id)
+        glReadPixels(x, y, width, height, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+
+    def read_into(self, array: np.ndarray, offset: int=0):
+        """Copy the start of the buffer into a contiguous NumPy array."""
+        glBindBuffer(GL_ARRAY_BUFFER, self.buffer_id)
+        ptr = glMapBufferRange(GL_ARRAY_BUFFER, GLintptr(offset), array.nbytes, GL_MAP_READ_BIT)
+        memmove(array.ctypes.data, ptr, array.nbytes)
+        glUnmapBuffer(GL_ARRAY_BUFFER)
+
     def _read(self, size):
         """ Debug method to read data from the buffer. """
 
@@ -320,7 +507,7 @@ def _read(self, size):
         glUnmapBuffer(GL_ARRAY_BUFFER)
 
 
-def buffer(data: bytes, usage: str='static') -> Buffer:
+def buffer(data: Union[bytes, np.ndarray], usage: str='static') -> Buffer:
     """Create a new OpenGL Buffer object.
     """
     return Buffer(data, usage)
@@ -479,12 +666,18 @@ def _enable_attrib(self, buf_desc: BufferDescription):
             offset += attribsize
             glEnableVertexAttribArray(loc)
 
-    def render(self, mode: GLuint, instances: int=1):
+    def render(self, mode: GLuint, instances: int=1, first: int=0, vertices: int=None):
+        """Draw the geometry. Without an index buffer, `first` and
+        `vertices` select a range of the vertices; by default all of them
+        are drawn.
+        """
         if self.ibo is not None:
             count = self.ibo.size // 4
             glDrawElementsInstanced(mode, count, GL_UNSIGNED_INT, None, instances)
         else:
-            glDrawArraysInstanced(mode, 0, self.num_vertices, instances)
+            if vertices is None:
+                vertices = self.num_vertices - first
+            glDrawArraysInstanced(mode, first, vertices, instances)
 
 
 def vertex_array(program: GLuint, content, index_buffer=None):
@@ -535,6 +728,17 @@ def use(self, texture_unit: int=0):
         glActiveTexture(GL_TEXTURE0 + texture_unit)
         glBindTexture(GL_TEXTURE_2D, self.texture_id)
 
+    def write(self, data: np.array, x: int=0, y: int=0):
+        """Replace the pixels of a region of the texture, starting at
+        `x`, `y`, with an array of shape (height, width, component)."""
+        data = np.ascontiguousarray(data, dtype=np.uint8)
+        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexSubImage2D(
+            GL_TEXTURE_2D, 0, x, y, data.shape[1], data.shape[0],
+            self.format, GL_UNSIGNED_BYTE, data.ctypes.data_as(c_void_p)
+        )
+
 
 def texture(size: Tuple[int, int], component: int, data: np.array) -> Texture:
     return Texture(size, component, data)
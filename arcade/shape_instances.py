@@ -0,0 +1,307 @@
+"""
+Circles, ellipses, rectangles and lines drawn as instanced quads.
+
+Every shape is one quad. The four corners are shared by all of them, and
+each shape adds a row of instance data: center, size, tilt, border width,
+kind and color. The fragment shader fills or outlines the shape from its
+signed distance, so curves stay smooth at any size without being split
+into triangles.
+"""
+
+import math
+
+import numpy as np
+import pyglet.gl as gl
+
+from arcade.arcade_types import Color
+from arcade.draw_commands import flush_draw_batch
+from arcade.draw_commands import get_four_byte_color
+from arcade.window_commands import get_projection
+from arcade.window_commands import _get_pixel_scale
+from arcade import shader
+
+# Kinds of shapes
+SHAPE_ELLIPSE = 0
+SHAPE_RECTANGLE = 1
+
+# Instance data of a shape. The size is half the width and height, and a
+# border width of zero fills the shape.
+shape_instance_type = np.dtype([
+    ('center', '2f4'),
+    ('size', '2f4'),
+    ('angle', 'f4'),
+    ('border_width', 'f4'),
+    ('kind', 'f4'),
+    ('color', '4B'),
+])
+
+shape_vertex_shader = '''
+    #version 330
+    uniform mat4 Projection;
+    uniform vec2 Position;
+    uniform float Angle;
+    // Size of a pixel, for the antialiased edge
+    uniform float PixelSize;
+
+    // Corner of the quad, from -1 to 1
+    in vec2 in_vert;
+
+    in vec2 in_center;
+    in vec2 in_size;
+    in float in_angle;
+    in float in_border_width;
+    in float in_kind;
+    in vec4 in_color;
+
+    out vec2 v_local;
+    flat out vec2 v_size;
+    flat out float v_border_width;
+    flat out float v_kind;
+    flat out vec4 v_color;
+
+    mat2 rotate(float degrees) {
+        float angle = radians(degrees);
+        return mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+    }
+
+    void main() {
+        // Leave room for the outline and the antialiased edge
+        vec2 extent = in_size + in_border_width / 2.0 + PixelSize;
+        v_local = in_vert * extent;
+        vec2 position = Position + rotate(Angle) * (in_center + rotate(in_angle) * v_local);
+        gl_Position = Projection * vec4(position, 0.0, 1.0);
+
+        v_size = max(in_size, vec2(1e-6));
+        v_border_width = in_border_width;
+        v_kind = in_kind;
+        v_color = in_color;
+    }
+'''
+
+shape_fragment_shader = '''
+    #version 330
+    in vec2 v_local;
+    flat in vec2 v_size;
+    flat in float v_border_width;
+    flat in float v_kind;
+    flat in vec4 v_color;
+
+    out vec4 f_color;
+
+    void main() {
+        float distance;
+        if (v_kind < 0.5) {
+            // Approximate distance to an ellipse, exact for circles
+            float k0 = length(v_local / v_size);
+            float k1 = length(v_local / (v_size * v_size));
+            distance = k1 > 0.0 ? k0 * (k0 - 1.0) / k1 : -min(v_size.x, v_size.y);
+        } else {
+            vec2 q = abs(v_local) - v_size;
+            distance = length(max(q, 0.0)) + min(max(q.x, q.y), 0.0);
+        }
+        if (v_border_width > 0.0) {
+            distance = abs(distance) - v_border_width / 2.0;
+        }
+
+        float alpha = clamp(0.5 - distance / max(fwidth(distance), 1e-6), 0.0, 1.0);
+        if (alpha <= 0.0) {
+            discard;
+        }
+        f_color = vec4(v_color.rgb, v_color.a * alpha);
+    }
+'''
+
+
+def _get_line_instance(start_x: float, start_y: float, end_x: float, end_y: float,
+                       line_width: float):
+    """
+    The center, half size and angle of the rectangle covering a line.
+    """
+    length = math.hypot(end_x - start_x, end_y - start_y)
+    angle = math.degrees(math.atan2(end_y - start_y, end_x - start_x))
+    return ((start_x + end_x) / 2, (start_y + end_y) / 2), (length / 2, line_width / 2), angle
+
+
+class _ShapeRenderer:
+    """
+    The GL objects for drawing rows of ``shape_instance_type``, made for
+    the current context when first needed.
+    """
+
+    def __init__(self):
+        self.context = None
+        self.program = None
+        self.quad_vbo = None
+        self.instance_vbo = None
+        self.vao = None
+
+    def render(self, instances: np.ndarray, center_x: float=0, center_y: float=0,
+               angle: float=0, upload: bool=True):
+        """
+        Draw the instances. If ``upload`` is False, the instance buffer is
+        assumed to hold them already, unless it had to be made again.
+        """
+        if len(instances) == 0:
+            return
+
+        context = gl.current_context
+        if self.context is not context:
+            self.context = context
+            self.program = shader.program(
+                vertex_shader=shape_vertex_shader,
+                fragment_shader=shape_fragment_shader,
+            )
+            quad = np.array(((-1, -1), (1, -1), (-1, 1), (1, 1)), dtype=np.float32)
+            self.quad_vbo = shader.buffer(quad.tobytes())
+            self.instance_vbo = None
+
+        if self.instance_vbo is None or self.instance_vbo.size < instances.nbytes:
+            size = max(1024, 1 << (instances.nbytes - 1).bit_length())
+            self.instance_vbo = shader.Buffer.create_with_size(size, usage='stream')
+            vao_content = [
+                shader.BufferDescription(self.quad_vbo, '2f', ('in_vert',)),
+                shader.BufferDescription(
+                    self.instance_vbo,
+                    '2f 2f 1f 1f 1f 4B',
+                    ('in_center', 'in_size', 'in_angle', 'in_border_width', 'in_kind', 'in_color'),
+                    normalized=['in_color'],
+                    instanced=True
+                ),
+            ]
+            self.vao = shader.vertex_array(self.program, vao_content)
+            upload = True
+
+        if upload:
+            self.instance_vbo.orphan()
+            self.instance_vbo.write(instances.tobytes())
+
+        with self.vao:
+            self.program['Projection'] = get_projection().flatten()
+            self.program['Position'] = [center_x, center_y]
+            self.program['Angle'] = angle
+            self.program['PixelSize'] = 1 / _get_pixel_scale()
+
+            gl.glEnable(gl.GL_BLEND)
+            gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+
+            self.vao.render(gl.GL_TRIANGLE_STRIP, instances=len(instances))
+
+
+class ShapeInstanceList:
+    """
+    A list of circles, ellipses, rectangles and lines that are kept on the
+    graphics card and drawn with one call, four vertices each.
+
+    Like a ShapeElementList, the whole list can be moved and turned with
+    ``center_x``, ``center_y`` and ``angle``.
+
+    >>> shapes = ShapeInstanceList()
+    >>> shapes.append_circle(100, 100, 10, (255, 0, 0))
+    0
+    >>> shapes.append_rectangle(200, 100, 40, 20, (0, 255, 0), border_width=2)
+    1
+    >>> shapes.append_line(0, 0, 30, 40, (0, 0, 255), 3)
+    2
+    >>> shapes.instances['size'][2].tolist()
+    [25.0, 1.5]
+    """
+
+    def __init__(self):
+        self._instances = np.zeros(64, dtype=shape_instance_type)
+        self._count = 0
+        self._changed = True
+        self._renderer = _ShapeRenderer()
+        self.center_x = 0
+        self.center_y = 0
+        self.angle = 0
+
+    def _append(self, kind: int, center, size, angle: float, border_width: float, color: Color) -> int:
+        if self._count == len(self._instances):
+            instances = np.zeros(2 * len(self._instances), dtype=shape_instance_type)
+            instances[:self._count] = self._instances
+            self._instances = instances
+
+        index = self._count
+        self._instances[index] = (center, size, angle, border_width, kind, get_four_byte_color(color))
+        self._count += 1
+        self._changed = True
+        return index
+
+    def append_circle(self, center_x: float, center_y: float, radius: float,
+                      color: Color, border_width: float=0) -> int:
+        """
+        Add a circle, filled if ``border_width`` is 0. Returns its index.
+        """
+        return self._append(SHAPE_ELLIPSE, (center_x, center_y), (radius, radius), 0,
+                            border_width, color)
+
+    def append_ellipse(self, center_x: float, center_y: float, width: float, height: float,
+                       color: Color, border_width: float=0, tilt_angle: float=0) -> int:
+        """
+        Add an ellipse, filled if ``border_width`` is 0. Like
+        ``draw_ellipse_filled``, ``width`` and ``height`` are its radii.
+        Returns its index.
+        """
+        return self._append(SHAPE_ELLIPSE, (center_x, center_y), (width, height), tilt_angle,
+                            border_width, color)
+
+    def append_rectangle(self, center_x: float, center_y: float, width: float, height: float,
+                         color: Color, border_width: float=0, tilt_angle: float=0) -> int:
+        """
+        Add a rectangle, filled if ``border_width`` is 0. Returns its index.
+        """
+        return self._append(SHAPE_RECTANGLE, (center_x, center_y), (width / 2, height / 2),
+                            tilt_angle, border_width, color)
+
+    def append_line(self, start_x: float, start_y: float, end_x: float, end_y: float,
+                    color: Color, line_width: float=1) -> int:
+        """
+        Add a line. Returns its index.
+        """
+        center, size, angle = _get_line_instance(start_x, start_y, end_x, end_y, line_width)
+        return self._append(SHAPE_RECTANGLE, center, size, angle, 0, color)
+
+    @property
+    def instances(self) -> np.ndarray:
+        """
+        The instance data of the shapes, as an array of
+        ``shape_instance_type``. It can be changed in place, to move
+        shapes for instance. Getting it makes the next ``draw`` upload the
+        data again.
+        """
+        self._changed = True
+        return self._instances[:self._count]
+
+    def move(self, change_x: float, change_y: float):
+        """
+        Move all the shapes in the list.
+        """
+        self.center_x += change_x
+        self.center_y += change_y
+
+    def clear(self):
+        """
+        Remove all the shapes.
+        """
+        self._count = 0
+        self._changed = True
+
+    def __len__(self) -> int:
+        return self._count
+
+    def draw(self, first: int=0, count: int=None):
+        """
+        Draw all the shapes, or ``count`` of them starting at ``first``.
+        """
+        flush_draw_batch()
+
+        if first == 0 and (count is None or count >= self._count):
+            self._renderer.render(self._instances[:self._count], self.center_x, self.center_y,
+                                  self.angle, upload=self._changed)
+            self._changed = False
+        else:
+            if count is None:
+                count = self._count - first
+            self._renderer.render(self._instances[first:min(first + count, self._count)],
+                                  self.center_x, self.center_y, self.angle)
+            self._changed = True
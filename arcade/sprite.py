@@ -9,8 +9,9 @@
 import math
 
 
-from arcade.draw_commands import load_texture
-from arcade.draw_commands import draw_texture_rectangle
+from arcade.draw_commands import _draw_textured_quad
+from arcade.draw_commands import _get_image_scale
+from arcade.draw_commands import _load_texture
 from arcade.draw_commands import Texture
 from arcade.draw_commands import rotate_point
 from arcade.arcade_types import RGB
@@ -23,6 +24,9 @@
 FACE_UP = 3
 FACE_DOWN = 4
 
+# Collision mask that lets a sprite collide with every category
+COLLISION_MASK_ALL = 0xFFFFFFFF
+
 class Sprite:
     """
     Class that represents a 'sprite' on-screen.
@@ -41,6 +45,8 @@ class Sprite:
         :change_y: Movement vector, in the y direction.
         :change_angle: Change in rotation.
         :collision_radius: Used as a fast-check to see if this item is close enough to another item. If this check works, we do a slower more accurate check.
+        :collision_category: Bit flags for the collision categories this sprite is in. Defaults to 1.
+        :collision_mask: Bit flags for the categories this sprite can collide with. Two sprites only collide if each one's category is in the other's mask. Defaults to every category.
         :color:
         :can_cache:
         :collision_radius: Used as a fast-check to see if this item is close enough to another item. If this check works, we do a slower more accurate check.
@@ -55,6 +61,8 @@ class Sprite:
         :last_center_y:
         :last_angle:
         :left: Set/query the sprite location by using the left coordinate. This will be the 'x' of the left of the sprite.
+        :mirrored: Set to True to draw the texture mirrored left to right.
+        :flipped: Set to True to draw the texture upside down.
         :points: Points, in relation to the center of the sprite, that are used
         for collision detection. Arcade defaults to creating points for a rectangle
         that encompass the image. If you are creating a ramp or making better
@@ -169,8 +177,8 @@ def __init__(self,
         self.sprite_lists = []
 
         if filename is not None:
-            self.texture = load_texture(filename, image_x, image_y,
-                                        image_width, image_height)
+            self.texture = _load_texture(filename, image_x, image_y, image_width, image_height,
+                                         False, False, 1, _get_image_scale(scale))
 
             self.textures = [self.texture]
             self.width = self.texture.width * scale
@@ -184,6 +192,8 @@ def __init__(self,
         self.cur_texture_index = 0
         self.image = None
         self.texture_name = filename
+        self._mirrored = False
+        self._flipped = False
 
         self.scale = scale
         self._position = [center_x, center_y]
@@ -199,6 +209,8 @@ def __init__(self,
 
         self._alpha = 255
         self._collision_radius = None
+        self._collision_category = 1
+        self._collision_mask = COLLISION_MASK_ALL
         self._color = (255, 255, 255)
 
         self.can_cache = True
@@ -214,6 +226,7 @@ def __init__(self,
 
         self.repeat_count_x = repeat_count_x
         self.repeat_count_y = repeat_count_y
+        self.transparent = True
 
     def append_texture(self, texture: Texture):
         """
@@ -226,6 +239,7 @@ def append_texture(self, texture: Texture):
         >>> empty_sprite.append_texture(my_texture)
         """
         self.textures.append(texture)
+        texture.add_sprite(self)
 
     def set_texture(self, texture_no: int):
         """
@@ -528,6 +542,32 @@ def _set_change_y(self, new_value: float):
 
     change_y = property(_get_change_y, _set_change_y)
 
+    def _get_collision_category(self) -> int:
+        """ Get the collision categories the sprite is in, as bit flags. """
+        return self._collision_category
+
+    def _set_collision_category(self, new_value: int):
+        """ Set the collision categories the sprite is in, as bit flags. """
+        if new_value != self._collision_category:
+            self._collision_category = new_value
+            for sprite_list in self.sprite_lists:
+                sprite_list.update_collision_filter(self)
+
+    collision_category = property(_get_collision_category, _set_collision_category)
+
+    def _get_collision_mask(self) -> int:
+        """ Get the collision categories the sprite can collide with, as bit flags. """
+        return self._collision_mask
+
+    def _set_collision_mask(self, new_value: int):
+        """ Set the collision categories the sprite can collide with, as bit flags. """
+        if new_value != self._collision_mask:
+            self._collision_mask = new_value
+            for sprite_list in self.sprite_lists:
+                sprite_list.update_collision_filter(self)
+
+    collision_mask = property(_get_collision_mask, _set_collision_mask)
+
     def _get_angle(self) -> float:
         """ Get the angle of the sprite's rotation. """
         return self._angle
@@ -624,6 +664,7 @@ def _set_texture(self, texture: Texture):
         """
         if isinstance(texture, Texture):
             self._texture = texture
+            texture.add_sprite(self)
             self.width = texture.width
             self.height = texture.height
             self.texture_name = texture.texture_name
@@ -667,6 +708,38 @@ def _set_alpha(self, alpha: RGB):
 
     alpha = property(_get_alpha, _set_alpha)
 
+    def _get_mirrored(self) -> bool:
+        """
+        Return if the texture is drawn mirrored left to right.
+        """
+        return self._mirrored
+
+    def _set_mirrored(self, mirrored: bool):
+        """
+        Set if the texture is drawn mirrored left to right.
+        """
+        self._mirrored = mirrored
+        for sprite_list in self.sprite_lists:
+            sprite_list.update_texture(self)
+
+    mirrored = property(_get_mirrored, _set_mirrored)
+
+    def _get_flipped(self) -> bool:
+        """
+        Return if the texture is drawn upside down.
+        """
+        return self._flipped
+
+    def _set_flipped(self, flipped: bool):
+        """
+        Set if the texture is drawn upside down.
+        """
+        self._flipped = flipped
+        for sprite_list in self.sprite_lists:
+            sprite_list.update_texture(self)
+
+    flipped = property(_get_flipped, _set_flipped)
+
     def register_sprite_list(self, new_list):
         """
         Register this sprite as belonging to a list. We will automatically
@@ -676,17 +749,10 @@ def register_sprite_list(self, new_list):
 
     def draw(self):
         """ Draw the sprite. """
-        if self._alpha != 255:
-            transparent = False
-        else:
-            transparent = True
-
-        draw_texture_rectangle(self.center_x, self.center_y,
-                               self.width, self.height,
-                               self.texture, self.angle, self.alpha,  # TODO: review this function
-                               self.transparent,
-                               repeat_count_x=self.repeat_count_x,
-                               repeat_count_y=self.repeat_count_y)
+        _draw_textured_quad(self.center_x, self.center_y, self.width, self.height,
+                            self.texture, self.angle, tuple(self.color) + (self.alpha, ),
+                            self.mirrored, self.flipped, self.transparent,
+                            self.repeat_count_x, self.repeat_count_y)
 
     def update(self):
         """
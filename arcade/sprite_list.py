@@ -3,21 +3,26 @@
 
 """
 
+from collections import namedtuple
 from typing import Iterable
 from typing import TypeVar
 from typing import Generic
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 import pyglet.gl as gl
 
 import math
 import numpy as np
 
-from PIL import Image
-
+from arcade.sprite import COLLISION_MASK_ALL
 from arcade.sprite import Sprite
 from arcade.sprite import get_distance_between_sprites
 
+from arcade.draw_commands import Texture
+from arcade.draw_commands import flush_draw_batch
+from arcade.draw_commands import load_texture
 from arcade.draw_commands import rotate_point
 from arcade.window_commands import get_projection
 from arcade import shader
@@ -36,6 +41,7 @@
 in vec2 in_scale;
 in vec4 in_sub_tex_coords;
 in vec4 in_color;
+in vec2 in_flip;
 
 out vec2 v_texture;
 out vec4 v_color;
@@ -52,7 +58,9 @@
     vec2 tex_offset = in_sub_tex_coords.xy;
     vec2 tex_size = in_sub_tex_coords.zw;
 
-    v_texture = (in_texture * tex_size + tex_offset) * vec2(1, -1);
+    // Mirrored and flipped sprites read their texture the other way round
+    vec2 texture_coords = mix(in_texture, 1.0 - in_texture, in_flip);
+    v_texture = (texture_coords * tex_size + tex_offset) * vec2(1, -1);
     v_color = in_color;
 }
 """
@@ -77,6 +85,9 @@
 """
 
 
+RaycastHit = namedtuple('RaycastHit', 'sprite, distance, point')
+
+
 def _create_rects(rect_list: Iterable[Sprite]) -> List[float]:
     """
     Create a vertex buffer for a set of rectangles.
@@ -200,39 +211,139 @@ def get_objects_for_box(self, check_object: Sprite) -> List[Sprite]:
         """
         Returns colliding Sprites.
         """
-        # Get the corners
-        min_x = check_object.left
-        max_x = check_object.right
-        min_y = check_object.bottom
-        max_y = check_object.top
-
-        min_point = (min_x, min_y)
-        max_point = (max_x, max_y)
+        return self.get_objects_for_rect(check_object.left, check_object.right,
+                                         check_object.bottom, check_object.top)
 
+    def get_objects_for_rect(self, min_x: float, max_x: float,
+                             min_y: float, max_y: float) -> List[Sprite]:
+        """
+        Returns the Sprites in the buckets covering a rectangle. A sprite
+        spanning several buckets may be returned more than once.
+        """
         # hash the minimum and maximum points
-        min_point, max_point = self._hash(min_point), self._hash(max_point)
+        min_point, max_point = self._hash((min_x, min_y)), self._hash((max_x, max_y))
 
         close_by_sprites = []
         # iterate over the rectangular region
         for i in range(min_point[0], max_point[0] + 1):
             for j in range(min_point[1], max_point[1] + 1):
-                # print(f"Checking {i}, {j}")
-                # append to each intersecting cell
-                new_items = self.contents.setdefault((i, j), [])
-                # for item in new_items:
-                #     print(f"Found {item.guid} in {i}, {j}")
-                close_by_sprites.extend(new_items)
+                new_items = self.contents.get((i, j))
+                if new_items:
+                    close_by_sprites.extend(new_items)
 
         return close_by_sprites
 
+    def get_buckets_along_segment(self, start_x: float, start_y: float, end_x: float, end_y: float):
+        """
+        Walk the buckets a line segment passes through, in order, with a
+        DDA grid traversal. Yields (t, sprites) for each one, where t is
+        how far along the segment, from 0 to 1, it leaves the bucket.
+        A bucket met a second time yields no sprites.
+        """
+        size = self.cell_size
+        direction_x = end_x - start_x
+        direction_y = end_y - start_y
+
+        # Walk evenly sized cells. _hash rounds towards zero, which makes
+        # the cells either side of zero share a bucket.
+        cell_x = math.floor(start_x / size)
+        cell_y = math.floor(start_y / size)
+        end_cell = (math.floor(end_x / size), math.floor(end_y / size))
+
+        if direction_x != 0:
+            step_x = 1 if direction_x > 0 else -1
+            t_delta_x = size / abs(direction_x)
+            t_max_x = ((cell_x + (step_x > 0)) * size - start_x) / direction_x
+        else:
+            step_x, t_delta_x, t_max_x = 0, math.inf, math.inf
+        if direction_y != 0:
+            step_y = 1 if direction_y > 0 else -1
+            t_delta_y = size / abs(direction_y)
+            t_max_y = ((cell_y + (step_y > 0)) * size - start_y) / direction_y
+        else:
+            step_y, t_delta_y, t_max_y = 0, math.inf, math.inf
+
+        visited = set()
+        while True:
+            t_exit = min(t_max_x, t_max_y, 1.0)
+            key = (cell_x if cell_x >= 0 else cell_x + 1,
+                   cell_y if cell_y >= 0 else cell_y + 1)
+            if key in visited:
+                yield t_exit, ()
+            else:
+                visited.add(key)
+                yield t_exit, self.contents.get(key, ())
+
+            if t_exit >= 1.0 or (cell_x, cell_y) == end_cell:
+                return
+            if t_max_x < t_max_y:
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                cell_y += step_y
+                t_max_y += t_delta_y
+
+    def get_objects_for_rects(self, rects) -> List[List[Sprite]]:
+        """
+        Batched version of ``get_objects_for_rect``. Takes an (N, 4) array
+        of (min_x, max_x, min_y, max_y) rows and returns a list of sprites
+        for each row, without duplicates.
+
+        Rows that hash to the same range of buckets share one lookup, and
+        one result list, so callers must not modify the lists returned.
+        """
+        rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+        # int() rounds towards zero, so match _hash with trunc rather than floor
+        cells = np.trunc(rects / self.cell_size).astype(np.int64)
+
+        results = []
+        found = {}
+        for cell_range in map(tuple, cells.tolist()):
+            close_by_sprites = found.get(cell_range)
+            if close_by_sprites is None:
+                min_i, max_i, min_j, max_j = cell_range
+                unique_sprites = {}
+                for i in range(min_i, max_i + 1):
+                    for j in range(min_j, max_j + 1):
+                        for sprite in self.contents.get((i, j), ()):
+                            unique_sprites[id(sprite)] = sprite
+                close_by_sprites = list(unique_sprites.values())
+                found[cell_range] = close_by_sprites
+            results.append(close_by_sprites)
+
+        return results
+
+
+def _get_sprite_texture(sprite: Sprite) -> Texture:
+    """
+    The texture a sprite is drawn with. Sprites made from an image, like
+    those of ``draw_text``, get one made for it.
+    """
+    texture = sprite.texture
+    if texture is None:
+        if sprite.image is not None:
+            texture = Texture(0, sprite.image.width, sprite.image.height, sprite.texture_name)
+            texture.image = sprite.image
+        else:
+            texture = load_texture(sprite.texture_name)
+        sprite._texture = texture
+    return texture
+
+
+def _get_sprite_flip(sprite: Sprite) -> Tuple[bool, bool]:
+    """
+    Whether the sprite shader should mirror and flip the texture of a
+    sprite, for the ``in_flip`` of its instance.
+    """
+    texture = _get_sprite_texture(sprite)
+    return texture.mirrored != sprite.mirrored, texture.flipped != sprite.flipped
+
 
 T = TypeVar('T', bound=Sprite)
 
 
 class SpriteList(Generic[T]):
 
-    next_texture_id = 0
-
     def __init__(self, use_spatial_hash=True, spatial_hash_cell_size=128, is_static=False):
         """
         Initialize the sprite list
@@ -241,26 +352,44 @@ def __init__(self, use_spatial_hash=True, spatial_hash_cell_size=128, is_static=
         self.sprite_list = []
         self.sprite_idx = dict()
 
-        # Used in drawing optimization via OpenGL
-        self.program = shader.program(
-            vertex_shader=VERTEX_SHADER,
-            fragment_shader=FRAGMENT_SHADER
-        )
+        # Used in drawing optimization via OpenGL. The program is shared
+        # with the other sprite lists, and fetched when the list is drawn.
+        self.program = None
         self.sprite_data = None
         self.sprite_data_buf = None
-        self.texture_id = None
-        self.texture = None
         self.vao = None
         self.vbo_buf = None
 
-        self.array_of_texture_names = []
-        self.array_of_images = []
+        # The texture atlas the sprite data points into, and its generation
+        self._atlas = None
+        self._atlas_generation = None
+        # Textures loaded by preload_textures, kept so they stay in the atlas
+        self.preloaded_textures = []
+
+        # Positions saved by save_previous_positions, for interpolated
+        # drawing, and the sprites they belong to
+        self.previous_positions = None
+        self.previous_sprites = None
 
         # Used in collision detection optimization
         self.spatial_hash = SpatialHash(cell_size=spatial_hash_cell_size)
         self.use_spatial_hash = use_spatial_hash
         self.is_static = is_static
 
+        # Collision categories and masks of the sprites, as an (N, 2) array
+        # built when needed. Collision checks only look at them once a
+        # sprite with a mask that leaves out some categories is added.
+        self.collision_filters = None
+        self.use_collision_masks = False
+
+        # Sensors, with their own spatial hash, and the sprites that moved
+        # since they were last updated
+        self.sensors = []
+        self.sensor_hash = SpatialHash(cell_size=spatial_hash_cell_size)
+        self._moved_sprites = set()
+        self._moved_sensors = set()
+        self._sensor_contacts = {}
+
     def append(self, item: T):
         """
         Add a new sprite to the list.
@@ -270,6 +399,11 @@ def append(self, item: T):
         self.sprite_idx[item] = idx
         item.register_sprite_list(self)
         self.vao = None
+        self.collision_filters = None
+        if item.collision_mask != COLLISION_MASK_ALL:
+            self.use_collision_masks = True
+        if self.sensors:
+            self._moved_sprites.add(item)
         if self.use_spatial_hash:
             self.spatial_hash.insert_object_for_box(item)
 
@@ -285,13 +419,15 @@ def remove(self, item: T):
         self.sprite_list.remove(item)
 
         # Rebuild index list
-        self.sprite_idx[item] = dict()
+        self.sprite_idx = dict()
         for idx, sprite in enumerate(self.sprite_list):
             self.sprite_idx[sprite] = idx
 
         self.vao = None
+        self.collision_filters = None
         if self.use_spatial_hash:
             self.spatial_hash.remove_object(item)
+        self._remove_from_sensors(item)
 
     def update(self):
         """
@@ -316,8 +452,33 @@ def move(self, change_x: float, change_y: float):
             sprite.center_y += change_y
 
     def preload_textures(self, texture_names):
-        self.array_of_texture_names.extend(texture_names)
-        self.array_of_images = None
+        """
+        Load textures and add them to the texture atlas ahead of time, so
+        sprites can switch to them later without a pause.
+        """
+        from arcade.texture_atlas import get_texture_atlas
+
+        atlas = get_texture_atlas()
+        for texture_name in texture_names:
+            texture = load_texture(texture_name)
+            self.preloaded_textures.append(texture)
+            atlas.get_tex_coords(texture)
+
+    def _get_sprite_tex_coords(self):
+        """
+        The texture atlas coordinates of each sprite, as a list. If the atlas
+        is packed again while the sprites are added to it, they are looked
+        up again.
+        """
+        from arcade.texture_atlas import get_texture_atlas
+
+        atlas = self._atlas = get_texture_atlas()
+        while True:
+            generation = atlas.generation
+            tex_coords = [atlas.get_tex_coords(_get_sprite_texture(sprite)) for sprite in self.sprite_list]
+            if atlas.generation == generation:
+                self._atlas_generation = generation
+                return tex_coords
 
     def calculate_sprite_buffer(self):
 
@@ -338,107 +499,19 @@ def calculate_sprite_buffer(self):
             array_of_sizes.append([size_w, size_h])
             array_of_colors.append(sprite.color + (sprite.alpha, ))
 
-        new_array_of_texture_names = []
-        new_array_of_images = []
-        new_texture = False
-        if self.array_of_images is None:
-            new_texture = True
-
-        # print()
-        # print("New texture start: ", new_texture)
-
-        for sprite in self.sprite_list:
-
-            name_of_texture_to_check = sprite.texture_name
-            if name_of_texture_to_check not in self.array_of_texture_names:
-                new_texture = True
-                # print("New because of ", name_of_texture_to_check)
-
-            if name_of_texture_to_check not in new_array_of_texture_names:
-                if sprite.image is not None:
-                    new_array_of_texture_names.append(name_of_texture_to_check)
-                    image = sprite.image
-                else:
-                    new_array_of_texture_names.append(name_of_texture_to_check)
-                    image = Image.open(name_of_texture_to_check)
-                new_array_of_images.append(image)
-
-        # print("New texture end: ", new_texture)
-        # print(new_array_of_texture_names)
-        # print(self.array_of_texture_names)
-        # print()
-
-        if new_texture:
-            # Add back in any old textures. Chances are we'll need them.
-            for old_texture_name in self.array_of_texture_names:
-                if old_texture_name not in new_array_of_texture_names:
-                    new_array_of_texture_names.append(old_texture_name)
-                    image = Image.open(old_texture_name)
-                    new_array_of_images.append(image)
-
-            self.array_of_texture_names = new_array_of_texture_names
-
-            self.array_of_images = new_array_of_images
-            # print(f"New Texture Atlas with names {self.array_of_texture_names}")
-
-        # Get their sizes
-        widths, heights = zip(*(i.size for i in self.array_of_images))
-
-        # Figure out what size a composite would be
-        total_width = sum(widths)
-        max_height = max(heights)
-
-        if new_texture:
-
-            # TODO: This code isn't valid, but I think some releasing might be in order.
-            # if self.texture is not None:
-            #     shader.Texture.release(self.texture_id)
-
-            # Make the composite image
-            new_image = Image.new('RGBA', (total_width, max_height))
-
-            x_offset = 0
-            for image in self.array_of_images:
-                new_image.paste(image, (x_offset, 0))
-                x_offset += image.size[0]
-
-            # Create a texture out the composite image
-            self.texture = shader.texture(
-                (new_image.width, new_image.height),
-                4,
-                np.asarray(new_image)
-            )
-
-            if self.texture_id is None:
-                self.texture_id = SpriteList.next_texture_id
-
-        # Create a list with the coordinates of all the unique textures
-        tex_coords = []
-        start_x = 0.0
-        for image in self.array_of_images:
-            end_x = start_x + (image.width / total_width)
-            normalized_width = image.width / total_width
-            start_height = 1 - (image.height / max_height)
-            normalized_height = image.height / max_height
-            tex_coords.append([start_x, start_height, normalized_width, normalized_height])
-            start_x = end_x
-
-        # Go through each sprite and pull from the coordinate list, the proper
-        # coordinates for that sprite's image.
-        array_of_sub_tex_coords = []
-        for sprite in self.sprite_list:
-            index = self.array_of_texture_names.index(sprite.texture_name)
-            array_of_sub_tex_coords.append(tex_coords[index])
+        # The textures come from the texture atlas shared by all the lists
+        array_of_sub_tex_coords = self._get_sprite_tex_coords()
 
         # Create numpy array with info on location and such
         buffer_type = np.dtype([('position', '2f4'), ('angle', 'f4'), ('size', '2f4'),
-                                ('sub_tex_coords', '4f4'), ('color', '4B')])
+                                ('sub_tex_coords', '4f4'), ('color', '4B'), ('flip', '2B')])
         self.sprite_data = np.zeros(len(self.sprite_list), dtype=buffer_type)
         self.sprite_data['position'] = array_of_positions
         self.sprite_data['angle'] = array_of_angles
         self.sprite_data['size'] = array_of_sizes
         self.sprite_data['sub_tex_coords'] = array_of_sub_tex_coords
         self.sprite_data['color'] = array_of_colors
+        self.sprite_data['flip'] = [_get_sprite_flip(sprite) for sprite in self.sprite_list]
 
         if self.is_static:
             usage = 'static'
@@ -466,13 +539,17 @@ def calculate_sprite_buffer(self):
         )
         pos_angle_scale_buf_desc = shader.BufferDescription(
             self.sprite_data_buf,
-            '2f 1f 2f 4f 4B',
-            ('in_pos', 'in_angle', 'in_scale', 'in_sub_tex_coords', 'in_color'),
+            '2f 1f 2f 4f 4B 2B',
+            ('in_pos', 'in_angle', 'in_scale', 'in_sub_tex_coords', 'in_color', 'in_flip'),
             normalized=['in_color'], instanced=True)
 
         vao_content = [vbo_buf_desc, pos_angle_scale_buf_desc]
 
         # Can add buffer to index vertices
+        self.program = shader.program(
+            vertex_shader=VERTEX_SHADER,
+            fragment_shader=FRAGMENT_SHADER
+        )
         self.vao = shader.vertex_array(self.program, vao_content)
 
     def update_positions(self):
@@ -490,10 +567,22 @@ def update_texture(self, sprite):
         if self.vao is None:
             return
 
-        self.calculate_sprite_buffer()
+        atlas = self._atlas
+        generation = atlas.generation
+        i = self.sprite_idx[sprite]
+        self.sprite_data[i]['sub_tex_coords'] = atlas.get_tex_coords(_get_sprite_texture(sprite))
+        self.sprite_data[i]['size'] = [sprite.width / 2, sprite.height / 2]
+        self.sprite_data[i]['flip'] = _get_sprite_flip(sprite)
+        if atlas.generation != generation:
+            self.sprite_data['sub_tex_coords'] = self._get_sprite_tex_coords()
+        if self.is_static:
+            self.sprite_data_buf.write(self.sprite_data.tobytes())
 
     def update_position(self, sprite):
 
+        if self.sensors:
+            self._moved_sprites.add(sprite)
+
         if self.vao is None:
             return
 
@@ -506,6 +595,9 @@ def update_position(self, sprite):
 
     def update_location(self, sprite):
 
+        if self.sensors:
+            self._moved_sprites.add(sprite)
+
         if self.vao is None:
             return
 
@@ -515,6 +607,9 @@ def update_location(self, sprite):
 
     def update_angle(self, sprite):
 
+        if self.sensors:
+            self._moved_sprites.add(sprite)
+
         if self.vao is None:
             return
 
@@ -522,15 +617,309 @@ def update_angle(self, sprite):
 
         self.sprite_data[i]['angle'] = math.radians(sprite.angle)
 
-    def draw(self):
+    def save_previous_positions(self):
+        """
+        Save where the sprites are now, so ``draw`` can blend between
+        these positions and the ones after the next update.
+        """
+        if self.vao is not None:
+            self.previous_positions = self.sprite_data['position'].copy()
+        else:
+            self.previous_positions = np.array([sprite.position for sprite in self.sprite_list],
+                                               dtype=np.float32).reshape(-1, 2)
+        self.previous_sprites = list(self.sprite_list)
 
+    def _get_previous_positions(self, positions: np.ndarray) -> Optional[np.ndarray]:
+        """
+        The saved positions, lined up with the sprites now in the list.
+        ``positions`` are where they are now, which sprites added since the
+        positions were saved keep. None if nothing was saved.
+        """
+        if self.previous_positions is None:
+            return None
+        if self.previous_sprites == self.sprite_list:
+            return self.previous_positions
+
+        saved = {sprite: i for i, sprite in enumerate(self.previous_sprites)}
+        previous = positions.copy()
+        for i, sprite in enumerate(self.sprite_list):
+            j = saved.get(sprite)
+            if j is not None:
+                previous[i] = self.previous_positions[j]
+        return previous
+
+    def add_sensor(self, sensor):
+        """
+        Start tracking which sprites of this list are inside a Sensor.
+        Sprites already inside it are reported on the next ``update_sensors``.
+        """
+        self.sensors.append(sensor)
+        sensor.left, sensor.right, sensor.bottom, sensor.top = sensor.get_bounds()
+        self.sensor_hash.insert_object_for_box(sensor)
+        self._moved_sensors.add(sensor)
+
+    def remove_sensor(self, sensor):
+        """
+        Stop tracking a Sensor. No ``on_exit`` calls are made for the
+        sprites still inside it.
+        """
+        self.sensors.remove(sensor)
+        self.sensor_hash.remove_object(sensor)
+        self._moved_sensors.discard(sensor)
+        for sprite in sensor.sprites:
+            self._sensor_contacts[sprite].discard(sensor)
+        sensor.sprites.clear()
+
+    def _remove_from_sensors(self, sprite):
+        """
+        A sprite left the list, so it left all the sensors too.
+        """
+        self._moved_sprites.discard(sprite)
+        for sensor in self._sensor_contacts.pop(sprite, ()):
+            sensor.sprites.discard(sprite)
+            if sensor.on_exit is not None:
+                sensor.on_exit(sprite)
+
+    def _set_sensor_contact(self, sensor, sprite, inside: bool, events: list):
+        """
+        Record whether a sprite is inside a sensor, queueing an event if
+        that changed.
+        """
+        if inside == (sprite in sensor.sprites):
+            return
+        contacts = self._sensor_contacts.setdefault(sprite, set())
+        if inside:
+            sensor.sprites.add(sprite)
+            contacts.add(sensor)
+            events.append((sensor.on_enter, sprite))
+        else:
+            sensor.sprites.discard(sprite)
+            contacts.discard(sensor)
+            events.append((sensor.on_exit, sprite))
+
+    def update_sensors(self):
+        """
+        Bring the sensors up to date with the sprites that moved, and
+        call ``on_enter`` and ``on_exit`` for the changes.
+
+        Only sprites that moved since the last call are checked, against
+        the sensors near them. Sensors whose region moved are checked
+        against the sprites near them.
+        """
+        events = []
+
+        # Refile the sensors that moved, and recheck everything near them
+        for sensor in self.sensors:
+            bounds = sensor.get_bounds()
+            if bounds != (sensor.left, sensor.right, sensor.bottom, sensor.top):
+                self.sensor_hash.remove_object(sensor)
+                sensor.left, sensor.right, sensor.bottom, sensor.top = bounds
+                self.sensor_hash.insert_object_for_box(sensor)
+                self._moved_sensors.add(sensor)
+
+        for sensor in self._moved_sensors:
+            if self.use_spatial_hash:
+                nearby = self.spatial_hash.get_objects_for_rect(sensor.left, sensor.right,
+                                                                sensor.bottom, sensor.top)
+            else:
+                nearby = self.sprite_list
+            for sprite in set(nearby) | sensor.sprites:
+                self._set_sensor_contact(sensor, sprite, sensor.overlaps(sprite), events)
+        self._moved_sensors.clear()
+
+        # Recheck the sprites that moved against the sensors near them
+        for sprite in self._moved_sprites:
+            nearby = set(self.sensor_hash.get_objects_for_box(sprite))
+            for sensor in nearby | self._sensor_contacts.get(sprite, set()):
+                self._set_sensor_contact(sensor, sprite, sensor.overlaps(sprite), events)
+        self._moved_sprites.clear()
+
+        for callback, sprite in events:
+            if callback is not None:
+                callback(sprite)
+
+    def raycast(self, start: Tuple[float, float], end: Tuple[float, float]) -> Optional[RaycastHit]:
+        """
+        Find the first sprite the line segment from ``start`` to ``end``
+        runs into, for line of sight checks and the like.
+
+        Returns a ``RaycastHit`` with the sprite, the distance from
+        ``start`` and the point where the segment meets the sprite, or
+        None if nothing is in the way. A segment starting inside a sprite
+        hits it at distance 0.
+
+        With the spatial hash, only the sprites in the buckets along the
+        segment are tested, nearest buckets first, stopping as soon as
+        nothing further along can be closer.
+        """
+        from arcade.geometry import get_segment_polygon_intersection
+
+        best_t = None
+        best_sprite = None
+
+        if self.use_spatial_hash:
+            checked = set()
+            for t_exit, bucket in self.spatial_hash.get_buckets_along_segment(start[0], start[1], end[0], end[1]):
+                for sprite in bucket:
+                    if id(sprite) in checked:
+                        continue
+                    checked.add(id(sprite))
+                    t = get_segment_polygon_intersection(start, end, sprite.points)
+                    if t is not None and (best_t is None or t < best_t):
+                        best_t, best_sprite = t, sprite
+                if best_t is not None and best_t <= t_exit:
+                    break
+        else:
+            for sprite in self.sprite_list:
+                t = get_segment_polygon_intersection(start, end, sprite.points)
+                if t is not None and (best_t is None or t < best_t):
+                    best_t, best_sprite = t, sprite
+
+        if best_sprite is None:
+            return None
+
+        direction_x = end[0] - start[0]
+        direction_y = end[1] - start[1]
+        return RaycastHit(best_sprite, best_t * math.hypot(direction_x, direction_y),
+                          (start[0] + best_t * direction_x, start[1] + best_t * direction_y))
+
+    def raycast_batch(self, starts, ends) -> List[Optional[RaycastHit]]:
+        """
+        ``raycast`` for many segments at once. ``starts`` and ``ends`` are
+        sequences, or (N, 2) arrays, of points. Returns a list with a
+        ``RaycastHit`` or None for each segment.
+
+        The sprites near any of the segments are gathered once, and all the
+        segments are tested against all their edges with numpy.
+        """
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+        ray_count = len(starts)
+
+        if self.use_spatial_hash:
+            unique_sprites = {}
+            for (start_x, start_y), (end_x, end_y) in zip(starts.tolist(), ends.tolist()):
+                for _, bucket in self.spatial_hash.get_buckets_along_segment(start_x, start_y, end_x, end_y):
+                    for sprite in bucket:
+                        unique_sprites[id(sprite)] = sprite
+            candidates = list(unique_sprites.values())
+        else:
+            candidates = self.sprite_list
+        if ray_count == 0 or len(candidates) == 0:
+            return [None] * ray_count
+
+        # One row per polygon edge, (x1, y1, x2, y2), grouped by sprite
+        edges = []
+        first_edges = []
+        for sprite in candidates:
+            points = sprite.points
+            first_edges.append(len(edges))
+            edges.extend((points[i - 1][0], points[i - 1][1], points[i][0], points[i][1])
+                         for i in range(len(points)))
+        edges = np.array(edges, dtype=np.float64)
+        edge_start = edges[:, 0:2]
+        edge_vector = edges[:, 2:4] - edge_start
+
+        results = []
+        # Keep the (rays, edges) arrays to about a million entries
+        chunk_size = max(1, 1000000 // len(edges))
+        for first_ray in range(0, ray_count, chunk_size):
+            start = starts[first_ray:first_ray + chunk_size, np.newaxis, :]
+            direction = ends[first_ray:first_ray + chunk_size, np.newaxis, :] - start
+            offset = edge_start[np.newaxis, :, :] - start
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                denominator = direction[..., 0] * edge_vector[:, 1] - direction[..., 1] * edge_vector[:, 0]
+                t = (offset[..., 0] * edge_vector[:, 1] - offset[..., 1] * edge_vector[:, 0]) / denominator
+                u = (offset[..., 0] * direction[..., 1] - offset[..., 1] * direction[..., 0]) / denominator
+                t[~((denominator != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1))] = np.inf
+
+                # Segments starting inside a polygon, by counting the edges a
+                # ray going right from the start crosses, like is_point_in_polygon
+                y = start[..., 1]
+                y1 = edges[:, 1]
+                y2 = edges[:, 3]
+                crossing_x = edges[:, 0] + (y - y1) * edge_vector[:, 0] / edge_vector[:, 1]
+                crosses = ((y1 > y) != (y2 > y)) & (start[..., 0] < crossing_x)
+
+            sprite_t = np.minimum.reduceat(t, first_edges, axis=1)
+            inside = np.add.reduceat(crosses.astype(np.int32), first_edges, axis=1) % 2 == 1
+            sprite_t[inside] = 0.0
+
+            nearest = np.argmin(sprite_t, axis=1)
+            nearest_t = sprite_t[np.arange(len(nearest)), nearest]
+            lengths = np.hypot(direction[:, 0, 0], direction[:, 0, 1])
+            for i, (index, hit_t) in enumerate(zip(nearest.tolist(), nearest_t.tolist())):
+                if hit_t == np.inf:
+                    results.append(None)
+                else:
+                    results.append(RaycastHit(candidates[index], hit_t * lengths[i].item(),
+                                              ((start[i, 0, 0] + hit_t * direction[i, 0, 0]).item(),
+                                               (start[i, 0, 1] + hit_t * direction[i, 0, 1]).item())))
+
+        return results
+
+    def update_collision_filter(self, sprite):
+        """
+        Called by a sprite in this list when its collision category or mask
+        changes, to keep the list's collision filters up to date.
+        """
+        if sprite.collision_mask != COLLISION_MASK_ALL:
+            self.use_collision_masks = True
+
+        if self.collision_filters is None:
+            return
+
+        i = self.sprite_idx[sprite]
+
+        self.collision_filters[i] = [sprite.collision_category, sprite.collision_mask]
+
+    def filter_collision_candidates(self, sprite: Sprite, candidates: Iterable[Sprite] = None) -> List[Sprite]:
+        """
+        Return the sprites of this list, or of ``candidates`` if given, that
+        ``sprite`` is allowed to collide with: each one's category has to be
+        in the other's mask. No geometry is checked.
+
+        ``candidates`` must be sprites of this list, for example the ones
+        found by its spatial hash.
+        """
+        if self.collision_filters is None:
+            self.collision_filters = np.array(
+                [(item.collision_category, item.collision_mask) for item in self.sprite_list],
+                dtype=np.uint32).reshape(-1, 2)
+
+        if candidates is None:
+            indices = np.arange(len(self.sprite_list))
+        else:
+            indices = np.array([self.sprite_idx[item] for item in candidates], dtype=np.intp)
+
+        filters = self.collision_filters[indices]
+        allowed = (filters[:, 0] & sprite.collision_mask != 0) & (filters[:, 1] & sprite.collision_category != 0)
+        return [self.sprite_list[i] for i in indices[allowed].tolist()]
+
+    def draw(self, interpolation: float = None):
+        """
+        Draw the sprites.
+
+        If ``interpolation`` is given, sprites are drawn that fraction of
+        the way from their positions at the last ``save_previous_positions``
+        to their current ones. Sprites added since then are drawn where they
+        are. Static lists are always drawn as they are.
+        """
         if len(self.sprite_list) == 0:
             return
 
         if self.vao is None:
             self.calculate_sprite_buffer()
 
-        self.texture.use(0)
+        # Batched drawing commands given earlier go under the sprites
+        flush_draw_batch()
+
+        if self._atlas.generation != self._atlas_generation:
+            self.sprite_data['sub_tex_coords'] = self._get_sprite_tex_coords()
+            if self.is_static:
+                self.sprite_data_buf.write(self.sprite_data.tobytes())
+        self._atlas.use(0)
 
         gl.glEnable(gl.GL_BLEND)
         gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
@@ -538,11 +927,19 @@ def draw(self):
         # gl.glTexParameterf(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
 
         with self.vao:
-            self.program['Texture'] = self.texture_id
+            self.program['Texture'] = 0
             self.program['Projection'] = get_projection().flatten()
 
             if not self.is_static:
-                self.sprite_data_buf.write(self.sprite_data.tobytes())
+                previous = None
+                if interpolation is not None:
+                    previous = self._get_previous_positions(self.sprite_data['position'])
+                if previous is not None:
+                    sprite_data = self.sprite_data.copy()
+                    sprite_data['position'] = previous + (sprite_data['position'] - previous) * interpolation
+                    self.sprite_data_buf.write(sprite_data.tobytes())
+                else:
+                    self.sprite_data_buf.write(self.sprite_data.tobytes())
 
             self.vao.render(gl.GL_TRIANGLE_STRIP, instances=len(self.sprite_list))
 
@@ -564,8 +961,9 @@ def pop(self) -> Sprite:
         """
         Pop off the last sprite in the list.
         """
-        self.program = None
-        return self.sprite_list.pop()
+        item = self.sprite_list[-1]
+        self.remove(item)
+        return item
 
 
 def get_closest_sprite(sprite1: Sprite, sprite_list: SpriteList) -> (Sprite, float):
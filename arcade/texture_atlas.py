@@ -0,0 +1,335 @@
+"""
+A texture atlas shared by textured rectangles, and the list of textured
+quads drawn from it.
+
+Textures are packed into one large GL texture, row by row, the first time
+they are drawn. ``draw_texture_rectangle`` and ``Sprite.draw`` then only
+add a row of instance data for the sprite shader, so rectangles with
+different textures are drawn together with one instanced draw call.
+"""
+
+import math
+import weakref
+
+import numpy as np
+import PIL.Image
+import pyglet.gl as gl
+
+from arcade.draw_commands import Texture
+from arcade.draw_commands import flush_draw_batch
+from arcade.sprite_list import FRAGMENT_SHADER
+from arcade.sprite_list import VERTEX_SHADER
+from arcade.window_commands import get_projection
+from arcade import shader
+
+# Size of a new atlas. It grows up to MAX_ATLAS_SIZE when full.
+ATLAS_SIZE = 1024
+MAX_ATLAS_SIZE = 4096
+# Empty pixels around each texture, so linear filtering doesn't pick up
+# its neighbours
+ATLAS_PADDING = 1
+
+# Instance data of a quad, laid out like the sprite list buffer
+textured_quad_type = np.dtype([
+    ('position', '2f4'),
+    ('angle', 'f4'),
+    ('size', '2f4'),
+    ('sub_tex_coords', '4f4'),
+    ('color', '4B'),
+    ('flip', '2B'),
+])
+
+
+def _get_texture_image(texture: Texture) -> np.ndarray:
+    """
+    The pixels of a texture as a (height, width, 4) uint8 array. Textures
+    made without an image are read from their file.
+    """
+    image = texture.image
+    if image is None:
+        image = PIL.Image.open(texture.texture_name)
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return np.asarray(image)
+
+
+class TextureAtlas:
+    """
+    Textures packed into one GL texture.
+
+    Textures are added by ``get_tex_coords``, and uploaded the next time
+    the atlas is used. When the atlas is full it is packed again, twice as
+    large if need be, and ``generation`` goes up: texture coordinates
+    taken before then are no longer valid.
+
+    The atlas only holds on to its textures weakly, and the space of those
+    that are gone is given back when it is next packed again. Textures that
+    are regions of a sheet are drawn from the place of the whole sheet.
+
+    >>> atlas = TextureAtlas(64, 64)
+    >>> atlas._allocate(30, 20)
+    (0, 0)
+    >>> atlas._allocate(30, 10)
+    (31, 0)
+    >>> atlas._allocate(10, 10)
+    (0, 21)
+    """
+
+    def __init__(self, width: int=ATLAS_SIZE, height: int=ATLAS_SIZE):
+        self.width = width
+        self.height = height
+        self.generation = 0
+        self.texture = None
+        # (x, y, width, height) of each texture, in pixels from the top left
+        self.regions = weakref.WeakKeyDictionary()
+        # Pixels waiting to be uploaded, as (x, y, array)
+        self._uploads = []
+        self._shelf_x = 0
+        self._shelf_y = 0
+        self._shelf_height = 0
+
+    def _allocate(self, width: int, height: int):
+        """
+        Find room for an image, on the current row or a new one. None if
+        the atlas is full.
+        """
+        if self._shelf_x + width > self.width:
+            self._shelf_x = 0
+            self._shelf_y += self._shelf_height
+            self._shelf_height = 0
+        if width > self.width or self._shelf_y + height > self.height:
+            return None
+
+        position = self._shelf_x, self._shelf_y
+        self._shelf_x += width + ATLAS_PADDING
+        self._shelf_height = max(self._shelf_height, height + ATLAS_PADDING)
+        return position
+
+    def _repack(self, new_images):
+        """
+        Pack the textures still alive and the new ones again, growing
+        the atlas until they fit.
+        """
+        images = [(texture, _get_texture_image(texture)) for texture in list(self.regions.keys())]
+        images.extend(new_images)
+        images.sort(key=lambda item: item[1].shape[0], reverse=True)
+
+        while True:
+            self.regions.clear()
+            self._uploads = []
+            self._shelf_x = self._shelf_y = self._shelf_height = 0
+            for texture, image in images:
+                height, width = image.shape[:2]
+                position = self._allocate(width, height)
+                if position is None:
+                    break
+                self.regions[texture] = position + (width, height)
+                self._uploads.append(position + (image,))
+            else:
+                break
+
+            if self.width >= MAX_ATLAS_SIZE and self.height >= MAX_ATLAS_SIZE:
+                raise ValueError(f"The textures don't fit in a {MAX_ATLAS_SIZE} pixel atlas.")
+            self.width = min(2 * self.width, MAX_ATLAS_SIZE)
+            self.height = min(2 * self.height, MAX_ATLAS_SIZE)
+
+        # Everything is uploaded again, to a new texture
+        self.texture = None
+        self.generation += 1
+
+    def get_tex_coords(self, texture: Texture):
+        """
+        The region of the atlas holding a texture, in the form the sprite
+        shader takes for ``in_sub_tex_coords``. The texture is added if it
+        isn't there yet.
+        """
+        # Regions of a sheet are drawn from the place of the whole sheet
+        key = texture.sheet if texture.sheet is not None else texture
+        region = self.regions.get(key)
+        if region is None:
+            image = _get_texture_image(key)
+            height, width = image.shape[:2]
+            position = self._allocate(width, height)
+            if position is None:
+                self._repack([(key, image)])
+            else:
+                self.regions[key] = position + (width, height)
+                self._uploads.append(position + (image,))
+            region = self.regions[key]
+
+        x, y, width, height = region
+        if texture.sheet is not None:
+            region_x, region_y, width, height = texture.region
+            x += region_x
+            y += region_y
+
+        # The shader flips the texture coordinates, and the texture repeats.
+        # Mirroring and flipping the region is up to the instance.
+        return (x / self.width, 1 - (y + height) / self.height,
+                width / self.width, height / self.height)
+
+    def use(self, texture_unit: int=0):
+        """
+        Upload the textures added since the last use, and bind the atlas.
+        """
+        if self.texture is None:
+            self.texture = shader.texture((self.width, self.height), 4,
+                                          np.zeros((self.height, self.width, 4), dtype=np.uint8))
+        for x, y, image in self._uploads:
+            self.texture.write(image, x, y)
+        self._uploads = []
+        self.texture.use(texture_unit)
+
+
+_texture_atlases = weakref.WeakKeyDictionary()
+
+
+def get_texture_atlas() -> TextureAtlas:
+    """
+    The texture atlas of the current OpenGL context. Contexts sharing
+    their objects share it.
+    """
+    object_space = gl.current_context.object_space
+    atlas = _texture_atlases.get(object_space)
+    if atlas is None:
+        atlas = _texture_atlases[object_space] = TextureAtlas()
+    return atlas
+
+
+class TexturedQuadList:
+    """
+    Textured rectangles drawn from the texture atlas with one instanced
+    draw call, using the sprite shader.
+
+    This is what ``draw_texture_rectangle`` and ``Sprite.draw`` use, and
+    what the draw batch collects them in.
+    """
+
+    def __init__(self):
+        self._instances = np.zeros(64, dtype=textured_quad_type)
+        self._textures = []
+        self._count = 0
+        # The atlas, and its generation, the texture coordinates are from
+        self._atlas = None
+        self._generation = None
+
+        self.context = None
+        self.program = None
+        self.vbo = None
+        self.instance_vbo = None
+        self.vao = None
+
+    def append(self, center_x: float, center_y: float, width: float, height: float,
+               texture: Texture, angle: float=0, color=(255, 255, 255, 255),
+               mirrored: bool=False, flipped: bool=False) -> int:
+        """
+        Add a rectangle showing a texture. ``color`` is RGBA, and tints the
+        texture. ``mirrored`` and ``flipped`` turn the texture over, on top
+        of how the texture itself is. Returns its index.
+        """
+        atlas = get_texture_atlas()
+        if self._count == 0:
+            self._atlas = atlas
+            self._generation = atlas.generation
+        elif atlas is not self._atlas:
+            self._atlas = atlas
+            self._generation = None
+
+        if self._count == len(self._instances):
+            instances = np.zeros(2 * len(self._instances), dtype=textured_quad_type)
+            instances[:self._count] = self._instances
+            self._instances = instances
+
+        index = self._count
+        self._instances[index] = ((center_x, center_y), math.radians(angle), (width / 2, height / 2),
+                                  atlas.get_tex_coords(texture), color,
+                                  (texture.mirrored != mirrored, texture.flipped != flipped))
+        self._textures.append(texture)
+        self._count += 1
+        return index
+
+    def clear(self):
+        """
+        Remove all the rectangles.
+        """
+        self._textures = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _update_tex_coords(self):
+        """
+        Look the textures up again if the atlas was packed again since
+        they were added.
+        """
+        atlas = self._atlas
+        while self._generation != atlas.generation:
+            self._generation = atlas.generation
+            for index, texture in enumerate(self._textures):
+                self._instances[index]['sub_tex_coords'] = atlas.get_tex_coords(texture)
+
+    def draw(self, first: int=0, count: int=None, blend: bool=True):
+        """
+        Draw all the rectangles, or ``count`` of them starting at ``first``.
+        Without ``blend``, they cover what is behind them, even where the
+        texture is transparent.
+        """
+        flush_draw_batch()
+
+        if count is None:
+            count = self._count - first
+        count = min(count, self._count - first)
+        if count <= 0:
+            return
+
+        self._update_tex_coords()
+        instances = self._instances[first:first + count]
+
+        context = gl.current_context
+        if self.context is not context:
+            self.context = context
+            self.program = shader.program(
+                vertex_shader=VERTEX_SHADER,
+                fragment_shader=FRAGMENT_SHADER
+            )
+            vertices = np.array([
+                #  x,    y,   u,   v
+                -1.0, -1.0, 0.0, 0.0,
+                -1.0, 1.0, 0.0, 1.0,
+                1.0, -1.0, 1.0, 0.0,
+                1.0, 1.0, 1.0, 1.0,
+            ], dtype=np.float32)
+            self.vbo = shader.buffer(vertices)
+            self.instance_vbo = None
+
+        if self.instance_vbo is None or self.instance_vbo.size < instances.nbytes:
+            size = max(1024, 1 << (instances.nbytes - 1).bit_length())
+            self.instance_vbo = shader.Buffer.create_with_size(size, usage='stream')
+            vao_content = [
+                shader.BufferDescription(self.vbo, '2f 2f', ('in_vert', 'in_texture')),
+                shader.BufferDescription(
+                    self.instance_vbo,
+                    '2f 1f 2f 4f 4B 2B',
+                    ('in_pos', 'in_angle', 'in_scale', 'in_sub_tex_coords', 'in_color', 'in_flip'),
+                    normalized=['in_color'],
+                    instanced=True
+                ),
+            ]
+            self.vao = shader.vertex_array(self.program, vao_content)
+
+        self.instance_vbo.orphan()
+        self.instance_vbo.write(instances)
+
+        self._atlas.use(0)
+
+        if blend:
+            gl.glEnable(gl.GL_BLEND)
+            gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+        else:
+            gl.glDisable(gl.GL_BLEND)
+
+        with self.vao:
+            self.program['Texture'] = 0
+            self.program['Projection'] = get_projection().flatten()
+            self.vao.render(gl.GL_TRIANGLE_STRIP, instances=count)
@@ -157,6 +157,10 @@ def set_viewport(left: Number, right: Number, bottom: Number, top: Number):
     global _top
     global _projection
 
+    # Batched drawing commands were given for the old projection
+    from arcade.draw_commands import flush_draw_batch
+    flush_draw_batch()
+
     _left = left
     _right = right
     _bottom = bottom
@@ -182,6 +186,15 @@ def get_viewport() -> (float, float, float, float):
     return _left, _right, _bottom, _top
 
 
+def _get_pixel_scale() -> float:
+    """
+    Pixels per unit for the current window and viewport.
+    """
+    if _window is None or _right == _left or _top == _bottom:
+        return 1
+    return max(_window.width / abs(_right - _left), _window.height / abs(_top - _bottom))
+
+
 def open_window(width: Number, height: Number, window_title: str, resizable: bool = False):
     """
     This function opens a window. For ease-of-use we assume there will only be one window, and the
@@ -245,6 +258,8 @@ def finish_render():
     """
     global _window
 
+    from arcade.draw_commands import flush_draw_batch
+    flush_draw_batch()
     _window.flip()
 
 
@@ -277,6 +292,8 @@ def start_render():
     Get set up to render. Required to be called before drawing anything to the
     screen.
     """
+    from arcade.draw_commands import flush_draw_batch
+    flush_draw_batch()
     gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
     # gl.glMatrixMode(gl.GL_MODELVIEW)
     # gl.glEnableClientState(gl.GL_VERTEX_ARRAY)
@@ -28,3 +28,30 @@ def mock_window(monkeypatch):
 @pytest.fixture
 def pyglet_clock(mocker):
     yield mocker.patch('pyglet.clock')
+
+
+@pytest.fixture
+def make_box():
+    """ Makes sprites with a rectangular hit box and no texture """
+    import arcade
+
+    def make_box(center_x, center_y, width, height):
+        sprite = arcade.Sprite(center_x=center_x, center_y=center_y)
+        sprite.width = width
+        sprite.height = height
+        return sprite
+
+    return make_box
+
+
+@pytest.fixture
+def fake_create_texture():
+    """ Stands in for draw_commands._create_texture, without GL calls """
+    from arcade import Texture
+
+    def fake_create_texture(image, texture_name, width, height):
+        texture = Texture(0, width, height, texture_name)
+        texture.image = image
+        return texture
+
+    return fake_create_texture
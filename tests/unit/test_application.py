@@ -28,15 +28,47 @@ def test_update(mock_window):
 
 def test_set_update_rate_constructor(mock_window, pyglet_clock):
     w = mock_window()
-    pyglet_clock.unschedule.assert_called_with(w.on_update)
-    pyglet_clock.schedule_interval.assert_called_with(w.on_update, 1 / 60)
+    pyglet_clock.unschedule.assert_called_with(w._dispatch_updates)
+    pyglet_clock.schedule_interval.assert_called_with(w._dispatch_updates, 1 / 60)
 
 
 def test_set_update_rate(mock_window, pyglet_clock):
     w = mock_window()
     w.set_update_rate(1 / 2)
-    pyglet_clock.unschedule.assert_called_with(w.on_update, )
-    pyglet_clock.schedule_interval.assert_called_with(w.on_update, 0.5)
+    pyglet_clock.unschedule.assert_called_with(w._dispatch_updates, )
+    pyglet_clock.schedule_interval.assert_called_with(w._dispatch_updates, 0.5)
+    assert pyglet_clock.schedule_interval.call_count == 2
+
+
+def test_dispatch_updates(mock_window, mocker):
+    w = mock_window()
+    mocker.patch.object(w, 'update')
+    mocker.patch.object(w, 'on_update')
+    w._dispatch_updates(0.1)
+    w.update.assert_called_once_with(0.1)
+    w.on_update.assert_called_once_with(0.1)
+
+
+def test_fixed_update_rate(mock_window, mocker):
+    w = mock_window()
+    mocker.patch.object(w, 'on_update')
+    sprite_list = mocker.Mock()
+    w.interpolated_sprite_lists.append(sprite_list)
+    w.set_fixed_update_rate(0.25, max_steps=3)
+
+    w._dispatch_updates(0.125)
+    assert w.on_update.call_count == 0
+    assert w.interpolation_alpha == 0.5
+
+    w._dispatch_updates(0.25)
+    w.on_update.assert_called_once_with(0.25)
+    assert sprite_list.save_previous_positions.call_count == 1
+    assert w.interpolation_alpha == 0.5
+
+    # Falling far behind runs at most max_steps, and drops the rest
+    w._dispatch_updates(2.0)
+    assert w.on_update.call_count == 4
+    assert w.interpolation_alpha == 0.5
 
 
 def test_on_mouse_motion(mock_window):
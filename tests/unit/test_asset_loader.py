@@ -0,0 +1,43 @@
+import pytest
+
+
+def test_asset_loader(monkeypatch, fake_create_texture):
+    from arcade import asset_loader
+    from arcade import draw_commands
+    from arcade import load_texture
+
+    monkeypatch.setattr(asset_loader, '_create_texture', fake_create_texture)
+    monkeypatch.setattr(draw_commands, '_create_texture', fake_create_texture)
+    monkeypatch.setattr(load_texture, 'texture_cache', {})
+    name = "arcade/examples/images/meteorGrey_big1.png"
+
+    loader = asset_loader.AssetLoader(max_workers=2)
+    try:
+        texture_future = loader.load_texture(name, scale=0.5)
+        textures_future = loader.load_textures(name, [[0, 0, 10, 10], [10, 0, 20, 10]])
+        error_future = loader.load_texture(name, 200, 1, 50, 50)
+        map_future = loader.read_tiled_map("arcade/examples/dungeon.tmx")
+
+        # Textures wait for the main thread
+        map_future.result()
+        with pytest.raises(ValueError):
+            error_future.result()
+        assert not texture_future.done()
+        assert loader.progress < 1
+
+        while loader.progress < 1:
+            loader.process_uploads()
+
+        texture = texture_future.result()
+        assert (texture.width, texture.height) == (50.5, 42)
+        assert texture.image.size == (101, 84)
+        textures = textures_future.result()
+        assert [t.region for t in textures] == [(0, 0, 10, 10), (10, 0, 20, 10)]
+        assert textures[0].sheet is textures[1].sheet
+        assert textures[0].sheet.image.size == (101, 84)
+
+        # Loaded textures are shared with load_texture
+        assert load_texture(name, scale=0.5) is texture
+        assert loader.load_texture(name, scale=0.5).result() is texture
+    finally:
+        loader.shutdown()
@@ -42,6 +42,19 @@ def get_data_from_vbo(vbo, count, stride):
     return data
 
 
+def assert_called_with_arrays(mock, *expected):
+    """
+    Compare the arguments of the last call, which may be NumPy arrays. One
+    color given for all the points counts as that color for each of them.
+    """
+    args = mock.call_args[0]
+    assert len(args) == len(expected)
+    for arg, value in zip(args, expected):
+        value = np.asarray(value, dtype=float)
+        arg = np.broadcast_to(np.asarray(arg, dtype=float), value.shape)
+        np.testing.assert_allclose(arg, value, rtol=1e-6)
+
+
 def test_create_line():
     line = create_line(
         start_x=10, start_y=20, end_x=30, end_y=40,
@@ -84,7 +97,8 @@ def test_create_line_generic(mocker):
         shape_mode=gl.GL_LINE_STRIP,
         line_width=2
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(10, 20), (30, 40), (50, 60)],
         [(100, 110, 120, 255), (100, 110, 120, 255), (100, 110, 120, 255)],
         gl.GL_LINE_STRIP,
@@ -99,7 +113,8 @@ def test_create_line_strip(mocker):
         color=(100, 110, 120),
         line_width=2
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(10, 20), (30, 40), (50, 60)],
         [(100, 110, 120, 255), (100, 110, 120, 255), (100, 110, 120, 255)],
         gl.GL_LINE_STRIP,
@@ -114,7 +129,8 @@ def test_create_line_loop(mocker):
         color=(100, 110, 120),
         line_width=2
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(10, 20), (30, 40), (50, 60), (10, 20)],
         [(100, 110, 120, 255), (100, 110, 120, 255),
          (100, 110, 120, 255), (100, 110, 120, 255)],
@@ -130,7 +146,8 @@ def test_create_lines(mocker):
         color=(100, 110, 120),
         line_width=2
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(10, 20), (30, 40), (50, 60), (70, 80)],
         [(100, 110, 120, 255), (100, 110, 120, 255),
          (100, 110, 120, 255), (100, 110, 120, 255)],
@@ -146,7 +163,8 @@ def test_create_polygon(mocker):
         color=(100, 110, 120),
         border_width=2
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(30, 20), (50, 20), (10, 40), (90, 40), (50, 80)],
         [(100, 110, 120, 255), (100, 110, 120, 255), (100, 110, 120, 255),
          (100, 110, 120, 255), (100, 110, 120, 255)],
@@ -161,7 +179,8 @@ def test_create_rectangle(mocker):
         center_x=200, center_y=200, width=50, height=50,
         color=(0, 255, 0), border_width=3, tilt_angle=0
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(175, 175), (175, 225), (225, 175), (225, 225)],
         [(0, 255, 0, 255), (0, 255, 0, 255), (0, 255, 0, 255), (0, 255, 0, 255)],
         gl.GL_TRIANGLE_STRIP,
@@ -175,7 +194,8 @@ def test_create_rectangle_outline(mocker):
         center_x=200, center_y=200, width=50, height=50,
         color=(0, 255, 0), border_width=3, tilt_angle=0
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(175, 175), (175, 225), (225, 225), (225, 175), (175, 175)],
         [(0, 255, 0, 255), (0, 255, 0, 255), (0, 255, 0, 255),
          (0, 255, 0, 255), (0, 255, 0, 255)],
@@ -237,7 +257,8 @@ def test_create_ellipse(mocker):
         center_x=100, center_y=100, width=50, height=80,
         color=(200, 150, 100), num_segments=10
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(150.0, 100.0),
          (140.45084688381107, 52.977173573474644),
          (140.45085003374027, 147.022819489717),
@@ -260,7 +281,8 @@ def test_create_ellipse_outline(mocker):
         center_x=100, center_y=100, width=50, height=80,
         color=(200, 150, 100), num_segments=10
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(150.0, 100.0),
          (140.45085003374027, 147.022819489717),
          (115.4508507380858, 176.08452077368725),
@@ -299,7 +321,8 @@ def test_create_ellipse_filled_with_colors(mocker):
         outside_color=(200, 150, 100), inside_color=(0, 50, 100),
         num_segments=num_segments
     )
-    mock.assert_called_with(
+    assert_called_with_arrays(
+        mock,
         [(100, 100),
          (150.0, 100.0),
          (140.45085003374027, 147.022819489717),
@@ -0,0 +1,35 @@
+import arcade
+
+
+def test_collision_masks(make_box):
+    walls = arcade.SpriteList()
+    wall = make_box(0, 0, 20, 20)
+    walls.append(wall)
+    pickup = make_box(5, 0, 10, 10)
+    pickup.collision_category = 2
+    walls.append(pickup)
+    player = make_box(0, 0, 10, 10)
+
+    assert arcade.check_for_collision_with_list(player, walls) == [wall, pickup]
+    player.collision_mask = 1
+    assert arcade.check_for_collision_with_list(player, walls) == [wall]
+    player.collision_mask = arcade.COLLISION_MASK_ALL
+    wall.collision_mask = 2
+    assert arcade.check_for_collision_with_list(player, walls) == [pickup]
+    assert arcade.probe_for_collision_with_list(player, walls, 1, 0) == [pickup]
+    assert not arcade.check_for_collision(player, wall)
+    assert arcade.check_for_collision(player, pickup)
+
+
+def test_collision_masks_after_pop(make_box):
+    walls = arcade.SpriteList(use_spatial_hash=True)
+    wall = make_box(0, 0, 20, 20)
+    walls.append(wall)
+    popped = make_box(0, 0, 20, 20)
+    walls.append(popped)
+    player = make_box(0, 0, 10, 10)
+    player.collision_mask = 1
+
+    assert walls.pop() is popped
+    assert popped not in walls.sprite_idx
+    assert arcade.check_for_collision_with_list(player, walls) == [wall]
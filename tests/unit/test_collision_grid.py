@@ -0,0 +1,81 @@
+import pytest
+
+import arcade
+
+
+@pytest.fixture
+def level(make_box):
+    walls = arcade.SpriteList()
+    for i in range(20):
+        walls.append(make_box(i * 20 + 10, 10, 20, 20))
+    walls.append(make_box(190, 30, 20, 20))
+    ramp = make_box(110, 30, 20, 20)
+    ramp.points = ((-10, -10), (10, -10), (10, 10))
+    walls.append(ramp)
+    return walls
+
+
+def test_from_sprite_list(level, make_box):
+    walls = level
+    grid = arcade.CollisionGrid.from_sprite_list(walls, 20)
+    assert grid.flags.shape == (2, 20)
+    assert grid.flags[0].tolist() == [arcade.CELL_SOLID] * 20
+    assert grid.flags[1, 5] == arcade.CELL_RAMP
+    assert grid.flags[1, 9] == arcade.CELL_SOLID
+    assert grid.is_blocked(105, 5)
+    assert grid.is_blocked(118, 25)
+    assert not grid.is_blocked(102, 35)
+
+    player = make_box(90, 25, 10, 10)
+    assert arcade.check_for_collision_with_list(player, grid) == []
+    floor = arcade.probe_for_collision_with_list(player, grid, 0, -1)
+    assert [(cell.left, cell.top) for cell in floor] == [(80, 20)]
+    assert arcade.probe_for_collision_with_list(player, grid, 6, 0) == [walls[-1]]
+
+
+def test_outside_grid(level, make_box):
+    walls = level
+    grid = arcade.CollisionGrid.from_sprite_list(walls, 20)
+    for x, y in (16, -100), (-100, 16), (500, 16), (16, 500):
+        sprite = make_box(x, y, 10, 10)
+        assert not grid.is_rect_occupied(sprite.left, sprite.right, sprite.bottom, sprite.top)
+        assert arcade.check_for_collision_with_list(sprite, grid) == []
+        assert arcade.probe_for_collision_with_list(sprite, grid, 1, 1) == []
+
+
+def test_from_sprite_list_unaligned(make_box):
+    walls = arcade.SpriteList()
+    walls.append(make_box(10, 10, 20, 20))
+    walls.append(make_box(35, 10, 20, 20))
+    with pytest.raises(ValueError):
+        arcade.CollisionGrid.from_sprite_list(walls, 20)
+
+
+def test_from_tiled_map():
+    tiled_map = arcade.TiledMap()
+    tiled_map.orientation = "orthogonal"
+    tiled_map.renderorder = "right-down"
+    tiled_map.width = 3
+    tiled_map.tilewidth = tiled_map.tileheight = 32
+    tiled_map.layers_int_data["walls"] = [[0, 0, 1],
+                                          [2, 2, 2]]
+    grid = arcade.CollisionGrid.from_tiled_map(tiled_map, "walls")
+    assert grid.flags.tolist() == [[1, 1, 1], [0, 0, 1]]
+    assert grid.is_blocked(70, 40)
+    assert not grid.is_blocked(10, 40)
+
+
+def test_platformer_on_grid_matches_sprite_list(level, make_box):
+    walls = level
+    grid = arcade.CollisionGrid.from_sprite_list(walls, 20)
+    player = make_box(30, 60, 10, 10)
+    grid_player = make_box(30, 60, 10, 10)
+    player.change_x = grid_player.change_x = 2
+    engine = arcade.PhysicsEnginePlatformer(player, walls)
+    grid_engine = arcade.PhysicsEnginePlatformer(grid_player, grid)
+
+    for _ in range(100):
+        engine.update()
+        grid_engine.update()
+        assert grid_player.position == player.position
+    assert grid_engine.can_jump()
@@ -2,3 +2,301 @@ def test_rotate_point(mock_window):
     from arcade import rotate_point
     x, y = rotate_point(1, 1, 0, 0, 90)
     assert (-1.0, 1.0) == (x, y)
+
+
+def test_draw_batch(mock_window):
+    import arcade
+    from pyglet import gl
+
+    arcade.set_draw_batching(True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        arcade.draw_line(0, 0, 10, 0, arcade.color.RED, 2)
+        arcade.draw_polygon_outline(((0, 0), (10, 0), (10, 10)), arcade.color.RED, 2)
+        arcade.draw_rectangle_filled(5, 5, 10, 10, arcade.color.BLUE)
+        arcade.draw_polygon_filled(((0, 0), (10, 0), (10, 10), (0, 10)), arcade.color.BLUE)
+        arcade.draw_point(1, 1, arcade.color.GREEN, 2)
+        arcade.draw_line(0, 0, 10, 0, arcade.color.RED, 3)
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    assert batch.runs == [[gl.GL_LINES, 2, 0, 8],
+                          [gl.GL_TRIANGLES, 1, 8, 12],
+                          [gl.GL_POINTS, 2, 20, 1],
+                          [gl.GL_LINES, 3, 21, 2]]
+    vertices = batch.vertices['vertex'][:batch.vertex_count].tolist()
+    assert vertices[2:8] == [[0, 0], [10, 0], [10, 0], [10, 10], [10, 10], [0, 0]]
+    assert vertices[14:20] == [[0, 0], [10, 0], [10, 10], [0, 0], [10, 10], [0, 10]]
+    assert batch.vertices['color'][8].tolist() == list(arcade.color.BLUE) + [255]
+
+
+def test_ellipse_tessellation(mock_window):
+    import numpy as np
+    import arcade
+    from arcade.draw_commands import _get_unit_circle, _transform_points
+
+    assert arcade.get_ellipse_segment_count(3, 3) == arcade.MIN_ELLIPSE_SEGMENTS
+    assert arcade.get_ellipse_segment_count(2000, 2000) == arcade.MAX_ELLIPSE_SEGMENTS
+    assert arcade.get_ellipse_segment_count(20, 20) < arcade.get_ellipse_segment_count(50, 50)
+
+    unit_circle = _get_unit_circle(16)
+    assert _get_unit_circle(16) is unit_circle
+    points = _transform_points(unit_circle, 30, 10, 5, 7, 30)
+    for (x, y), (unit_x, unit_y) in zip(points, unit_circle):
+        expected = arcade.rotate_point(5 + 30 * unit_x, 7 + 10 * unit_y, 5, 7, 30)
+        assert np.allclose((x, y), expected, atol=0.01)
+
+
+def test_draw_batch_instanced_shapes(mock_window):
+    import arcade
+    from pyglet import gl
+
+    arcade.set_draw_batching(True, instanced_shapes=True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        arcade.draw_circle_filled(10, 10, 5, arcade.color.RED)
+        arcade.draw_rectangle_outline(30, 10, 10, 4, arcade.color.RED, 2, 45)
+        arcade.draw_points(((0, 0), (1, 1)), arcade.color.GREEN, 2)
+        arcade.draw_line(0, 0, 0, 10, arcade.color.BLUE, 3)
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    assert batch.runs == [[None, None, 0, 2],
+                          [gl.GL_POINTS, 2, 0, 2],
+                          [None, None, 2, 1]]
+    shapes = batch.shapes.instances
+    assert shapes['kind'].tolist() == [arcade.SHAPE_ELLIPSE, arcade.SHAPE_RECTANGLE, arcade.SHAPE_RECTANGLE]
+    assert shapes['size'].tolist() == [[5, 5], [5, 2], [5, 1.5]]
+    assert shapes['border_width'].tolist() == [0, 2, 0]
+    assert shapes['angle'].tolist() == [0, 45, 90]
+    assert shapes['center'][2].tolist() == [0, 5]
+
+
+def test_numpy_point_input(mock_window):
+    import numpy as np
+    import pytest
+    import arcade
+    from arcade.draw_commands import _get_color_array, _get_point_array
+
+    points = np.array(((0, 0), (10, 0), (10, 10)), dtype=np.float32)
+    colors = np.array(((255, 0, 0, 255), (0, 255, 0, 255), (0, 0, 255, 128)), dtype=np.uint8)
+    assert np.shares_memory(_get_point_array(points), points)
+    assert _get_color_array(colors, 3) is colors
+    assert _get_color_array((1, 2, 3), 3).tolist() == [1, 2, 3, 255]
+    assert _get_color_array(((1, 2, 3), (4, 5, 6)), 2).tolist() == [[1, 2, 3, 255], [4, 5, 6, 255]]
+    with pytest.raises(ValueError):
+        _get_color_array(colors, 2)
+
+    arcade.set_draw_batching(True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        arcade.draw_polygon_outline(points, colors, 2)
+        arcade.draw_points(points, arcade.color.RED)
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    assert batch.vertices['vertex'][:6].tolist() == [[0, 0], [10, 0], [10, 0], [10, 10], [10, 10], [0, 0]]
+    assert batch.vertices['color'][:6].tolist() == [colors[i].tolist() for i in (0, 1, 1, 2, 2, 0)]
+    assert batch.vertices['color'][6].tolist() == list(arcade.color.RED) + [255]
+
+
+def test_texture_cache(mock_window):
+    import gc
+    import arcade
+    from arcade.draw_commands import TextureCache
+
+    cache = TextureCache(max_bytes=1000)
+    textures = [arcade.Texture(0, 10, 10, str(i)) for i in range(3)]
+    cache['0'] = textures[0]
+    cache['1'] = textures[1]
+    sprite = arcade.Sprite()
+    sprite.texture = textures[0]
+    assert cache.get('1') is textures[1]
+    assert cache.get('missing') is None
+
+    # The least recently used texture that no sprite uses goes first
+    cache['2'] = textures[2]
+    assert list(cache) == ['0', '2']
+
+    del sprite
+    gc.collect()
+    cache.max_bytes = 400
+    cache.trim()
+    assert list(cache) == ['2']
+    assert cache.get_stats() == arcade.TextureCacheStats(hits=1, misses=1, evictions=2, bytes=400, max_bytes=400)
+
+
+def test_texture_cache_keeps_shared_textures(mock_window, monkeypatch, fake_create_texture):
+    import gc
+    import arcade
+    from arcade import draw_commands
+    from pyglet import gl
+
+    def create_texture(image, texture_name, width, height):
+        texture = fake_create_texture(image, texture_name, width, height)
+        texture.texture_id = gl.GLuint(5)
+        return texture
+
+    monkeypatch.setattr(draw_commands, '_create_texture', create_texture)
+    monkeypatch.setattr(arcade.load_texture, 'texture_cache', draw_commands.TextureCache())
+    name = "arcade/examples/images/meteorGrey_big1.png"
+    texture = arcade.load_texture(name)
+    mirrored = arcade.load_texture(name, mirrored=True)
+    sprite = arcade.Sprite()
+    sprite.texture = mirrored
+    del texture
+    gc.collect()
+
+    # The sprite of the mirrored texture keeps the one it shares
+    arcade.set_texture_cache_size(0)
+    assert len(arcade.load_texture.texture_cache) == 2
+    assert mirrored.sheet.texture_id.value == 5
+    assert arcade.TextureAtlas(256, 256).get_tex_coords(mirrored) is not None
+
+    # A mirrored load misses once, and finds the texture it shares
+    assert arcade.get_texture_cache_stats()[:3] == (1, 2, 0)
+    arcade.load_texture(name, flipped=True)
+    assert arcade.get_texture_cache_stats()[:2] == (2, 3)
+
+
+def test_texture_disk_cache(mock_window, monkeypatch, tmpdir):
+    import numpy as np
+    import PIL.Image
+    from arcade import draw_commands
+
+    name = "arcade/examples/images/meteorGrey_big1.png"
+    draw_commands.set_texture_disk_cache(str(tmpdir))
+    try:
+        image = draw_commands._decode_texture(name, 1, 1, 50, 40, mirrored=True)
+        sheet_image = draw_commands._decode_textures(name, [[0, 0, 10, 10]])
+        assert len(tmpdir.listdir()) == 2
+
+        # Cached pixels are mapped, without opening the image file
+        def fail(*args):
+            raise AssertionError("Decoded again")
+        monkeypatch.setattr(PIL.Image, 'open', fail)
+        cached = draw_commands._decode_texture(name, 1, 1, 50, 40, mirrored=True)
+        assert cached.size == (50, 40)
+        assert np.array_equal(np.asarray(cached), np.asarray(image.convert('RGBA')))
+        cached = draw_commands._decode_textures(name, [[0, 0, 10, 10]])
+        assert np.array_equal(np.asarray(cached), np.asarray(sheet_image.convert('RGBA')))
+    finally:
+        draw_commands.set_texture_disk_cache(None)
+
+
+def test_get_pixels(mock_window, monkeypatch):
+    import ctypes
+    import numpy as np
+    from pyglet import gl
+    import arcade
+
+    reads = []
+
+    def read_pixels(x, y, width, height, pixel_format, pixel_type, data):
+        # Red is the x coordinate, and green the y coordinate of each pixel
+        reads.append((x, y, width, height))
+        components = 3 if pixel_format == gl.GL_RGB else 4
+        pixels = np.ctypeslib.as_array(ctypes.cast(data, ctypes.POINTER(ctypes.c_ubyte)),
+                                       shape=(height, width, components))
+        pixels[:] = 255
+        pixels[:, :, 0] = np.arange(x, x + width)
+        pixels[:, :, 1] = np.arange(y, y + height)[:, None]
+
+    monkeypatch.setattr(gl, 'glReadPixels', read_pixels)
+    monkeypatch.setattr(gl, 'glPixelStorei', lambda name, value: None)
+
+    colors = arcade.get_pixels([(10, 20), (15, 22), (12, 30)])
+    assert reads == [(10, 20, 6, 11)]
+    assert colors.tolist() == [[10, 20, 255], [15, 22, 255], [12, 30, 255]]
+    colors = arcade.get_pixels(np.array([[3, 4]]), components=4)
+    assert colors.tolist() == [[3, 4, 255, 255]]
+    assert arcade.get_pixels([]).shape == (0, 3)
+
+    pixels = arcade.read_pixels(5, 6, 3, 2)
+    assert pixels.shape == (2, 3, 4)
+    assert pixels[:, 0, 1].tolist() == [7, 6]
+
+
+def test_texture_downscaling(mock_window, monkeypatch, tmpdir, fake_create_texture):
+    import PIL.Image
+    import arcade
+    from arcade import draw_commands
+
+    monkeypatch.setattr(draw_commands, '_create_texture', fake_create_texture)
+    monkeypatch.setattr(arcade.load_texture, 'texture_cache', {})
+    png_name = "arcade/examples/images/meteorGrey_big1.png"
+    jpeg_name = str(tmpdir.join("meteor.jpg"))
+    PIL.Image.open(png_name).convert('RGB').save(jpeg_name)
+
+    # Off by default
+    assert arcade.load_texture(png_name, scale=0.1).image.size == (101, 84)
+
+    arcade.set_texture_downscaling(0.5)
+    try:
+        for name in png_name, jpeg_name:
+            texture = arcade.load_texture(name, scale=0.1)
+            assert texture.image.size == (10, 8)
+            assert (texture.width, texture.height) == (101 * 0.1, 84 * 0.1)
+        texture = arcade.load_texture(png_name, 1, 1, 50, 40, scale=0.2)
+        assert texture.image.size == (10, 8)
+        assert (texture.width, texture.height) == (50 * 0.2, 40 * 0.2)
+        assert arcade.load_texture(png_name, scale=0.6).image.size == (101, 84)
+
+        sprite = arcade.Sprite(png_name, 0.1)
+        assert sprite.texture.image.size == (10, 8)
+        assert (sprite.texture.width, sprite.texture.height) == (101, 84)
+        assert sprite.width == 101 * 0.1
+    finally:
+        arcade.set_texture_downscaling(None)
+
+
+def test_texture_deduplication(mock_window, monkeypatch, tmpdir):
+    import shutil
+    import PIL.Image
+    import arcade
+    from arcade import draw_commands
+    from pyglet import gl
+
+    for function in 'glGenTextures', 'glBindTexture', 'glPixelStorei', 'glTexParameterf', 'glTexParameteri':
+        monkeypatch.setattr(gl, function, lambda *args: None)
+    monkeypatch.setattr(arcade.load_texture, 'texture_cache', {})
+    monkeypatch.setattr(draw_commands, '_textures_by_content', draw_commands.weakref.WeakValueDictionary())
+    name = "arcade/examples/images/meteorGrey_big1.png"
+    copy_name = str(tmpdir.join("copy.png"))
+    shutil.copy(name, copy_name)
+
+    # The same pixels under another path share the image of the first texture
+    texture = arcade.load_texture(name)
+    copy = arcade.load_texture(copy_name, scale=2)
+    assert copy.sheet is texture
+    assert copy.region == (0, 0, 101, 84)
+    assert (copy.width, copy.height) == (202, 168)
+    assert arcade.load_texture(name, 0, 0, 50, 50).sheet is None
+
+    # Mirrored textures share the pixels too, and are turned when drawn
+    mirrored = arcade.load_texture(copy_name, mirrored=True, flipped=True)
+    assert mirrored.sheet is texture
+    assert (mirrored.mirrored, mirrored.flipped) == (True, True)
+    assert arcade.load_texture(copy_name, mirrored=True, flipped=True) is mirrored
+    assert draw_commands._get_texture_bytes(texture) == 101 * 84 * 4
+    assert draw_commands._get_texture_bytes(copy) == 0
+    assert draw_commands._get_texture_bytes(mirrored) == 0
+
+    atlas = arcade.TextureAtlas(256, 256)
+    assert atlas.get_tex_coords(copy) == atlas.get_tex_coords(texture)
+    assert len(atlas._uploads) == 1
+
+    # Sheets loaded again give regions of the texture first loaded
+    frames = arcade.load_textures(name, [[0, 0, 10, 10], [10, 0, 20, 10]])
+    frames_again = arcade.load_textures(name, [[10, 0, 20, 10]])
+    assert frames[0].sheet is frames_again[0].sheet is texture
+    assert frames_again[0].region == (10, 0, 20, 10)
+    assert atlas.get_tex_coords(frames_again[0]) == atlas.get_tex_coords(frames[1])
+    assert list(atlas.regions.keys()) == [texture]
+    assert len(atlas._uploads) == 1
+
+    # The same pixels in another mode are shared too
+    rgb_image = PIL.Image.new('RGB', (8, 8), (10, 20, 30))
+    rgba = draw_commands._create_texture(rgb_image.convert('RGBA'), 'rgba', 8, 8)
+    rgb = draw_commands._create_texture(rgb_image, 'rgb', 8, 8)
+    assert rgb.sheet is rgba
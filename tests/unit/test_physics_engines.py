@@ -0,0 +1,155 @@
+import pytest
+
+import arcade
+
+
+@pytest.fixture
+def thin_wall(make_box):
+    walls = arcade.SpriteList()
+    walls.append(make_box(51, 0, 2, 200))
+    return walls
+
+
+def test_swept_collision_with_list(thin_wall, make_box):
+    player = make_box(5, 0, 10, 10)
+    hit = arcade.get_swept_collision_with_list(player, thin_wall, 100, 0)
+    assert hit.time == pytest.approx(0.4)
+    assert hit.normal == (-1, 0)
+    assert hit.sprite is thin_wall[0]
+    assert arcade.get_swept_collision_with_list(player, thin_wall, 0, 100) is None
+
+
+def test_simple_engine_tunnels_without_continuous(thin_wall, make_box):
+    player = make_box(5, 0, 10, 10)
+    player.change_x = 100
+    arcade.PhysicsEngineSimple(player, thin_wall).update()
+    assert player.center_x == 105
+
+
+def test_simple_engine_continuous(thin_wall, make_box):
+    player = make_box(5, 0, 10, 10)
+    player.change_x = 100
+    arcade.PhysicsEngineSimple(player, thin_wall, continuous=True).update()
+    assert player.right == 50
+
+
+def test_simple_engine_warns_when_stuck(thin_wall, make_box):
+    player = make_box(51, 0, 10, 10)
+    player.change_y = 1
+    with pytest.warns(RuntimeWarning, match="wasn't moving"):
+        arcade.PhysicsEngineSimple(player, thin_wall).update()
+    assert player.center_x == 51
+
+
+def test_platformer_continuous_landing(make_box):
+    platforms = arcade.SpriteList()
+    platforms.append(make_box(0, 0, 200, 2))
+    player = make_box(0, 50, 10, 10)
+    player.change_y = -200
+    engine = arcade.PhysicsEnginePlatformer(player, platforms, continuous=True)
+    engine.update()
+    assert player.bottom == pytest.approx(1, abs=0.3)
+    assert player.change_y == 0
+    assert engine.can_jump()
+
+
+def test_platformer_lands_flush_on_floor(make_box):
+    platforms = arcade.SpriteList()
+    platforms.append(make_box(0, 0, 200, 20))
+    player = make_box(0, 20, 10, 10)
+    engine = arcade.PhysicsEnginePlatformer(player, platforms)
+    for _ in range(10):
+        engine.update()
+    assert player.bottom == 10
+    assert player.change_y == 0
+    assert engine.can_jump()
+    assert player.center_y == 15
+
+
+def test_platformer_runs_up_ramp(make_box):
+    platforms = arcade.SpriteList()
+    platforms.append(make_box(0, 0, 400, 20))
+    ramp = make_box(100, 30, 40, 40)
+    ramp.points = ((-20, -20), (20, -20), (20, 20))
+    platforms.append(ramp)
+    player = make_box(50, 15, 10, 10)
+    player.change_x = 2
+    engine = arcade.PhysicsEnginePlatformer(player, platforms)
+    for _ in range(40):
+        engine.update()
+    assert player.center_x == 130
+    assert player.bottom > 30
+
+
+def test_platformer_pushes_out_resting_player(make_box):
+    platforms = arcade.SpriteList()
+    platforms.append(make_box(0, 0, 200, 10))
+    player = make_box(0, 8, 10, 10)
+    engine = arcade.PhysicsEnginePlatformer(player, platforms, gravity_constant=0)
+    engine.update()
+    assert player.bottom == 5
+    assert player.center_x == 0
+
+
+def test_multi_platformer_matches_single_engines(make_box):
+    def make_level():
+        platforms = arcade.SpriteList()
+        platforms.append(make_box(0, 0, 1000, 20))
+        ramp = make_box(200, 30, 40, 40)
+        ramp.points = ((-20, -20), (20, -20), (20, 20))
+        platforms.append(ramp)
+        bodies = arcade.SpriteList()
+        for i in range(10):
+            body = make_box(50 + i * 30, 40 + i * 50, 10, 10)
+            body.change_x = 2 if i % 2 else -3
+            bodies.append(body)
+        return platforms, bodies
+
+    platforms, bodies = make_level()
+    engine = arcade.PhysicsEngineMultiPlatformer(bodies, platforms)
+    single_platforms, single_bodies = make_level()
+    engines = [arcade.PhysicsEnginePlatformer(body, single_platforms) for body in single_bodies]
+
+    for _ in range(60):
+        engine.update()
+        for single_engine in engines:
+            single_engine.update()
+
+    for body, single_body in zip(bodies, single_bodies):
+        assert body.position == single_body.position
+        assert body.change_y == single_body.change_y
+    assert all(engine.can_jump(body) for body in bodies)
+
+
+def test_platformer_moving_platforms(make_box):
+    platforms = arcade.SpriteList()
+    for i in range(20):
+        platforms.append(make_box(i * 20, -100, 20, 20))
+    lift = make_box(0, 0, 40, 10)
+    lift.change_x = 2
+    lift.boundary_left = -20
+    lift.boundary_right = 30
+    platforms.append(lift)
+    player = make_box(0, 10, 10, 10)
+    engine = arcade.PhysicsEnginePlatformer(player, platforms)
+    assert engine.moving_platforms == [lift]
+
+    for _ in range(5):
+        engine.update()
+    # Stopped at the right boundary and turned around, carrying the player
+    assert lift.right == 30
+    assert lift.change_x == -2
+    assert player.center_x == 10
+    assert engine.can_jump()
+
+    # Platforms set moving later on are moved once registered
+    platforms[0].change_y = 1
+    engine.update()
+    assert platforms[0].center_y == -100
+    engine.add_moving_platform(platforms[0])
+    engine.update()
+    assert platforms[0].center_y == -99
+    engine.remove_moving_platform(platforms[0])
+    engine.update()
+    assert platforms[0].center_y == -99
+
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+import arcade
+
+
+@pytest.fixture
+def walls(make_box):
+    walls = arcade.SpriteList(spatial_hash_cell_size=32)
+    for x in range(-300, 300, 60):
+        for y in range(-300, 300, 60):
+            walls.append(make_box(x, y, 20, 20))
+    return walls
+
+
+def test_raycast(walls):
+    hit = walls.raycast((-30, 0), (300, 0))
+    assert hit.sprite.center_x == 0
+    assert hit.distance == pytest.approx(20)
+    assert hit.point == pytest.approx((-10, 0))
+
+    hit = walls.raycast((30, 0), (-300, 0))
+    assert hit.sprite.center_x == 0
+    assert hit.point == pytest.approx((10, 0))
+
+    assert walls.raycast((-30, -30), (-30, 300)) is None
+    assert walls.raycast((0, 0), (0, 30)).distance == 0
+
+
+def test_raycast_batch_matches_raycast(walls):
+    random.seed(1)
+    starts = [(random.uniform(-320, 320), random.uniform(-320, 320)) for _ in range(200)]
+    ends = [(random.uniform(-320, 320), random.uniform(-320, 320)) for _ in range(200)]
+
+    hits = walls.raycast_batch(starts, ends)
+    for start, end, hit in zip(starts, ends, hits):
+        expected = walls.raycast(start, end)
+        if expected is None:
+            assert hit is None
+        else:
+            assert hit.sprite is expected.sprite
+            assert hit.distance == pytest.approx(expected.distance)
+            assert hit.point == pytest.approx(expected.point)
+
+    brute_force = arcade.SpriteList(use_spatial_hash=False)
+    for sprite in walls:
+        brute_force.append(sprite)
+    assert [hit and hit.sprite for hit in brute_force.raycast_batch(starts, ends)] == \
+        [hit and hit.sprite for hit in hits]
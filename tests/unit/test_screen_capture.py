@@ -0,0 +1,63 @@
+import numpy as np
+import PIL.Image
+
+
+class FakePixelBuffer:
+    """ Fills frames with the number of the read that filled the buffer """
+    reads = 0
+
+    def __init__(self, size):
+        self.size = size
+        self.value = None
+
+    def read_pixels(self, x, y, width, height):
+        assert 4 * width * height == self.size
+        FakePixelBuffer.reads += 1
+        self.value = FakePixelBuffer.reads
+
+    def read_into(self, array):
+        array[...] = self.value
+        array[0, 0] = 0
+
+    def release(self):
+        pass
+
+
+def test_screen_capture(monkeypatch, tmpdir):
+    from arcade import screen_capture
+
+    monkeypatch.setattr(FakePixelBuffer, 'reads', 0)
+    monkeypatch.setattr(screen_capture.shader.Buffer, 'create_with_size',
+                        lambda size, usage: FakePixelBuffer(size))
+    writer = screen_capture.FrameWriter(str(tmpdir), 'png')
+    capture = screen_capture.ScreenCapture(0, 0, 4, 3, buffer_count=3, writer=writer)
+
+    # Frames come back two captures later, top row first
+    assert capture.capture() is None
+    assert capture.capture() is None
+    frame = capture.capture()
+    assert frame.shape == (3, 4, 4)
+    assert frame[1, 0, 0] == 1
+    assert frame[-1, 0, 0] == 0
+    assert [frame[1, 0, 0] for frame in capture.finish()] == [2, 3]
+    assert capture.finish() == []
+
+    writer.close()
+    assert writer.frame_count == 3
+    image = PIL.Image.open(str(tmpdir.join("frame000002.png")))
+    assert image.size == (4, 3)
+    assert np.asarray(image)[1, 0, 0] == 3
+
+
+def test_frame_writer_raw(tmpdir):
+    from arcade import screen_capture
+
+    path = str(tmpdir.join("frames.raw"))
+    writer = screen_capture.FrameWriter(path, 'raw')
+    frame = np.arange(24, dtype=np.uint8).reshape(2, 3, 4)
+    writer.write(frame[::-1])
+    writer.write(frame)
+    writer.close()
+    data = np.fromfile(path, dtype=np.uint8).reshape(2, 2, 3, 4)
+    assert np.array_equal(data[0], frame[::-1])
+    assert np.array_equal(data[1], frame)
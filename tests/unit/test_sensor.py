@@ -0,0 +1,50 @@
+import arcade
+
+
+def test_sensor_enter_exit(make_box):
+    sprites = arcade.SpriteList()
+    inside = make_box(5, 5, 4, 4)
+    outside = make_box(50, 5, 4, 4)
+    sprites.append(inside)
+    sprites.append(outside)
+
+    events = []
+    sensor = arcade.Sensor((0, 20, 0, 20),
+                           on_enter=lambda sprite: events.append(('enter', sprite)),
+                           on_exit=lambda sprite: events.append(('exit', sprite)))
+    sprites.add_sensor(sensor)
+    sprites.update_sensors()
+    assert events == [('enter', inside)]
+    assert sensor.sprites == {inside}
+
+    events.clear()
+    sprites.update_sensors()
+    assert events == []
+
+    outside.center_x = 15
+    inside.center_x = 40
+    sprites.update_sensors()
+    assert sorted(events, key=lambda event: event[0]) == [('enter', outside), ('exit', inside)]
+    assert sensor.sprites == {outside}
+
+    events.clear()
+    sprites.remove(outside)
+    assert events == [('exit', outside)]
+    assert sensor.sprites == set()
+
+
+def test_sensor_follows_sprite_region(make_box):
+    sprites = arcade.SpriteList()
+    target = make_box(100, 0, 10, 10)
+    sprites.append(target)
+    zone = make_box(0, 0, 20, 20)
+
+    entered = []
+    sensor = arcade.Sensor(zone, on_enter=entered.append)
+    sprites.add_sensor(sensor)
+    sprites.update_sensors()
+    assert entered == []
+
+    zone.center_x = 95
+    sprites.update_sensors()
+    assert entered == [target]
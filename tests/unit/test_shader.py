@@ -0,0 +1,105 @@
+from arcade import shader
+
+
+class MockContext:
+    def __init__(self, object_space):
+        self.object_space = object_space
+
+
+class MockObjectSpace:
+    pass
+
+
+class MockProgram:
+    def __init__(self, *shaders, binary=None, retrievable=False):
+        if binary is not None and binary[1] != b'linked':
+            raise shader.ShaderException("Invalid binary")
+        self.shaders = shaders
+        self.binary = binary
+        self.retrievable = retrievable
+        self.prog_id = 1
+
+    def get_binary(self):
+        return (7, b'linked') if self.retrievable else None
+
+
+def test_program_cache(monkeypatch):
+    monkeypatch.setattr(shader, 'Program', MockProgram)
+    monkeypatch.setattr(shader, '_program_cache', shader._program_cache.__class__())
+    object_space = MockObjectSpace()
+    monkeypatch.setattr(shader.gl, 'current_context', MockContext(object_space))
+
+    hits = shader.get_program_stats().cache_hits
+    program = shader.program('vertex', 'fragment')
+    assert shader.program('vertex', 'fragment') is program
+    assert shader.program('vertex', 'other fragment') is not program
+    assert shader.get_program_stats().cache_hits == hits + 1
+
+    # Contexts sharing objects share programs
+    monkeypatch.setattr(shader.gl, 'current_context', MockContext(object_space))
+    assert shader.program('vertex', 'fragment') is program
+
+    monkeypatch.setattr(shader.gl, 'current_context', MockContext(MockObjectSpace()))
+    assert shader.program('vertex', 'fragment') is not program
+
+    # Released programs are made again
+    monkeypatch.setattr(shader.gl, 'current_context', MockContext(object_space))
+    program.prog_id = 0
+    assert shader.program('vertex', 'fragment') is not program
+
+    shader.clear_program_cache()
+    assert len(shader._program_cache) == 0
+
+
+def test_program_binary_cache(monkeypatch, tmpdir):
+    monkeypatch.setattr(shader, 'Program', MockProgram)
+    monkeypatch.setattr(shader, '_get_driver_string', lambda: "driver")
+    shader.set_program_binary_cache(str(tmpdir))
+    try:
+        program = shader._create_program('vertex', 'fragment')
+        assert program.binary is None
+        files = tmpdir.listdir()
+        assert len(files) == 1
+        assert files[0].read_binary() == b'\x07\x00\x00\x00linked'
+
+        loads = shader.get_program_stats().binary_loads
+        program = shader._create_program('vertex', 'fragment')
+        assert program.binary == (7, b'linked')
+        assert shader.get_program_stats().binary_loads == loads + 1
+
+        # A binary the driver rejects is compiled again
+        files[0].write_binary(b'\x07\x00\x00\x00stale')
+        program = shader._create_program('vertex', 'fragment')
+        assert program.binary is None
+        assert files[0].read_binary() == b'\x07\x00\x00\x00linked'
+
+        # Other drivers get their own binaries
+        monkeypatch.setattr(shader, '_get_driver_string', lambda: "other driver")
+        assert shader._create_program('vertex', 'fragment').binary is None
+    finally:
+        shader.set_program_binary_cache(None)
+
+
+class NoBinaryProgram(MockProgram):
+    """ A program on a driver without program binaries """
+    def __init__(self, *shaders, binary=None, retrievable=False):
+        if binary is not None or retrievable:
+            raise shader.GLException("No program binaries")
+        super().__init__(*shaders)
+
+
+def test_program_binary_cache_unsupported(monkeypatch, tmpdir):
+    monkeypatch.setattr(shader, 'Program', NoBinaryProgram)
+    monkeypatch.setattr(shader, '_get_driver_string', lambda: "driver")
+    shader.set_program_binary_cache(str(tmpdir))
+    try:
+        # Programs are compiled, and nothing is cached
+        assert shader._create_program('vertex', 'fragment').shaders
+        assert tmpdir.listdir() == []
+
+        # A binary the driver can't load is compiled again
+        path = shader._get_program_binary_key('vertex', 'fragment') + '.bin'
+        tmpdir.join(path).write_binary(b'\x07\x00\x00\x00linked')
+        assert shader._create_program('vertex', 'fragment').binary is None
+    finally:
+        shader.set_program_binary_cache(None)
@@ -0,0 +1,24 @@
+import numpy as np
+
+import arcade
+
+
+def test_previous_positions_follow_sprites(make_box):
+    sprites = arcade.SpriteList()
+    first = make_box(0, 0, 10, 10)
+    second = make_box(100, 0, 10, 10)
+    sprites.append(first)
+    sprites.append(second)
+    sprites.save_previous_positions()
+
+    first.center_x = 10
+    second.center_x = 110
+    positions = np.array([sprite.position for sprite in sprites], dtype=np.float32)
+    assert sprites._get_previous_positions(positions).tolist() == [[0, 0], [100, 0]]
+
+    # Saved positions stay with their sprite, and new sprites have none
+    sprites.remove(first)
+    third = make_box(200, 0, 10, 10)
+    sprites.append(third)
+    positions = np.array([sprite.position for sprite in sprites], dtype=np.float32)
+    assert sprites._get_previous_positions(positions).tolist() == [[100, 0], [200, 0]]
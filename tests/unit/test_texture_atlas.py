@@ -0,0 +1,142 @@
+import PIL.Image
+
+from arcade import texture_atlas
+
+
+class MockContext:
+    def __init__(self):
+        self.object_space = MockObjectSpace()
+
+
+class MockObjectSpace:
+    pass
+
+
+def make_texture(width, height):
+    from arcade import Texture
+    texture = Texture(0, width, height, None)
+    texture.image = PIL.Image.new('RGBA', (width, height), (255, 0, 0, 255))
+    return texture
+
+
+def test_texture_atlas():
+    atlas = texture_atlas.TextureAtlas(64, 64)
+    small = make_texture(20, 10)
+    assert atlas.get_tex_coords(small) == (0, 1 - 10 / 64, 20 / 64, 10 / 64)
+    assert atlas.get_tex_coords(small) == (0, 1 - 10 / 64, 20 / 64, 10 / 64)
+    assert len(atlas._uploads) == 1
+
+    # A texture that doesn't fit makes the atlas grow, and packs it again
+    large = make_texture(60, 60)
+    atlas.get_tex_coords(large)
+    assert (atlas.width, atlas.height) == (128, 128)
+    assert atlas.generation == 1
+    assert atlas.regions[large] == (0, 0, 60, 60)
+    assert atlas.regions[small] == (61, 0, 20, 10)
+    assert len(atlas._uploads) == 2
+
+    # The space of textures that are gone is given back when packing again
+    del large
+    atlas._repack([])
+    assert list(atlas.regions.values()) == [(0, 0, 20, 10)]
+
+
+def test_texture_atlas_regions():
+    from arcade import Texture
+    atlas = texture_atlas.TextureAtlas(64, 64)
+    sheet = make_texture(40, 20)
+    region = Texture(0, 10, 20, None)
+    region.sheet = sheet
+    region.region = (30, 0, 10, 20)
+    mirrored = Texture(0, 10, 20, None)
+    mirrored.sheet = sheet
+    mirrored.region = (30, 0, 10, 20)
+    mirrored.mirrored = True
+
+    # Regions are drawn from the place of their sheet in the atlas
+    assert atlas.get_tex_coords(region) == (30 / 64, 1 - 20 / 64, 10 / 64, 20 / 64)
+    assert atlas.get_tex_coords(mirrored) == atlas.get_tex_coords(region)
+    assert list(atlas.regions.keys()) == [sheet]
+    assert len(atlas._uploads) == 1
+
+
+def test_draw_batch_textured_quads(monkeypatch):
+    import arcade
+    from pyglet import gl
+
+    monkeypatch.setattr(gl, 'current_context', MockContext())
+    texture_1 = make_texture(10, 10)
+    texture_2 = make_texture(20, 10)
+
+    arcade.set_draw_batching(True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        arcade.draw_texture_rectangle(10, 10, 10, 10, texture_1)
+        arcade.draw_xywh_rectangle_textured(0, 0, 20, 10, texture_2, alpha=0.5)
+        arcade.draw_point(1, 1, arcade.color.GREEN, 2)
+        sprite = arcade.Sprite()
+        sprite.texture = texture_1
+        sprite.center_x = 50
+        sprite.alpha = 128
+        sprite.mirrored = True
+        sprite.draw()
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    assert batch.runs == [[arcade.draw_commands._TEXTURED_QUADS, True, 0, 2],
+                          [gl.GL_POINTS, 2, 0, 1],
+                          [arcade.draw_commands._TEXTURED_QUADS, True, 2, 1]]
+    quads = batch.textured_quads._instances[:len(batch.textured_quads)]
+    assert quads['position'].tolist() == [[10, 10], [10, 5], [50, 0]]
+    assert quads['size'].tolist() == [[5, 5], [10, 5], [5, 5]]
+    assert quads['color'][:, 3].tolist() == [255, 128, 128]
+    assert quads['flip'].tolist() == [[0, 0], [0, 0], [1, 0]]
+    assert quads['sub_tex_coords'][0].tolist() == quads['sub_tex_coords'][2].tolist()
+
+
+def test_draw_batch_repeated_texture(monkeypatch):
+    import arcade
+    from pyglet import gl
+
+    monkeypatch.setattr(gl, 'current_context', MockContext())
+    texture = make_texture(10, 10)
+
+    arcade.set_draw_batching(True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        arcade.draw_texture_rectangle(30, 10, 60, 20, texture, repeat_count_x=3, repeat_count_y=2)
+        arcade.draw_texture_rectangle(0, 0, 20, 10, texture, 90, repeat_count_x=2)
+        arcade.draw_texture_rectangle(0, 0, 10, 10, texture, transparent=False)
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    # Each repeat is a rectangle of its own, turned with the whole
+    assert batch.runs == [[arcade.draw_commands._TEXTURED_QUADS, True, 0, 8],
+                          [arcade.draw_commands._TEXTURED_QUADS, False, 8, 1]]
+    quads = batch.textured_quads._instances[:len(batch.textured_quads)]
+    assert quads['position'].round(4).tolist() == [[10, 5], [30, 5], [50, 5], [10, 15], [30, 15], [50, 15],
+                                                   [0, -5], [0, 5], [0, 0]]
+    assert quads['size'].tolist() == [[10, 5]] * 6 + [[5, 5]] * 3
+
+
+def test_draw_batch_repeated_sprite(monkeypatch):
+    import arcade
+    from pyglet import gl
+
+    monkeypatch.setattr(gl, 'current_context', MockContext())
+    sprite = arcade.Sprite(repeat_count_x=2)
+    sprite.texture = make_texture(10, 10)
+    sprite.width = 20
+    sprite.transparent = False
+
+    arcade.set_draw_batching(True)
+    try:
+        batch = arcade.draw_commands._draw_batch
+        sprite.draw()
+    finally:
+        arcade.draw_commands._draw_batch = None
+
+    assert batch.runs == [[arcade.draw_commands._TEXTURED_QUADS, False, 0, 2]]
+    quads = batch.textured_quads._instances[:len(batch.textured_quads)]
+    assert quads['position'].tolist() == [[-5, 0], [5, 0]]
+    assert quads['size'].tolist() == [[5, 5], [5, 5]]